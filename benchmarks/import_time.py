@@ -0,0 +1,68 @@
+"""
+Import Time Benchmark
+---------------------
+
+Measures the time taken to import sheep_lca.lca in a fresh interpreter with ``python -X importtime`` and checks it against
+IMPORT_TIME_BUDGET_MS. It also checks that SQLAlchemy and pandas are not imported, as they are only needed to read the
+database.
+
+Usage:
+    python benchmarks/import_time.py [module] [repeats]
+
+Exits with status 1 when the budget is exceeded or a deferred module was imported.
+"""
+import re
+import subprocess
+import sys
+
+# The budget for the cumulative import time of sheep_lca.lca, best of the repeats
+IMPORT_TIME_BUDGET_MS = 100
+
+# Modules that must only be imported when the database is read
+DEFERRED_MODULES = ("sqlalchemy", "pandas")
+
+
+def cumulative_import_time_ms(module):
+    """
+    Returns the cumulative import time of a module, in milliseconds, and the modules imported with it.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    imported = {}
+
+    for line in result.stderr.splitlines():
+        match = re.match(r"import time:\s+\d+ \|\s+(\d+) \|\s*(\S+)", line)
+
+        if match:
+            imported[match.group(2)] = int(match.group(1)) / 1000
+
+    return imported[module], imported
+
+
+def main(module="sheep_lca.lca", repeats=5):
+    repeats = int(repeats)
+    timings = []
+    imported = {}
+
+    for _ in range(repeats):
+        elapsed, imported = cumulative_import_time_ms(module)
+        timings.append(elapsed)
+
+    best = min(timings)
+    deferred = [name for name in DEFERRED_MODULES if name in imported]
+
+    print(f"{module}: best {best:.1f} ms of {repeats} (budget {IMPORT_TIME_BUDGET_MS} ms)")
+
+    if deferred:
+        print(f"imported deferred modules: {', '.join(deferred)}")
+
+    return 0 if best <= IMPORT_TIME_BUDGET_MS and not deferred else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main(*sys.argv[1:]))
@@ -0,0 +1,215 @@
+"""
+LCA Benchmark
+-------------
+
+Times the hot paths of the scalar LCA on synthetic herds and compares them with the stored baselines in
+baselines/lca_benchmark.json, so that regressions are visible before an upgrade. The benchmarks cover:
+
+- construction/<class>/cold and /warm: building ClimateChangeTotals, EutrophicationTotals and AirQualityTotals with the
+  LCADataManagerRegistry empty, which reads the reference data, and with it already loaded.
+- load_livestock_data/<rows>: converting synthetic livestock data of 1k, 100k and 1M rows into animal collections.
+- per_farm/<class>.<method>: evaluating each public totals method for one farm, averaged over a synthetic herd. Cohort
+  level methods are summed over the cohorts of the farm, and farm level methods are given that farm's inputs.
+
+Times are the best of several runs, in seconds. Baselines are specific to the machine they were recorded on, so record
+them again with --save when the machine changes, and compare runs on the same machine only.
+
+Usage:
+    python benchmarks/lca_benchmark.py [--sizes 1000 100000 1000000] [--farms 200] [--tolerance 1.5] [--save]
+
+Exits with status 1 when a benchmark is slower than its baseline by more than the tolerance ratio.
+"""
+import argparse
+import inspect
+import json
+import os
+import platform
+import sys
+import timeit
+
+from synthetic_herds import livestock_data, farm_data
+
+from sheep_lca.batch_lca import FarmBatchEvaluator
+from sheep_lca.lca import ClimateChangeTotals, EutrophicationTotals, AirQualityTotals
+from sheep_lca.resource_manager.models import load_livestock_data, load_farm_data
+from sheep_lca.resource_manager.sheep_lca_data_manager import LCADataManagerRegistry
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines", "lca_benchmark.json")
+
+# The slowdown, as a ratio of the baseline time, above which a benchmark is reported as a regression
+DEFAULT_TOLERANCE = 1.5
+
+LOAD_SIZES = (1_000, 100_000, 1_000_000)
+
+TOTALS_CLASSES = (ClimateChangeTotals, EutrophicationTotals, AirQualityTotals)
+
+# Public totals methods evaluated for a single cohort rather than an animal collection
+COHORT_METHODS = ("Enteric_CH4", "PRP_Total", "Total_manure_ch4")
+
+# The farm data attribute of each farm level argument of the totals methods
+FARM_ARGUMENTS = {
+    **FarmBatchEvaluator.default_farm_input_columns,
+    "total_lime_fert": "total_lime_kg",
+}
+
+
+def best_time(func, setup=None, repeats=5, number=1):
+    """
+    Returns the best time of repeats runs of number calls to func, per call, in seconds. The setup runs before each run
+    and is not timed.
+    """
+    return min(timeit.repeat(func, setup=setup or (lambda: None), repeat=repeats, number=number)) / number
+
+
+def construction_benchmarks(ef_country="ireland"):
+    """
+    Times cold and warm construction of each totals class.
+    """
+    results = {}
+
+    for totals_class in TOTALS_CLASSES:
+        name = totals_class.__name__
+        results[f"construction/{name}/cold"] = best_time(
+            lambda: totals_class(ef_country), setup=LCADataManagerRegistry.clear, repeats=3
+        )
+        results[f"construction/{name}/warm"] = best_time(lambda: totals_class(ef_country), number=100)
+
+    return results
+
+
+def load_benchmarks(sizes=LOAD_SIZES):
+    """
+    Times load_livestock_data on synthetic livestock data of each size.
+    """
+    results = {}
+
+    for n_rows in sizes:
+        data_frame = livestock_data(n_rows, seed=n_rows)
+        results[f"load_livestock_data/{n_rows}"] = best_time(
+            lambda: load_livestock_data(data_frame), repeats=3 if n_rows <= 100_000 else 1
+        )
+
+    return results
+
+
+def per_farm_benchmarks(n_farms=200, ef_country="ireland"):
+    """
+    Times each public totals method for one farm, averaged over a synthetic herd of n_farms farms.
+    """
+    animals = load_livestock_data(livestock_data(n_farms * 5, seed=1))
+    farms = load_farm_data(farm_data(n_farms, seed=1))
+
+    collections = [collection["animals"] for collection in animals.values()]
+    cohorts = [list(collection.__dict__.values()) for collection in collections]
+    farm_records = list(farms.values())
+
+    results = {}
+
+    for totals_class in TOTALS_CLASSES:
+        totals = totals_class(ef_country)
+
+        for name, method in inspect.getmembers(totals, inspect.ismethod):
+            if name.startswith("_") or name.startswith("create_"):
+                continue
+
+            parameters = list(inspect.signature(method).parameters)
+
+            if name in COHORT_METHODS:
+                def run():
+                    for farm_cohorts in cohorts:
+                        for animal in farm_cohorts:
+                            method(animal)
+            elif parameters == ["animal"]:
+                def run():
+                    for collection in collections:
+                        method(collection)
+            else:
+                arguments = [
+                    [getattr(farm, FARM_ARGUMENTS[parameter]) for parameter in parameters] for farm in farm_records
+                ]
+
+                def run():
+                    for farm_arguments in arguments:
+                        method(*farm_arguments)
+
+            results[f"per_farm/{totals_class.__name__}.{name}"] = best_time(run, repeats=3) / n_farms
+
+    return results
+
+
+def compare(results, baseline, tolerance=DEFAULT_TOLERANCE):
+    """
+    Prints each result next to its baseline, and returns the names of the benchmarks slower than the tolerance allows.
+    """
+    regressions = []
+
+    print(f"{'benchmark':<72}{'seconds':>12}{'baseline':>12}{'ratio':>8}")
+
+    for name, seconds in results.items():
+        previous = baseline.get(name)
+
+        if previous is None:
+            print(f"{name:<72}{seconds:>12.6f}{'new':>12}")
+            continue
+
+        ratio = seconds / previous
+        flag = ""
+
+        if ratio > tolerance:
+            regressions.append(name)
+            flag = "  slower"
+
+        print(f"{name:<72}{seconds:>12.6f}{previous:>12.6f}{ratio:>8.2f}{flag}")
+
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(LOAD_SIZES), help="livestock rows to load")
+    parser.add_argument("--farms", type=int, default=200, help="farms evaluated by the per farm benchmarks")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="slowdown ratio reported")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="the baseline file")
+    parser.add_argument("--save", action="store_true", help="store the results as the new baseline")
+    args = parser.parse_args(argv)
+
+    results = {}
+    results.update(construction_benchmarks())
+    results.update(load_benchmarks(args.sizes))
+    results.update(per_farm_benchmarks(args.farms))
+
+    baseline = {}
+
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as file:
+            baseline = json.load(file)["results"]
+
+    regressions = compare(results, baseline, args.tolerance)
+
+    if args.save:
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+
+        with open(args.baseline, "w") as file:
+            json.dump(
+                {
+                    "python": platform.python_version(),
+                    "machine": platform.machine(),
+                    "results": results,
+                },
+                file,
+                indent=2,
+            )
+            file.write("\n")
+
+        print(f"baseline saved to {args.baseline}")
+        return 0
+
+    if regressions:
+        print(f"{len(regressions)} benchmark(s) slower than {args.tolerance}x their baseline")
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
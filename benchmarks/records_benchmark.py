@@ -0,0 +1,114 @@
+"""
+Records Benchmark
+-----------------
+
+Compares the memory use and construction time of the slotted AnimalCategory and Farm records with the previous
+__dict__-backed records, which set every default and every column with setattr on a plain instance.
+
+Usage:
+    python benchmarks/records_benchmark.py [n_records]
+"""
+import sys
+import timeit
+import tracemalloc
+
+from sheep_lca.resource_manager.models import AnimalCategory, Farm, ANIMAL_CATEGORY_DEFAULTS
+
+
+class DictRecord(object):
+    """
+    The previous record layout: defaults then data applied with setattr to an instance __dict__.
+    """
+    def __init__(self, data, defaults={}):
+        for variable, value in defaults.items():
+            setattr(self, variable, value)
+
+        for variable, value in data.items():
+            setattr(self, variable, value)
+
+
+ANIMAL_ROW = {
+    "ef_country": "ireland",
+    "farm_id": 2018,
+    "year": 2018,
+    "cohort": "ewes",
+    "pop": 37812.8,
+    "weight": 68.0,
+    "daily_milk": 0,
+    "forage": "average",
+    "grazing": "flat_pasture",
+    "con_type": "concentrate",
+    "con_amount": 0.0,
+    "t_outdoors": 21.36,
+    "t_indoors": 2.64,
+    "wool": 4.5,
+    "t_stabled": 0,
+    "mm_storage": "solid",
+    "daily_spreading": "broadcast",
+    "n_sold": 0,
+    "n_bought": 0,
+}
+
+FARM_ROW = {
+    "ef_country": "ireland",
+    "farm_id": 2018,
+    "year": 2018,
+    "total_urea_kg": 2072487.127,
+    "total_lime_kg": 2072487.127,
+    "an_n_fert": 2072487.127,
+    "urea_n_fert": 2072487,
+    "total_urea_abated": 17310655.18,
+    "total_p_fert": 1615261.859,
+    "total_k_fert": 3922778.8,
+    "diesel_kg": 0,
+    "elec_kwh": 0,
+}
+
+
+def bytes_per_record(factory, n_records):
+    """
+    Returns the memory allocated per record when building n_records records.
+    """
+    tracemalloc.start()
+    records = [factory() for _ in range(n_records)]
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del records
+
+    return allocated / n_records
+
+
+def microseconds_per_record(factory, n_records):
+    """
+    Returns the best construction time per record over five runs of n_records constructions.
+    """
+    return min(timeit.repeat(factory, number=n_records, repeat=5)) / n_records * 1e6
+
+
+def main(n_records=100000):
+    cases = [
+        (
+            "AnimalCategory",
+            lambda: DictRecord(ANIMAL_ROW, ANIMAL_CATEGORY_DEFAULTS),
+            lambda: AnimalCategory(ANIMAL_ROW),
+        ),
+        (
+            "Farm",
+            lambda: DictRecord(FARM_ROW),
+            lambda: Farm(FARM_ROW),
+        ),
+    ]
+
+    print(f"{'record':<16}{'layout':<10}{'bytes/record':>14}{'us/record':>12}")
+
+    for name, previous, slotted in cases:
+        for layout, factory in (("dict", previous), ("slots", slotted)):
+            print(
+                f"{name:<16}{layout:<10}"
+                f"{bytes_per_record(factory, n_records):>14.0f}"
+                f"{microseconds_per_record(factory, n_records):>12.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
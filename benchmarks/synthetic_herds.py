@@ -0,0 +1,99 @@
+"""
+Synthetic Herds
+---------------
+
+Generates livestock and farm data in the format of the tests/example.py schema, for benchmarks that need herds of a given
+size. Each farm has one row per cohort, so a herd of n_rows rows covers n_rows / 5 farms. Values are drawn around those of
+the example farm from a seeded generator, so the same arguments always give the same data.
+"""
+import numpy as np
+import pandas as pd
+
+COHORTS = ("ewes", "ram", "lamb_more_1_yr", "lamb_less_1_yr", "male_less_1_yr")
+
+# The example weight of each cohort, in kg
+COHORT_WEIGHTS = np.array([68.0, 86.0, 68.0, 33.0, 33.0])
+
+FORAGES = ("average", "irish_grass")
+GRAZING = ("flat_pasture", "hilly_pasture")
+CONCENTRATES = ("concentrate", "Soybean", "Hay")
+STORAGE = ("solid", "tank liquid", "biodigester")
+
+
+def livestock_data(n_rows, seed=0, ef_country="ireland"):
+    """
+    Generates livestock data with the columns of the tests/example.py schema.
+
+    Args:
+        n_rows (int): The number of cohort rows. Rounded up to whole farms of one row per cohort.
+        seed (int, optional): The seed of the random number generator. Defaults to 0.
+        ef_country (str, optional): The emissions factor country of every row. Defaults to "ireland".
+
+    Returns:
+        pandas.DataFrame: The livestock data, in the format accepted by load_livestock_data.
+    """
+    rng = np.random.default_rng(seed)
+    n_farms = -(-n_rows // len(COHORTS))
+    n_rows = n_farms * len(COHORTS)
+
+    cohort_codes = np.tile(np.arange(len(COHORTS)), n_farms)
+    t_outdoors = rng.uniform(10, 24, n_rows)
+
+    return pd.DataFrame(
+        {
+            "ef_country": ef_country,
+            "farm_id": np.repeat(np.arange(n_farms), len(COHORTS)),
+            "year": 2018,
+            "cohort": np.asarray(COHORTS, dtype=object)[cohort_codes],
+            "pop": rng.uniform(100, 40000, n_rows),
+            "weight": COHORT_WEIGHTS[cohort_codes] * rng.uniform(0.9, 1.1, n_rows),
+            "daily_milk": 0,
+            "forage": rng.choice(FORAGES, n_rows),
+            "grazing": rng.choice(GRAZING, n_rows),
+            "con_type": rng.choice(CONCENTRATES, n_rows),
+            "con_amount": rng.uniform(0, 0.5, n_rows),
+            "t_outdoors": t_outdoors,
+            "t_indoors": 24 - t_outdoors,
+            "wool": rng.uniform(0, 6, n_rows),
+            "t_stabled": 0,
+            "mm_storage": rng.choice(STORAGE, n_rows),
+            "daily_spreading": "broadcast",
+            "n_sold": 0,
+            "n_bought": 0,
+        }
+    )
+
+
+def farm_data(n_farms, seed=0, ef_country="ireland"):
+    """
+    Generates farm data with the columns of the tests/example.py schema, for farm ids 0 to n_farms - 1.
+
+    Args:
+        n_farms (int): The number of farms.
+        seed (int, optional): The seed of the random number generator. Defaults to 0.
+        ef_country (str, optional): The emissions factor country of every farm. Defaults to "ireland".
+
+    Returns:
+        pandas.DataFrame: The farm data, in the format accepted by load_farm_data.
+    """
+    rng = np.random.default_rng(seed)
+
+    def inputs(scale):
+        return rng.uniform(0.5, 1.5, n_farms) * scale
+
+    return pd.DataFrame(
+        {
+            "ef_country": ef_country,
+            "farm_id": np.arange(n_farms),
+            "year": 2018,
+            "total_urea_kg": inputs(2072487.127),
+            "total_lime_kg": inputs(2072487.127),
+            "an_n_fert": inputs(2072487.127),
+            "urea_n_fert": inputs(2072487),
+            "total_urea_abated": inputs(17310655.18),
+            "total_p_fert": inputs(1615261.859),
+            "total_k_fert": inputs(3922778.8),
+            "diesel_kg": inputs(1000),
+            "elec_kwh": inputs(1000),
+        }
+    )
@@ -0,0 +1,268 @@
+"""
+Batch LCA Module
+----------------
+
+This module contains the FarmBatchEvaluator class, a single entry point for evaluating every climate change,
+eutrophication and air quality category for a batch of farms. It replaces the hand-written loop of the README example,
+where a results dictionary is created, each totals method is called per farm and the derived soil totals are summed by the
+caller.
+
+Each farm is evaluated in a single pass: the ClimateChangeTotals, EutrophicationTotals and AirQualityTotals classes share
+one EvaluationContext, so the energy balance and excretion terms of each cohort are computed once and reused by every
+category. The result is a tidy DataFrame with one row per farm.
+
+The evaluate_categories function lists the categories of each impact family, the farm level inputs they are given and the
+soil and upstream categories derived from them, for both FarmBatchEvaluator and the vectorised FusedFarmEvaluator.
+"""
+import pandas as pd
+
+from sheep_lca.evaluation_context import EvaluationContext
+from sheep_lca.lca import (
+    ClimateChangeTotals,
+    EutrophicationTotals,
+    AirQualityTotals,
+    CLIMATE_CHANGE_EXPANDED_CATEGORIES,
+    EUTROPHICATION_EXPANDED_CATEGORIES,
+    AIR_QUALITY_CATEGORIES,
+)
+from sheep_lca.resource_manager.models import load_livestock_data, load_farm_data
+
+
+class FarmBatchEvaluator:
+    """
+    Evaluates the climate change, eutrophication and air quality totals for a batch of farms.
+
+    The farm level inputs (fertiliser, lime, fuel and electricity) are read from the farm data using the names in
+    farm_input_columns, which follow the farm data format of the README example. Inputs missing from a farm, or farms with no
+    farm data at all, contribute zero.
+
+    Result columns are named after the keys of the expanded emissions dictionaries, prefixed with the impact category
+    ("climate_change_", "eutrophication_" and "air_quality_"). Values are in the units returned by the totals classes.
+
+    Attributes:
+        ef_country (str): The emissions factor country.
+        farm_input_columns (dict): Maps each farm level input to the farm data attribute it is read from.
+        context (EvaluationContext): The per-animal cache shared by the totals classes, cleared after each farm.
+        climatechange (ClimateChangeTotals): The climate change totals, sharing the evaluation context.
+        eutrophication (EutrophicationTotals): The eutrophication totals, sharing the evaluation context.
+        air_quality (AirQualityTotals): The air quality totals, sharing the evaluation context.
+
+    Args:
+        ef_country (str): The emissions factor country.
+        farm_input_columns (dict, optional): Overrides for entries of the default farm input mapping.
+
+    Methods:
+        evaluate(animals, farms=None): Returns a DataFrame of every impact category, indexed by farm_id.
+        evaluate_farm(animal_collection, farm=None): Returns a dictionary of every impact category for a single farm.
+    """
+    default_farm_input_columns = {
+        "total_urea": "urea_n_fert",
+        "total_urea_abated": "total_urea_abated",
+        "total_n_fert": "an_n_fert",
+        "total_p_fert": "total_p_fert",
+        "total_k_fert": "total_k_fert",
+        "total_lime": "total_lime_kg",
+        "total_urea_kg": "total_urea_kg",
+        "diesel_kg": "diesel_kg",
+        "elec_kwh": "elec_kwh",
+    }
+
+    def __init__(self, ef_country, farm_input_columns=None):
+        self.ef_country = ef_country
+        self.farm_input_columns = dict(self.default_farm_input_columns)
+
+        if farm_input_columns is not None:
+            self.farm_input_columns.update(farm_input_columns)
+
+        self.context = EvaluationContext()
+        self.climatechange = ClimateChangeTotals(ef_country, self.context)
+        self.eutrophication = EutrophicationTotals(ef_country, self.context)
+        self.air_quality = AirQualityTotals(ef_country, self.context)
+
+    def evaluate(self, animals, farms=None):
+        """
+        Evaluates every impact category for each farm.
+
+        Parameters:
+            animals (dict or pandas.DataFrame): The output of load_livestock_data, or livestock data in the format it accepts.
+            farms (dict or pandas.DataFrame, optional): The output of load_farm_data, or farm data in the format it accepts.
+
+        Returns:
+            pandas.DataFrame: One row per farm, indexed by farm_id, in order of first appearance in the livestock data
+            followed by any farms that only appear in the farm data.
+        """
+        farm_ids, pairs = pair_farm_data(animals, farms)
+
+        rows = [self.evaluate_farm(animal_collection, farm) for animal_collection, farm in pairs]
+
+        return pd.DataFrame(rows, index=pd.Index(farm_ids, name="farm_id"))
+
+    def evaluate_farm(self, animal_collection, farm=None):
+        """
+        Evaluates every impact category for a single farm in one pass.
+
+        Parameters:
+            animal_collection (AnimalCollection): The cohorts of the farm, or None for a farm with no livestock.
+            farm (Farm, optional): The farm level inputs.
+
+        Returns:
+            dict: The value of each result column for the farm.
+        """
+        row = evaluate_categories(
+            (self.climatechange, self.eutrophication, self.air_quality), self._farm_inputs(farm), animal_collection
+        )
+
+        if animal_collection is not None:
+            # The animals are not evaluated again, so their cached terms can be released
+            self.context.clear()
+
+        return row
+
+    def _farm_inputs(self, farm):
+        """
+        Reads the farm level inputs of a farm, using zero for any that are missing.
+
+        Parameters:
+            farm (Farm): The farm data, or None.
+
+        Returns:
+            dict: The value of each farm level input.
+        """
+        inputs = {}
+
+        for name, column in self.farm_input_columns.items():
+            value = getattr(farm, column, None) if farm is not None else None
+            inputs[name] = 0 if value is None or pd.isna(value) else value
+
+        return inputs
+
+
+def pair_farm_data(animals, farms=None):
+    """
+    Matches the animal collection and the farm data of each farm.
+
+    Parameters:
+        animals (dict or pandas.DataFrame): The output of load_livestock_data, or livestock data in the format it accepts.
+        farms (dict or pandas.DataFrame, optional): The output of load_farm_data, or farm data in the format it accepts.
+
+    Returns:
+        tuple: The farm ids, in order of first appearance in the livestock data followed by any farms that only appear in
+        the farm data, and an (animal_collection, farm) pair for each, either of which may be None.
+    """
+    if isinstance(animals, pd.DataFrame):
+        animals = load_livestock_data(animals)
+
+    if isinstance(farms, pd.DataFrame):
+        farms = load_farm_data(farms)
+
+    farms_by_id = {}
+
+    if farms is not None:
+        for farm in farms.values():
+            farms_by_id[farm.farm_id] = farm
+
+    farm_ids = list(animals.keys())
+    farm_ids += [farm_id for farm_id in farms_by_id.keys() if farm_id not in animals]
+
+    pairs = []
+
+    for farm_id in farm_ids:
+        collection = animals.get(farm_id)
+        pairs.append(
+            (
+                collection["animals"] if collection is not None else None,
+                farms_by_id.get(farm_id),
+            )
+        )
+
+    return farm_ids, pairs
+
+
+def evaluate_categories(totals, inputs, animals, farm_args=(), zero=0):
+    """
+    Evaluates every impact category of one or more farms from the totals classes of the three impact families. Used by
+    FarmBatchEvaluator for a single farm, with scalars, and by FusedFarmEvaluator for every farm of a HerdTable, with arrays.
+
+    Parameters:
+        totals (tuple): The climate change, eutrophication and air quality totals, either the scalar classes of the lca
+            module or their vectorised counterparts.
+        inputs (dict): The value of each farm level input, keyed as in FarmBatchEvaluator.default_farm_input_columns.
+        animals (AnimalCollection or HerdTable): The livestock passed to the livestock methods, or None for a farm with no
+            livestock.
+        farm_args (tuple, optional): The arguments passed before the inputs to the farm level methods, (herd,) for the
+            vectorised totals. Defaults to none.
+        zero (optional): The value of categories that are not evaluated, such as an array of zeros for each farm.
+            Defaults to 0.
+
+    Returns:
+        dict: The value of each result column.
+    """
+    climatechange, eutrophication_totals, air_quality_totals = totals
+
+    fertiliser = (
+        inputs["total_urea"],
+        inputs["total_urea_abated"],
+        inputs["total_n_fert"],
+    )
+    upstream_inputs = (
+        inputs["diesel_kg"],
+        inputs["elec_kwh"],
+        inputs["total_n_fert"],
+        inputs["total_urea"],
+        inputs["total_urea_abated"],
+        inputs["total_p_fert"],
+        inputs["total_k_fert"],
+        inputs["total_lime"],
+    )
+
+    climate = dict.fromkeys(CLIMATE_CHANGE_EXPANDED_CATEGORIES, zero)
+    eutrophication = dict.fromkeys(EUTROPHICATION_EXPANDED_CATEGORIES, zero)
+    air_quality = dict.fromkeys(AIR_QUALITY_CATEGORIES, zero)
+
+    if animals is not None:
+        climate["enteric_ch4"] = climatechange.CH4_enteric_ch4(animals)
+        climate["manure_management_N2O"] = climatechange.Total_storage_N2O(animals)
+        climate["manure_management_CH4"] = climatechange.CH4_manure_management(animals)
+        climate["N_direct_PRP"] = climatechange.N2O_total_PRP_N2O_direct(animals)
+        climate["N_indirect_PRP"] = climatechange.N2O_total_PRP_N2O_indirect(animals)
+        climate["upstream_feed"] = climatechange.co2_from_concentrate_production(animals)
+
+        eutrophication["manure_management"] = eutrophication_totals.total_manure_NH3_EP(animals)
+        eutrophication["soils"] = eutrophication_totals.total_grazing_soils_EP(animals)
+        eutrophication["upstream_feed"] = eutrophication_totals.po4_from_concentrate_production(animals)
+
+        air_quality["manure_management"] = air_quality_totals.total_manure_NH3_AQ(animals)
+        air_quality["soils"] = air_quality_totals.total_grazing_soils_NH3_AQ(animals)
+
+    climate["N_direct_fertiliser"] = climatechange.N2O_direct_fertiliser(*farm_args, *fertiliser)
+    climate["N_indirect_fertiliser"] = climatechange.N2O_fertiliser_indirect(*farm_args, *fertiliser)
+    climate["soils_CO2"] = climatechange.CO2_soils_GWP(*farm_args, inputs["total_urea_kg"], inputs["total_lime"])
+    climate["upstream_fuel_fert"] = climatechange.upstream_and_inputs_and_fuel_co2(*farm_args, *upstream_inputs)
+
+    climate["soil_organic_N_direct"] = climate["manure_applied_N"] + climate["N_direct_PRP"]
+    climate["soil_organic_N_indirect"] = climate["N_indirect_PRP"]
+    climate["soil_inorganic_N_direct"] = climate["N_direct_fertiliser"]
+    climate["soil_inorganic_N_indirect"] = climate["N_indirect_fertiliser"]
+    climate["soil_N_direct"] = climate["soil_organic_N_direct"] + climate["soil_inorganic_N_direct"]
+    climate["soil_N_indirect"] = climate["soil_inorganic_N_indirect"] + climate["soil_organic_N_indirect"]
+    climate["soils_N2O"] = climate["soil_N_direct"] + climate["soil_N_indirect"]
+    climate["upstream"] = climate["upstream_fuel_fert"] + climate["upstream_feed"]
+
+    eutrophication["soils"] = eutrophication["soils"] + eutrophication_totals.total_fertilser_soils_EP(
+        *farm_args, *fertiliser, inputs["total_p_fert"]
+    )
+    eutrophication["upstream_fuel_fert"] = eutrophication_totals.upstream_and_inputs_and_fuel_po4(
+        *farm_args, *upstream_inputs
+    )
+    eutrophication["upstream"] = eutrophication["upstream_fuel_fert"] + eutrophication["upstream_feed"]
+
+    air_quality["soils"] = air_quality["soils"] + air_quality_totals.total_fertiliser_soils_NH3_AQ(
+        *farm_args, *fertiliser
+    )
+
+    row = {}
+    row.update(("climate_change_" + key, value) for key, value in climate.items())
+    row.update(("eutrophication_" + key, value) for key, value in eutrophication.items())
+    row.update(("air_quality_" + key, value) for key, value in air_quality.items())
+
+    return row
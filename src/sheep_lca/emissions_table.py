@@ -0,0 +1,140 @@
+"""
+Emissions Table Module
+----------------------
+
+This module contains the EmissionsTable class, an array-backed alternative to the emissions dictionaries of the totals
+classes. It is indexed in the same way, by category and then by key (a farm, scenario or cohort), but holds the values of
+every category in one two-dimensional NumPy array, so a table of any number of keys is created in one allocation and each
+category can be assigned as a whole vector.
+
+The nested dictionaries are only built when to_dict is called.
+
+Example:
+    emissions = climatechange.create_expanded_emissions_table(farm_ids)
+    emissions["enteric_ch4"] = enteric_by_farm
+    emissions["N_direct_PRP"][farm_id] += direct_prp
+    emissions.to_dict()
+"""
+import numpy as np
+
+
+class EmissionsTable:
+    """
+    A table of emissions values by category and key, initialised to zero.
+
+    table[category] returns a view of the values of a category, which reads and writes single values by key, as the inner
+    dictionaries of an emissions dictionary do. Assigning to table[category] sets every value of the category at once,
+    from an array aligned with keys or a scalar.
+
+    Attributes:
+        categories (tuple): The categories, in order.
+        keys (list): The keys, in order.
+        values (numpy.ndarray): The values, with a row for each category and a column for each key.
+
+    Args:
+        categories (iterable): The categories. Repeated categories are kept once.
+        keys (iterable): The keys, which must be distinct.
+
+    Methods:
+        to_dict(): Returns the values as an emissions dictionary.
+        to_frame(): Returns the values as a DataFrame with a column for each category, indexed by key.
+    """
+
+    def __init__(self, categories, keys):
+        self.categories = tuple(dict.fromkeys(categories))
+        self.keys = list(keys)
+        self.values = np.zeros((len(self.categories), len(self.keys)))
+
+        self._category_positions = {category: position for position, category in enumerate(self.categories)}
+        self._key_positions = None
+
+    def __getitem__(self, category):
+        return EmissionsCategory(self, self._category_position(category))
+
+    def __setitem__(self, category, values):
+        self.values[self._category_position(category)] = values
+
+    def __contains__(self, category):
+        return category in self._category_positions
+
+    def __iter__(self):
+        return iter(self.categories)
+
+    def __len__(self):
+        return len(self.categories)
+
+    def to_dict(self):
+        """
+        Returns the values in the layout of create_emissions_dictionary.
+
+        Returns:
+            dict: A dictionary of each category, mapping each key to its value.
+        """
+        return {category: dict(zip(self.keys, row.tolist())) for category, row in zip(self.categories, self.values)}
+
+    def to_frame(self):
+        """
+        Returns the values as a DataFrame.
+
+        Returns:
+            pandas.DataFrame: A column for each category, indexed by key.
+        """
+        import pandas as pd
+
+        return pd.DataFrame(self.values.T, index=pd.Index(self.keys), columns=list(self.categories))
+
+    def key_position(self, key):
+        """
+        Returns the column of a key. The positions of the keys are indexed on first use, so tables that are only assigned
+        whole categories never build the index.
+
+        Raises:
+            KeyError: If the table has no such key.
+            ValueError: If the keys of the table are not distinct.
+        """
+        if self._key_positions is None:
+            positions = {key: position for position, key in enumerate(self.keys)}
+
+            if len(positions) != len(self.keys):
+                raise ValueError("the keys of an EmissionsTable must be distinct")
+
+            self._key_positions = positions
+
+        return self._key_positions[key]
+
+    def _category_position(self, category):
+        try:
+            return self._category_positions[category]
+        except KeyError:
+            raise KeyError(f"{category!r} is not a category of this table") from None
+
+
+class EmissionsCategory:
+    """
+    The values of one category of an EmissionsTable, read and written by key. Writes go to the table.
+
+    Attributes:
+        values (numpy.ndarray): The values of the category, aligned with the keys of the table; a view of the table row.
+    """
+
+    def __init__(self, table, position):
+        self._table = table
+        self.values = table.values[position]
+
+    def __getitem__(self, key):
+        return self.values[self._table.key_position(key)]
+
+    def __setitem__(self, key, value):
+        self.values[self._table.key_position(key)] = value
+
+    def __iter__(self):
+        return iter(self._table.keys)
+
+    def __len__(self):
+        return len(self._table.keys)
+
+    def keys(self):
+        return list(self._table.keys)
+
+    def items(self):
+        return zip(self._table.keys, self.values.tolist())
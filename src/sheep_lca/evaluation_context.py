@@ -0,0 +1,132 @@
+"""
+Evaluation Context Module
+-------------------------
+
+This module contains the EvaluationContext class, an opt-in cache for the per-animal terms of the LCA formulas. The stage
+classes in the lca module recompute the same energy balance and excretion terms for a cohort many times while a farm is
+evaluated; when they are constructed with an EvaluationContext, each term is computed once per animal and reused by every
+stage method that needs it.
+
+Cached values are only valid while the animal's attributes are unchanged. After modifying an AnimalCategory, call
+EvaluationContext.invalidate(animal) (or clear() to drop everything) before evaluating it again.
+"""
+import functools
+
+
+class EvaluationContext:
+    """
+    An opt-in cache of per-animal formula terms shared between the stage classes of the lca module.
+
+    Terms are keyed by the animal object, the name of the formula and the data manager used to evaluate it, so a single
+    context can safely be shared by stage classes for different emissions factor countries, and terms computed with a data
+    manager are never returned for one that replaced it. The context holds a reference to every animal it has cached
+    terms for, and to the data managers of those terms, until the animal is invalidated or the context is cleared.
+
+    Attributes:
+        hits (int): The number of term lookups answered from the cache.
+        misses (int): The number of term lookups that had to be computed.
+
+    Methods:
+        get_or_compute(animal, term, compute): Returns the cached value of a term for an animal, computing it on a miss.
+        invalidate(animal): Drops every cached term for an animal, to be called after one of its attributes changes.
+        clear(): Drops every cached term and resets the counters.
+        stats(): Returns the hit and miss counters and the number of cached animals.
+    """
+    def __init__(self):
+        self._animals = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_compute(self, animal, term, compute):
+        """
+        Returns the cached value of a term for an animal, computing and storing it on a miss.
+
+        Parameters:
+            animal (AnimalCategory): The animal cohort the term is evaluated for.
+            term (hashable): The key identifying the term.
+            compute (callable): Computes the term when it is not cached.
+
+        Returns:
+            float: The value of the term for the animal.
+        """
+        entry = self._animals.get(id(animal))
+
+        if entry is None or entry[0] is not animal:
+            entry = (animal, {})
+            self._animals[id(animal)] = entry
+
+        terms = entry[1]
+
+        if term in terms:
+            self.hits += 1
+            return terms[term]
+
+        self.misses += 1
+        value = compute()
+        terms[term] = value
+
+        return value
+
+    def invalidate(self, animal):
+        """
+        Drops every cached term for an animal. This must be called after changing any attribute of an animal that has
+        already been evaluated with this context.
+
+        Parameters:
+            animal (AnimalCategory): The animal cohort whose cached terms should be discarded.
+        """
+        entry = self._animals.get(id(animal))
+
+        if entry is not None and entry[0] is animal:
+            del self._animals[id(animal)]
+
+    def clear(self):
+        """
+        Drops every cached term and resets the hit and miss counters.
+        """
+        self._animals.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self):
+        """
+        Returns the cache counters.
+
+        Returns:
+            dict: The number of hits, misses and cached animals.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "animals": len(self._animals),
+        }
+
+
+def memoised_term(method):
+    """
+    Decorates a stage method taking a single animal so that, when the stage was constructed with an EvaluationContext, the
+    result is cached per animal in that context. Without a context the method is called directly.
+
+    Args:
+        method (callable): A stage method with the signature method(self, animal).
+
+    Returns:
+        callable: The wrapped method.
+    """
+    name = method.__qualname__
+
+    @functools.wraps(method)
+    def wrapper(self, animal):
+        context = self.context
+
+        if context is None:
+            return method(self, animal)
+
+        # keyed by the data manager itself rather than its id, which a new manager could reuse once the old one is freed
+        return context.get_or_compute(
+            animal,
+            (name, self.data_manager_class),
+            lambda: method(self, animal),
+        )
+
+    return wrapper
@@ -0,0 +1,283 @@
+"""
+Fused LCA Module
+----------------
+
+This module contains the FusedFarmEvaluator class, which evaluates the climate change, eutrophication and air quality
+categories for a batch of farms in a single pass.
+
+ClimateChangeTotals, EutrophicationTotals and AirQualityTotals each build their own stage classes and each rederive the
+gross energy, volatile solids, nitrogen excretion and ammonia terms of every cohort. The fused evaluator builds one
+HerdTable for the whole batch and hands it to the vectorised totals of all three impact families, so each shared term is
+computed once, as an array, and reused by every category that needs it.
+
+The results have the same columns and farm order as FarmBatchEvaluator.evaluate and match its values to floating-point
+tolerance.
+"""
+import numpy as np
+import pandas as pd
+
+from sheep_lca.batch_lca import FarmBatchEvaluator, evaluate_categories
+from sheep_lca.lca import (
+    CLIMATE_CHANGE_EXPANDED_CATEGORIES,
+    EUTROPHICATION_EXPANDED_CATEGORIES,
+    AIR_QUALITY_CATEGORIES,
+)
+from sheep_lca.resource_manager.arrow_reader import read_livestock_data, read_farm_data
+from sheep_lca.resource_manager.models import ANIMAL_CATEGORY_FIELDS
+from sheep_lca.streaming import complete_farm_chunks
+from sheep_lca.vectorised_lca import (
+    VectorisedTotals,
+    VectorisedClimateChangeTotals,
+    VectorisedEutrophicationTotals,
+    VectorisedAirQualityTotals,
+)
+
+
+class FusedFarmEvaluator(VectorisedTotals):
+    """
+    Evaluates the climate change, eutrophication and air quality totals for a batch of farms from a single HerdTable.
+
+    Farm level inputs are read from the farm data using the names in farm_input_columns, as in FarmBatchEvaluator. Inputs
+    missing from a farm, or farms with no farm data at all, contribute zero. See VectorisedTotals for the ef_country and
+    store arguments.
+
+    Attributes:
+        farm_input_columns (dict): Maps each farm level input to the farm data column it is read from.
+        climatechange (VectorisedClimateChangeTotals): The climate change totals.
+        eutrophication (VectorisedEutrophicationTotals): The eutrophication totals.
+        air_quality (VectorisedAirQualityTotals): The air quality totals.
+
+    Args:
+        ef_country (str, optional): The emissions factor country.
+        store (MultiCountryStore, optional): A store of several countries, used instead of ef_country.
+        farm_input_columns (dict, optional): Overrides for entries of the default farm input mapping.
+
+    Methods:
+        evaluate(animals, farms=None): Returns a DataFrame of every impact category, indexed by farm_id.
+        evaluate_files(livestock_source, farm_source=None, file_format=None): Evaluates livestock and farm data read from
+            Parquet or Arrow IPC files.
+        evaluate_stream(chunks, farms=None, as_frames=False, check_grouped=True): Yields the results of each farm of a
+            stream of livestock chunks as soon as all of its rows have been seen.
+        evaluate_herd(herd, inputs): Returns every result column for each farm of a HerdTable, as arrays.
+    """
+    default_farm_input_columns = FarmBatchEvaluator.default_farm_input_columns
+
+    def __init__(self, ef_country=None, store=None, farm_input_columns=None):
+        super().__init__(ef_country, store)
+
+        self.farm_input_columns = dict(self.default_farm_input_columns)
+
+        if farm_input_columns is not None:
+            self.farm_input_columns.update(farm_input_columns)
+
+        self.climatechange = VectorisedClimateChangeTotals(ef_country, store)
+        self.eutrophication = VectorisedEutrophicationTotals(ef_country, store)
+        self.air_quality = VectorisedAirQualityTotals(ef_country, store)
+
+    def evaluate(self, animals, farms=None):
+        """
+        Evaluates every impact category for each farm in one pass.
+
+        Parameters:
+            animals (HerdTable, pandas.DataFrame or dict): Livestock data in the format accepted by load_livestock_data,
+                a mapping of its columns, or a HerdTable built from it. A given HerdTable is not changed, but keeps the
+                terms computed for it.
+            farms (pandas.DataFrame, optional): Farm data in the format accepted by load_farm_data.
+
+        Returns:
+            pandas.DataFrame: One row per farm, indexed by farm_id, in order of first appearance in the livestock data
+            followed by any farms that only appear in the farm data.
+        """
+        herd = self._as_herd(animals)
+        farm_frame = _farm_frame(farms)
+        table = herd
+
+        if farm_frame is not None:
+            known = set(herd.farm_ids)
+            extra = [farm_id for farm_id in farm_frame.index if farm_id not in known]
+
+            if extra:
+                # the farms are appended to a copy, so a table given by the caller keeps its own farms
+                ef_country = farm_frame.loc[extra, "ef_country"].to_numpy() if "ef_country" in farm_frame else None
+                table = herd.with_farms(extra, ef_country)
+
+        results = self._evaluate_frame(table, farm_frame)
+
+        if table is not herd:
+            herd.share_terms(table)
+
+        return results
+
+    def evaluate_files(self, livestock_source, farm_source=None, file_format=None):
+        """
+        Evaluates every impact category for each farm of a Parquet or Arrow IPC livestock file, and optionally a farm file.
+        Only the columns used by the LCA are read, and no AnimalCategory or Farm objects are built.
+
+        Parameters:
+            livestock_source (str or file-like): The livestock file.
+            farm_source (str or file-like, optional): The farm file.
+            file_format (str, optional): "parquet", "ipc" or "stream". Defaults to the format implied by each file extension.
+
+        Returns:
+            pandas.DataFrame: One row per farm, indexed by farm_id, as returned by evaluate.
+        """
+        animals = read_livestock_data(livestock_source, file_format=file_format)
+        farms = read_farm_data(farm_source, file_format=file_format) if farm_source is not None else None
+
+        return self.evaluate(animals, farms)
+
+    def evaluate_stream(self, chunks, farms=None, as_frames=False, check_grouped=True):
+        """
+        Evaluates every impact category for each farm of a stream of livestock chunks, such as the batches of
+        iter_livestock_batches, yielding the results of each farm once all of its rows have been seen.
+
+        The rows of each farm must be contiguous in the stream, as when it is sorted or grouped by farm_id; see
+        complete_farm_chunks. The farms completed by each chunk are evaluated together, as a HerdTable, and only the rows of
+        the farm that may continue into the next chunk are held back, so memory use does not grow with the length of the
+        stream.
+
+        Parameters:
+            chunks (iterable): DataFrames of livestock rows in the format accepted by load_livestock_data.
+            farms (pandas.DataFrame, optional): Farm data in the format accepted by load_farm_data. Farms that only appear
+                in the farm data are yielded after the stream is exhausted.
+            as_frames (bool, optional): Whether to yield a DataFrame of the farms completed by each chunk, indexed by
+                farm_id, rather than a record per farm. Defaults to False.
+            check_grouped (bool, optional): Whether to raise if a farm reappears after it was completed. Defaults to True.
+
+        Yields:
+            dict or pandas.DataFrame: The farm_id and result columns of the next farm, with the same keys and values as the
+            columns of evaluate, or a DataFrame of several farms if as_frames is set.
+
+        Raises:
+            ValueError: If check_grouped is set and the rows of a farm are not contiguous.
+        """
+        farm_frame = _farm_frame(farms)
+        evaluated = set()
+
+        for chunk in complete_farm_chunks(chunks, check_grouped):
+            results = self._evaluate_frame(self.herd_table(chunk), farm_frame)
+
+            if farm_frame is not None:
+                evaluated.update(results.index)
+
+            yield from _stream_results(results, as_frames)
+
+        if farm_frame is not None:
+            extra = [farm_id for farm_id in farm_frame.index if farm_id not in evaluated]
+
+            if extra:
+                # the farms are appended to an empty herd, as their livestock totals are zero
+                no_livestock = pd.DataFrame(columns=list(ANIMAL_CATEGORY_FIELDS))
+
+                yield from _stream_results(self.evaluate(no_livestock, farms[farms["farm_id"].isin(extra)]), as_frames)
+
+    def evaluate_herd(self, herd, inputs):
+        """
+        Evaluates every impact category for each farm of a HerdTable. The livestock terms are cached on the table, so each
+        is computed once whichever categories use it.
+
+        Parameters:
+            herd (HerdTable): The herd table.
+            inputs (dict): An array of each farm level input, keyed as in farm_input_columns and aligned with farm_ids.
+
+        Returns:
+            dict: An array of each result column, aligned with farm_ids.
+        """
+        return evaluate_categories(
+            (self.climatechange, self.eutrophication, self.air_quality),
+            inputs,
+            herd,
+            farm_args=(herd,),
+            zero=np.zeros(herd.n_farms),
+        )
+
+    def _evaluate_frame(self, herd, farm_frame):
+        """
+        Evaluates every impact category for each farm of a HerdTable, with the farm level inputs of an indexed farm frame.
+        """
+        columns = self.evaluate_herd(herd, self._farm_inputs(herd, farm_frame))
+
+        return pd.DataFrame(columns, index=pd.Index(herd.farm_ids, name="farm_id"))
+
+    def _farm_inputs(self, herd, farm_frame):
+        """
+        Reads the farm level inputs of each farm of a HerdTable, using zero for any that are missing.
+
+        Parameters:
+            herd (HerdTable): The herd table.
+            farm_frame (pandas.DataFrame): The farm data indexed by farm_id, or None.
+
+        Returns:
+            dict: An array of each farm level input, aligned with farm_ids.
+        """
+        inputs = {}
+
+        for name, column in self.farm_input_columns.items():
+            if farm_frame is None or column not in farm_frame.columns:
+                inputs[name] = np.zeros(herd.n_farms)
+            else:
+                values = farm_frame[column].reindex(herd.farm_ids)
+                inputs[name] = values.astype(float).fillna(0).to_numpy()
+
+        return inputs
+
+
+def _farm_frame(farms):
+    """
+    Indexes farm data by farm_id. As in load_farm_data and pair_farm_data, the last row of a repeated farm is used and
+    farms are ordered by first appearance.
+
+    Parameters:
+        farms (pandas.DataFrame): Farm data in the format accepted by load_farm_data, or None.
+
+    Returns:
+        pandas.DataFrame: The farm data indexed by farm_id, or None.
+    """
+    if farms is None:
+        return None
+
+    return (
+        farms.drop_duplicates(subset="farm_id", keep="last")
+        .set_index("farm_id")
+        .reindex(pd.unique(farms["farm_id"]))
+    )
+
+
+def _stream_results(results, as_frames):
+    """
+    Yields a DataFrame of results as is, or as one record per farm.
+    """
+    if as_frames:
+        yield results
+    else:
+        yield from results.reset_index().to_dict("records")
+
+
+def result_columns():
+    """
+    Returns the result columns of FusedFarmEvaluator and FarmBatchEvaluator, in order.
+
+    Returns:
+        list: The climate change, eutrophication and air quality keys, each with the prefix of its impact family.
+    """
+    climate_keys, eutrophication_keys, air_quality_keys = _category_keys()
+
+    return (
+        ["climate_change_" + key for key in climate_keys]
+        + ["eutrophication_" + key for key in eutrophication_keys]
+        + ["air_quality_" + key for key in air_quality_keys]
+    )
+
+
+def _category_keys():
+    """
+    Returns the result keys of each impact family, in the order of the emissions dictionaries used by FarmBatchEvaluator.
+
+    Returns:
+        tuple: The climate change, eutrophication and air quality keys.
+    """
+    return (
+        list(CLIMATE_CHANGE_EXPANDED_CATEGORIES),
+        list(EUTROPHICATION_EXPANDED_CATEGORIES),
+        list(AIR_QUALITY_CATEGORIES),
+    )
@@ -0,0 +1,789 @@
+"""
+Graph Module
+------------
+
+This module contains the ComputationGraph class, an explicit representation of the per-cohort LCA formulas as a directed
+acyclic graph of named nodes, and LCA_GRAPH, the graph of the sheep formulas.
+
+In the stage classes of the lca module the dependencies between formulas are implicit in nested method calls, so
+DailySpread.net_excretion_SPREAD calls into StorageStage, which calls HousingStage.net_excretion_HOUSED, which calls
+Energy.gross_energy_from_grass. Here each formula is a node with a name, the names of its inputs and a function computing
+it. The inputs of a node are the parameter names of its function: either other nodes, or leaves such as cohort attributes
+(weight, con_amount, t_outdoors, ...) and the resolved factors of a HerdTable (forage_digestibility, storage_TAN,
+direct_n2o, ...).
+
+The node functions are the only definition of the formulas. Each stage method of the lca module gathers the inputs of
+the node of the same name, from its factors and other stage methods, and calls the node function, so the scalar, array
+and graph evaluations cannot diverge. For the same reason this module does not import NumPy.
+
+A caller requests only the outputs it needs; the evaluator computes each node they depend on exactly once, in topological
+order. Formulas use plain arithmetic, so they evaluate equally over scalars, for a single animal whose leaves are given by
+animal_inputs, or over arrays, for every row of a HerdTable, whose cached terms are evaluated from this graph.
+"""
+import inspect
+from collections.abc import Mapping
+
+
+class Node:
+    """
+    A named formula of a ComputationGraph.
+
+    Attributes:
+        name (str): The name of the node.
+        inputs (tuple): The names of the nodes and leaves the formula is computed from, in argument order.
+        formula (callable): Computes the node from its inputs.
+    """
+    def __init__(self, name, inputs, formula):
+        self.name = name
+        self.inputs = tuple(inputs)
+        self.formula = formula
+
+    def __call__(self, *args):
+        return self.formula(*args)
+
+    def __repr__(self):
+        return f"Node({self.name!r}, inputs={self.inputs!r})"
+
+
+class ComputationGraph:
+    """
+    A directed acyclic graph of named formulas, evaluated selectively and in topological order.
+
+    Attributes:
+        nodes (dict): The nodes of the graph, keyed by name, in the order they were added.
+
+    Methods:
+        node(formula): Decorator adding a function as a node named after it, with its parameters as inputs.
+        add(name, inputs, formula): Adds a node.
+        leaves(): Returns the names of the inputs that are not nodes.
+        plan(outputs): Returns the nodes needed for the outputs, in evaluation order.
+        dependents(names): Returns the nodes that depend on any of the given nodes or leaves.
+        evaluate(outputs, values): Computes the outputs from the leaf values.
+    """
+    def __init__(self):
+        self.nodes = {}
+
+    def __contains__(self, name):
+        return name in self.nodes
+
+    def __getitem__(self, name):
+        return self.nodes[name]
+
+    def node(self, formula):
+        """
+        Adds a function as a node, named after the function, whose inputs are the names of its parameters.
+
+        Args:
+            formula (callable): The formula of the node.
+
+        Returns:
+            callable: The formula, unchanged, so the decorator can be stacked or the formula called directly.
+        """
+        self.add(formula.__name__, inspect.signature(formula).parameters, formula)
+
+        return formula
+
+    def add(self, name, inputs, formula):
+        """
+        Adds a node to the graph. Inputs that are not yet nodes are treated as leaves until a node of that name is added.
+
+        Args:
+            name (str): The name of the node.
+            inputs (iterable): The names of its inputs, in the argument order of the formula.
+            formula (callable): Computes the node from its inputs.
+
+        Raises:
+            ValueError: If the graph already has a node of that name.
+        """
+        if name in self.nodes:
+            raise ValueError(f"the graph already has a node named {name!r}")
+
+        self.nodes[name] = Node(name, inputs, formula)
+
+    def leaves(self):
+        """
+        Returns the inputs of the graph that are not computed by a node, and must be given to evaluate.
+
+        Returns:
+            list: The names of the leaves, in order of first use.
+        """
+        return list(dict.fromkeys(name for node in self.nodes.values() for name in node.inputs if name not in self.nodes))
+
+    def plan(self, outputs, known=()):
+        """
+        Orders the nodes needed to compute the outputs so that every node follows its inputs. Nodes that are known, or only
+        needed by known nodes, are left out.
+
+        Args:
+            outputs (iterable): The names of the requested nodes.
+            known (iterable, optional): The names of nodes whose values are already available.
+
+        Returns:
+            list: The names of the nodes to compute, in evaluation order.
+
+        Raises:
+            KeyError: If an output is not a node of the graph.
+            ValueError: If the nodes needed form a cycle.
+        """
+        known = set(known)
+        order = []
+        state = {}
+
+        for output in outputs:
+            if output not in self.nodes:
+                raise KeyError(f"the graph has no node named {output!r}")
+
+            # iterative depth-first search, emitting each node after all of its inputs
+            stack = [(output, False)]
+
+            while stack:
+                name, expanded = stack.pop()
+
+                if expanded:
+                    state[name] = "done"
+                    order.append(name)
+                    continue
+
+                if state.get(name) == "done" or name in known or name not in self.nodes:
+                    continue
+
+                if state.get(name) == "visiting":
+                    raise ValueError(f"the graph has a cycle through {name!r}")
+
+                state[name] = "visiting"
+                stack.append((name, True))
+                stack.extend((input_name, False) for input_name in reversed(self.nodes[name].inputs))
+
+        return order
+
+    def dependents(self, names):
+        """
+        Returns the nodes that depend, directly or through other nodes, on any of the given nodes or leaves.
+
+        Args:
+            names (iterable): The names of the changed nodes or leaves.
+
+        Returns:
+            set: The names of the dependent nodes.
+        """
+        invalid = set(names)
+        dependent = set()
+
+        for name in self.plan(self.nodes):
+            if invalid.intersection(self.nodes[name].inputs):
+                invalid.add(name)
+                dependent.add(name)
+
+        return dependent
+
+    def evaluate(self, outputs, values):
+        """
+        Computes the requested nodes, evaluating each node they depend on exactly once.
+
+        Args:
+            outputs (iterable): The names of the requested nodes.
+            values (Mapping): The value of every leaf the outputs depend on, as scalars or arrays. Values given for nodes
+                are used as they are rather than computed.
+
+        Returns:
+            dict: The value of each output, keyed by name.
+
+        Raises:
+            KeyError: If an output is not a node, or the value of a leaf is missing.
+        """
+        outputs = list(outputs)
+        # the leaves are only read as they are needed, so a lazy mapping such as that of animal_inputs is not exhausted
+        computed = {}
+
+        for name in self.plan(outputs, known=values):
+            node = self.nodes[name]
+
+            try:
+                args = [computed[input_name] if input_name in computed else values[input_name] for input_name in node.inputs]
+            except KeyError as error:
+                raise KeyError(f"no value for {error.args[0]!r}, needed by {name!r}") from None
+
+            computed[name] = node.formula(*args)
+
+        return {output: computed[output] if output in computed else values[output] for output in outputs}
+
+
+def animal_inputs(animal, data_manager):
+    """
+    Returns the leaves of LCA_GRAPH for a single animal cohort, so its formulas can be evaluated over scalars. The factors
+    are those a HerdTable resolves for the same cohort.
+
+    Each leaf is read when a formula first needs it, so a factor missing from the database raises ValueError only for the
+    outputs that depend on it.
+
+    Args:
+        animal (AnimalCategory): The animal cohort.
+        data_manager (LCADataManager): The data manager of the emissions factor country.
+
+    Returns:
+        Mapping: The value of each leaf, keyed by name.
+    """
+    factor_table = data_manager.factor_table
+    cohort = factor_table.cohort[animal.cohort]
+
+    getters = {
+        "weight": lambda: animal.weight,
+        "wool": lambda: animal.wool,
+        "con_amount": lambda: animal.con_amount,
+        "t_outdoors": lambda: animal.t_outdoors,
+        "t_indoors": lambda: animal.t_indoors,
+        "t_stabled": lambda: animal.t_stabled,
+    }
+    getters.update({parameter: (lambda parameter=parameter: cohort[parameter]) for parameter in cohort})
+    getters.update(
+        {
+            "grazing_coefficient": lambda: factor_table.grazing[animal.grazing],
+            "forage_digestibility": lambda: data_manager.get_forage_digestibility(animal.forage),
+            "grass_gross_energy": lambda: data_manager.get_grass_dry_matter_gross_energy(animal.forage),
+            "grass_crude_protein": lambda: data_manager.get_grass_crude_protein(animal.forage),
+            "concentrate_digestibility": lambda: data_manager.get_concentrate_digestibility(animal.con_type),
+            "concentrate_gross_energy": lambda: data_manager.get_con_dry_matter_gross_energy(animal.con_type),
+            "concentrate_crude_protein": lambda: data_manager.get_concentrate_crude_protein(animal.con_type),
+            "concentrate_digestible_energy": lambda: data_manager.get_concentrate_digestable_energy(animal.con_type),
+            "storage_TAN": lambda: factor_table.storage_TAN[animal.mm_storage],
+            "storage_MCF": lambda: factor_table.storage_MCF[animal.mm_storage],
+            "storage_N2O": lambda: factor_table.storage_N2O[animal.mm_storage],
+            "daily_spreading_factor": lambda: factor_table.daily_spreading[animal.daily_spreading],
+            "lactation_weight": lambda: factor_table.lactation_weight,
+            "indirect_atmospheric_deposition": lambda: float(data_manager.get_indirect_atmospheric_deposition()),
+        }
+    )
+
+    return LazyInputs(getters)
+
+
+class LazyInputs(Mapping):
+    """
+    A read-only mapping of leaf values, each computed by its getter on first access and kept.
+
+    Args:
+        getters (dict): A function of no arguments returning the value of each leaf, keyed by name.
+    """
+    def __init__(self, getters):
+        self._getters = getters
+        self._values = {}
+
+    def __getitem__(self, name):
+        try:
+            return self._values[name]
+        except KeyError:
+            value = self._values[name] = self._getters[name]()
+
+            return value
+
+    def __iter__(self):
+        return iter(self._getters)
+
+    def __len__(self):
+        return len(self._getters)
+
+
+LCA_GRAPH = ComputationGraph()
+
+
+###############################################################################
+# Energy
+###############################################################################
+@LCA_GRAPH.node
+def ratio_of_net_energy_maintenance(forage_digestibility):
+    """
+    The ratio of net energy available for maintenance (REM).
+    """
+    DE = forage_digestibility
+
+    return 1.123 - (4.092 * (10**-3) * DE) + (1.126 * (10**-5) * (DE**2)) - (25.4 / DE)
+
+
+@LCA_GRAPH.node
+def ratio_of_net_energy_growth(forage_digestibility):
+    """
+    The ratio of net energy available for growth (REG).
+    """
+    DE = forage_digestibility
+
+    return 1.164 - (5.160 * (10**-3) * DE) + (1.308 * (10**-5) * (DE**2)) - (37.4 / DE)
+
+
+@LCA_GRAPH.node
+def net_energy_for_maintenance(coefficient, weight):
+    """
+    Net energy for maintenance, in MJ/day.
+    """
+    return coefficient * (weight**0.75)
+
+
+@LCA_GRAPH.node
+def net_energy_for_activity(grazing_coefficient, weight):
+    """
+    Net energy for activity, in MJ/day.
+    """
+    return grazing_coefficient * weight
+
+
+@LCA_GRAPH.node
+def net_energy_for_weight_gain(coefficient_a, coefficient_b, bwf, bwi):
+    """
+    Net energy for weight gain, in MJ/day.
+    """
+    year = 365
+
+    a = coefficient_a
+    b = coefficient_b
+
+    bw_initial = bwf
+    bw_finish = bwi
+
+    weight_gain = bw_finish - bw_initial
+
+    return (weight_gain * (a + (0.5 * b) * (bw_initial + bw_finish))) / year
+
+
+@LCA_GRAPH.node
+def net_energy_for_lactation(lactation, lactation_weight):
+    """
+    Net energy for lactation, in MJ/day.
+    """
+    milk_energy = 4.6
+
+    # multiplying by the comparison selects the energy for lactating cohorts, for a single animal or for arrays
+    return (lactation != 0) * (((5 * lactation_weight) / 365) * milk_energy)
+
+
+@LCA_GRAPH.node
+def net_energy_for_wool(wool):
+    """
+    Net energy for wool production, in MJ/day.
+    """
+    energy_val_wool = 24
+
+    return (energy_val_wool * wool) / 365
+
+
+@LCA_GRAPH.node
+def net_energy_for_pregnancy(pregnancy, net_energy_for_maintenance):
+    """
+    Net energy for pregnancy, in MJ/day.
+    """
+    return pregnancy * net_energy_for_maintenance
+
+
+@LCA_GRAPH.node
+def gross_energy_from_concentrate(con_amount, concentrate_digestibility, concentrate_gross_energy):
+    """
+    Gross energy from concentrate feed, in MJ.
+    """
+    return (con_amount * concentrate_digestibility / 100) * concentrate_gross_energy
+
+
+@LCA_GRAPH.node
+def gross_energy_from_grass(
+    forage_digestibility,
+    ratio_of_net_energy_maintenance,
+    ratio_of_net_energy_growth,
+    net_energy_for_maintenance,
+    net_energy_for_activity,
+    net_energy_for_lactation,
+    net_energy_for_pregnancy,
+    net_energy_for_weight_gain,
+    net_energy_for_wool,
+    gross_energy_from_concentrate,
+):
+    """
+    Gross energy from grass, in MJ.
+    """
+    DMD = forage_digestibility
+
+    REM = ratio_of_net_energy_maintenance
+    REG = ratio_of_net_energy_growth
+    NEM = net_energy_for_maintenance
+    NEA = net_energy_for_activity
+    NEL = net_energy_for_lactation
+    NEP = net_energy_for_pregnancy
+    NEG = net_energy_for_weight_gain
+    NEW = net_energy_for_wool
+    con = gross_energy_from_concentrate
+
+    return ((((NEM + NEA + NEL + NEP) / REM) + ((NEG + NEW) / REG)) / (DMD / 100.0)) - con
+
+
+###############################################################################
+# Grass feed
+###############################################################################
+@LCA_GRAPH.node
+def dry_matter_from_grass(
+    forage_digestibility,
+    grass_gross_energy,
+    concentrate_digestibility,
+    ratio_of_net_energy_maintenance,
+    ratio_of_net_energy_growth,
+    net_energy_for_maintenance,
+    net_energy_for_activity,
+    net_energy_for_lactation,
+    net_energy_for_pregnancy,
+    net_energy_for_weight_gain,
+    gross_energy_from_concentrate,
+):
+    """
+    Dry matter consumed from grass, in kg/day.
+    """
+    DMD = forage_digestibility
+
+    REM = ratio_of_net_energy_maintenance
+    REG = ratio_of_net_energy_growth
+    NEM = net_energy_for_maintenance
+    NEA = net_energy_for_activity
+    NEL = net_energy_for_lactation
+    NEP = net_energy_for_pregnancy
+    NEG = net_energy_for_weight_gain
+    con = gross_energy_from_concentrate
+
+    share_con = con / (((NEM + NEA + NEL + NEP) / REM) + (NEG / REG))
+
+    DMD_average = share_con * concentrate_digestibility + (1 - share_con) * DMD
+
+    return ((((NEM + NEA + NEL + NEP) / REM) + (NEG / REG)) / (DMD_average / 100.0) - con) / grass_gross_energy
+
+
+@LCA_GRAPH.node
+def ch4_emissions_factor(gross_energy_from_concentrate, gross_energy_from_grass, methane_conversion_factor):
+    """
+    Enteric methane emissions factor, in kg CH4/year.
+    """
+    year = 365
+    methane_energy = 55.65  # MJ/kg of CH4
+
+    GET = gross_energy_from_concentrate + gross_energy_from_grass
+
+    return (GET * methane_conversion_factor * year) / methane_energy
+
+
+###############################################################################
+# Grazing
+###############################################################################
+@LCA_GRAPH.node
+def percent_outdoors(t_outdoors):
+    """
+    The fraction of the day spent outdoors.
+    """
+    hours = 24
+    return t_outdoors / hours
+
+
+@LCA_GRAPH.node
+def volatile_solids_excretion_rate_GRAZING(
+    concentrate_digestible_energy,
+    forage_digestibility,
+    gross_energy_from_concentrate,
+    gross_energy_from_grass,
+    percent_outdoors,
+):
+    """
+    Volatile solids excreted to pasture, in kg/day.
+    """
+    DEC = concentrate_digestible_energy
+    UE = 0.04
+    ASH = 0.08
+    DMD = forage_digestibility
+    GEC = gross_energy_from_concentrate
+    GEG = gross_energy_from_grass
+    OUT = percent_outdoors
+
+    return (
+        (((GEG * (1 - (DMD / 100))) + (UE * GEG)) * ((1 - ASH) / 18.45))
+        + ((GEC * (1 - (DEC / 100)) + (UE * GEC)) * (((1 - ASH) / 18.45)))
+    ) * OUT
+
+
+@LCA_GRAPH.node
+def net_excretion_GRAZING(
+    concentrate_crude_protein,
+    grass_crude_protein,
+    gross_energy_from_concentrate,
+    gross_energy_from_grass,
+    percent_outdoors,
+):
+    """
+    Nitrogen excreted to pasture, in kg/year.
+    """
+    CP = concentrate_crude_protein
+    FCP = grass_crude_protein
+    GEC = gross_energy_from_concentrate
+    GEG = gross_energy_from_grass
+    OUT = percent_outdoors
+    N_retention_frac = 0.10
+
+    return (
+        (((GEC * 365) / 18.45) * ((CP / 100) / 6.25) * (1 - N_retention_frac))
+        + ((((GEG * 365) / 18.45) * (FCP / 100.0) / 6.25) * (1 - N_retention_frac))
+    ) * OUT
+
+
+@LCA_GRAPH.node
+def ch4_emissions_for_grazing(volatile_solids_excretion_rate_GRAZING):
+    """
+    Methane from excretion while grazing, in kg/year.
+    """
+    year = 365
+    return (volatile_solids_excretion_rate_GRAZING * year) * 0.1 * 0.67 * 0.19
+
+
+@LCA_GRAPH.node
+def nh3_emissions_per_year_GRAZING(net_excretion_GRAZING, total_ammonia_nitrogen):
+    """
+    Ammonia emissions while grazing, in kg/year.
+    """
+    return net_excretion_GRAZING * 0.6 * total_ammonia_nitrogen
+
+
+@LCA_GRAPH.node
+def Nleach_GRAZING(net_excretion_GRAZING):
+    """
+    Nitrogen leached from pasture, in kg/year.
+    """
+    ten_percent_nex = 0.1
+
+    return net_excretion_GRAZING * ten_percent_nex
+
+
+@LCA_GRAPH.node
+def PLeach_GRAZING(net_excretion_GRAZING):
+    """
+    Phosphorus leached from pasture, in kg/year.
+    """
+    return (net_excretion_GRAZING * (1.8 / 5)) * 0.03
+
+
+@LCA_GRAPH.node
+def PRP_N2O_direct(net_excretion_GRAZING, direct_n2o):
+    """
+    Direct N2O-N from pasture, range and paddock, in kg/year.
+    """
+    return net_excretion_GRAZING * direct_n2o
+
+
+@LCA_GRAPH.node
+def PRP_N2O_indirect(nh3_emissions_per_year_GRAZING, Nleach_GRAZING, atmospheric_deposition, leaching):
+    """
+    Indirect N2O-N from pasture, range and paddock, in kg/year.
+    """
+    NH3 = nh3_emissions_per_year_GRAZING
+    NL = Nleach_GRAZING
+
+    return (NH3 * atmospheric_deposition) + (NL * leaching)
+
+
+###############################################################################
+# Housing
+###############################################################################
+@LCA_GRAPH.node
+def percent_indoors(t_indoors, t_stabled):
+    """
+    The fraction of the day spent indoors or stabled.
+    """
+    hours = 24
+    return (t_indoors + t_stabled) / hours
+
+
+@LCA_GRAPH.node
+def VS_HOUSED(
+    concentrate_digestible_energy,
+    forage_digestibility,
+    gross_energy_from_concentrate,
+    gross_energy_from_grass,
+    percent_indoors,
+):
+    """
+    Volatile solids excreted while housed, in kg/day.
+    """
+    DEC = concentrate_digestible_energy
+    UE = 0.04
+    ASH = 0.08
+    DMD = forage_digestibility
+    GEC = gross_energy_from_concentrate
+    GEG = gross_energy_from_grass
+    IN = percent_indoors
+
+    # The second instance of GEG in part 2 of equation may need to be changed to GEC
+
+    return (
+        (((GEC * (1 - (DEC / 100))) + (UE * GEC)) * ((1 - ASH) / 18.45))
+        + ((GEG * (1 - (DMD / 100)) + (UE * GEG)) * ((1 - ASH) / 18.45))
+    ) * IN
+
+
+@LCA_GRAPH.node
+def net_excretion_HOUSED(
+    concentrate_crude_protein,
+    grass_crude_protein,
+    gross_energy_from_concentrate,
+    gross_energy_from_grass,
+    percent_indoors,
+):
+    """
+    Nitrogen excreted while housed, in kg/year.
+    """
+    CP = concentrate_crude_protein
+    FCP = grass_crude_protein
+    GEC = gross_energy_from_concentrate
+    GEG = gross_energy_from_grass
+
+    N_retention_frac = 0.10
+
+    IN = percent_indoors
+
+    return (
+        (((GEC * 365) / 18.45) * ((CP / 100) / 6.25) * (1 - N_retention_frac))
+        + ((((GEG * 365) / 18.45) * (FCP / 100.0) / 6.25) * (1 - N_retention_frac))
+    ) * IN
+
+
+@LCA_GRAPH.node
+def total_ammonia_nitrogen_nh4_HOUSED(net_excretion_HOUSED):
+    """
+    Total ammonia nitrogen (TAN) excreted while housed, in kg/year.
+    """
+    percentage_nex = 0.6
+
+    return net_excretion_HOUSED * percentage_nex
+
+
+@LCA_GRAPH.node
+def nh3_emissions_per_year_HOUSED(total_ammonia_nitrogen_nh4_HOUSED, storage_TAN):
+    """
+    Ammonia emissions from housing, in kg/year.
+    """
+    return total_ammonia_nitrogen_nh4_HOUSED * storage_TAN
+
+
+@LCA_GRAPH.node
+def HOUSING_N2O_indirect(nh3_emissions_per_year_HOUSED, indirect_atmospheric_deposition):
+    """
+    Indirect N2O-N from housing, in kg/year.
+    """
+    return nh3_emissions_per_year_HOUSED * indirect_atmospheric_deposition
+
+
+###############################################################################
+# Storage
+###############################################################################
+@LCA_GRAPH.node
+def net_excretion_STORAGE(net_excretion_HOUSED, nh3_emissions_per_year_HOUSED):
+    """
+    Nitrogen entering manure storage, in kg/year.
+    """
+    return net_excretion_HOUSED - nh3_emissions_per_year_HOUSED
+
+
+@LCA_GRAPH.node
+def total_ammonia_nitrogen_nh4_STORAGE(net_excretion_STORAGE):
+    """
+    Total ammonia nitrogen (TAN) entering manure storage, in kg/year.
+    """
+    percentage_nex = 0.6
+
+    return net_excretion_STORAGE * percentage_nex
+
+
+@LCA_GRAPH.node
+def CH4_STORAGE(VS_HOUSED, storage_MCF):
+    """
+    Methane from manure storage, in kg/year.
+    """
+    return (VS_HOUSED * 365) * (0.1 * 0.67 * storage_MCF)
+
+
+@LCA_GRAPH.node
+def STORAGE_N2O_direct(net_excretion_STORAGE, storage_N2O):
+    """
+    Direct N2O-N from manure storage, in kg/year.
+    """
+    return net_excretion_STORAGE * storage_N2O
+
+
+@LCA_GRAPH.node
+def nh3_emissions_per_year_STORAGE(total_ammonia_nitrogen_nh4_STORAGE, storage_TAN):
+    """
+    Ammonia emissions from manure storage, in kg/year.
+    """
+    return total_ammonia_nitrogen_nh4_STORAGE * storage_TAN
+
+
+@LCA_GRAPH.node
+def STORAGE_N2O_indirect(nh3_emissions_per_year_STORAGE, atmospheric_deposition):
+    """
+    Indirect N2O-N from manure storage, in kg/year.
+    """
+    return nh3_emissions_per_year_STORAGE * atmospheric_deposition
+
+
+###############################################################################
+# Daily spread
+###############################################################################
+@LCA_GRAPH.node
+def net_excretion_SPREAD(
+    net_excretion_STORAGE, STORAGE_N2O_direct, nh3_emissions_per_year_STORAGE, STORAGE_N2O_indirect
+):
+    """
+    Nitrogen spread from manure storage, in kg/year.
+    """
+    return net_excretion_STORAGE - STORAGE_N2O_direct - nh3_emissions_per_year_STORAGE - STORAGE_N2O_indirect
+
+
+@LCA_GRAPH.node
+def total_ammonia_nitrogen_nh4_SPREAD(net_excretion_SPREAD):
+    """
+    Total ammonia nitrogen (TAN) spread, in kg/year.
+    """
+    percentage_nex = 0.6
+
+    return net_excretion_SPREAD * percentage_nex
+
+
+@LCA_GRAPH.node
+def SPREAD_N2O_direct(net_excretion_SPREAD, direct_soil_n2o):
+    """
+    Direct N2O-N from daily spreading, in kg/year.
+    """
+    return net_excretion_SPREAD * direct_soil_n2o
+
+
+@LCA_GRAPH.node
+def nh3_emissions_per_year_SPREAD(total_ammonia_nitrogen_nh4_SPREAD, daily_spreading_factor):
+    """
+    Ammonia emissions from daily spreading, in kg/year.
+    """
+    return total_ammonia_nitrogen_nh4_SPREAD * daily_spreading_factor
+
+
+@LCA_GRAPH.node
+def leach_nitrogen_SPREAD(net_excretion_SPREAD):
+    """
+    Nitrogen leached from daily spreading, in kg/year.
+    """
+    ten_percent_nex = 0.1
+
+    return net_excretion_SPREAD * ten_percent_nex
+
+
+@LCA_GRAPH.node
+def leach_phospherous_SPREAD(net_excretion_SPREAD):
+    """
+    Phosphorus leached from daily spreading, in kg/year.
+    """
+    return (net_excretion_SPREAD * (1.8 / 5)) * 0.03
+
+
+@LCA_GRAPH.node
+def SPREAD_N2O_indirect(nh3_emissions_per_year_SPREAD, leach_nitrogen_SPREAD, atmospheric_deposition, leaching):
+    """
+    Indirect N2O-N from daily spreading, in kg/year.
+    """
+    NH3 = nh3_emissions_per_year_SPREAD
+    NL = leach_nitrogen_SPREAD
+
+    return (NH3 * atmospheric_deposition) + (NL * leaching)
@@ -0,0 +1,294 @@
+"""
+Instrumentation Module
+----------------------
+
+This module contains the Instrumentation class, an opt-in profiler for the stage and totals classes of the lca module. It
+records how many times each method runs and the time spent in it, per method and per stage class, to find which formulas
+dominate the evaluation of a given herd mix.
+
+While enabled, the public methods of the instrumented classes are replaced by timing wrappers; disabling restores the
+original functions, so the instrumentation costs nothing when it is not in use. Instances created before enabling are
+instrumented too, as the wrappers are installed on the classes.
+
+For each method, the total time includes the methods it calls, and the self time excludes the time spent in other
+instrumented methods. Self times add up to the time spent in the instrumented classes, so they are the ones to compare
+when looking for the formulas that dominate.
+
+Example:
+    with Instrumentation(trace=True) as profile:
+        evaluator.evaluate(animals, farms)
+
+    profile.to_dataframe(n_farms=len(animals))
+    profile.write_chrome_trace("lca_trace.json")
+"""
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+
+# The lca classes instrumented by default, in the order they are reported
+DEFAULT_CLASS_NAMES = (
+    "Energy",
+    "GrassFeed",
+    "GrazingStage",
+    "HousingStage",
+    "StorageStage",
+    "DailySpread",
+    "FertiliserInputs",
+    "Upstream",
+    "ClimateChangeTotals",
+    "EutrophicationTotals",
+    "AirQualityTotals",
+)
+
+
+class Instrumentation:
+    """
+    Records call counts and cumulative times of the methods of the lca stage and totals classes while enabled.
+
+    Only one Instrumentation can be enabled at a time. It can be enabled and disabled repeatedly, accumulating its records
+    until reset, and used as a context manager that enables it on entry and disables it on exit.
+
+    Attributes:
+        classes (tuple): The instrumented classes.
+        trace (bool): Whether every call is recorded as an event for write_chrome_trace, as well as in the totals.
+        enabled (bool): Whether the wrappers are installed.
+
+    Args:
+        classes (iterable, optional): The classes to instrument. Defaults to the stage and totals classes of the lca module.
+        trace (bool, optional): Whether to record every call as an event. Defaults to False, as the events of a large herd
+            use a lot of memory.
+
+    Methods:
+        enable(): Installs the timing wrappers.
+        disable(): Restores the original methods.
+        reset(): Drops every record.
+        to_dict(): Returns the calls, total time and self time of each method.
+        stage_totals(): Returns the calls and self time of each class.
+        to_dataframe(n_farms=None): Returns the records of each method as a DataFrame.
+        write_chrome_trace(path): Writes the recorded events in the Chrome trace event format.
+    """
+    _active = None
+    _active_lock = threading.Lock()
+
+    def __init__(self, classes=None, trace=False):
+        if classes is None:
+            from sheep_lca import lca
+
+            classes = [getattr(lca, name) for name in DEFAULT_CLASS_NAMES]
+
+        self.classes = tuple(classes)
+        self.trace = trace
+        self.enabled = False
+
+        self._originals = []
+        self._records = {}
+        self._events = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def __enter__(self):
+        self.enable()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.disable()
+
+    def enable(self):
+        """
+        Installs a timing wrapper around every public method of the instrumented classes.
+
+        Raises:
+            RuntimeError: If another Instrumentation is enabled.
+        """
+        with Instrumentation._active_lock:
+            if Instrumentation._active is self:
+                return
+
+            if Instrumentation._active is not None:
+                raise RuntimeError("another Instrumentation is already enabled")
+
+            Instrumentation._active = self
+
+        for owner in self.classes:
+            for name, function in list(vars(owner).items()):
+                if name.startswith("_") or not inspect.isfunction(function):
+                    continue
+
+                self._originals.append((owner, name, function))
+                setattr(owner, name, self._wrap(owner.__name__, name, function))
+
+        self.enabled = True
+
+    def disable(self):
+        """
+        Restores the original methods of the instrumented classes. The records are kept.
+        """
+        if not self.enabled:
+            return
+
+        for owner, name, function in reversed(self._originals):
+            setattr(owner, name, function)
+
+        self._originals = []
+        self.enabled = False
+
+        with Instrumentation._active_lock:
+            Instrumentation._active = None
+
+    def reset(self):
+        """
+        Drops every record and event.
+        """
+        with self._lock:
+            self._records = {}
+            self._events = []
+
+    def _wrap(self, owner_name, name, function):
+        """
+        Returns a wrapper recording the calls of a method under (owner_name, name).
+        """
+        key = (owner_name, name)
+        record = self._record
+        clock = time.perf_counter_ns
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            stack = self._stack()
+            stack.append(0)
+            start = clock()
+
+            try:
+                return function(*args, **kwargs)
+            finally:
+                elapsed = clock() - start
+                nested = stack.pop()
+
+                if stack:
+                    stack[-1] += elapsed
+
+                record(key, start, elapsed, elapsed - nested)
+
+        return wrapper
+
+    def _stack(self):
+        """
+        Returns the call stack of the current thread, holding the time spent in nested calls of each open call.
+        """
+        stack = getattr(self._local, "stack", None)
+
+        if stack is None:
+            stack = self._local.stack = []
+
+        return stack
+
+    def _record(self, key, start, elapsed, self_elapsed):
+        with self._lock:
+            record = self._records.get(key)
+
+            if record is None:
+                record = self._records[key] = [0, 0, 0]
+
+            record[0] += 1
+            record[1] += elapsed
+            record[2] += self_elapsed
+
+            if self.trace:
+                self._events.append((key, start, elapsed, threading.get_ident()))
+
+    def to_dict(self):
+        """
+        Returns the records of each method that was called.
+
+        Returns:
+            dict: The calls, total_time and self_time (in seconds) of each method, keyed by "Class.method".
+        """
+        with self._lock:
+            records = {key: list(record) for key, record in self._records.items()}
+
+        return {
+            f"{owner}.{name}": {"calls": calls, "total_time": total / 1e9, "self_time": own / 1e9}
+            for (owner, name), (calls, total, own) in records.items()
+        }
+
+    def stage_totals(self):
+        """
+        Returns the records of each class, summed over its methods. Total times are not summed, as the total time of a
+        method includes the calls it makes to other methods of the same class.
+
+        Returns:
+            dict: The calls and self_time (in seconds) of each class that was called, keyed by class name.
+        """
+        totals = {}
+
+        for key, record in self.to_dict().items():
+            owner = key.split(".", 1)[0]
+            stage = totals.setdefault(owner, {"calls": 0, "self_time": 0.0})
+            stage["calls"] += record["calls"]
+            stage["self_time"] += record["self_time"]
+
+        return totals
+
+    def to_dataframe(self, n_farms=None):
+        """
+        Returns the records of each method as a DataFrame, slowest self time first.
+
+        Args:
+            n_farms (int, optional): The number of farms evaluated, to add the calls per farm.
+
+        Returns:
+            pandas.DataFrame: Indexed by (stage, method), with the calls, total_time, self_time and time_per_call of each
+            method, and calls_per_farm when n_farms is given.
+        """
+        import pandas as pd
+
+        records = self.to_dict()
+        frame = pd.DataFrame.from_records(
+            list(records.values()),
+            index=pd.MultiIndex.from_tuples(
+                [tuple(key.split(".", 1)) for key in records], names=["stage", "method"]
+            ),
+            columns=["calls", "total_time", "self_time"],
+        )
+        frame["time_per_call"] = frame["total_time"] / frame["calls"]
+
+        if n_farms is not None:
+            frame["calls_per_farm"] = frame["calls"] / n_farms
+
+        return frame.sort_values("self_time", ascending=False)
+
+    def write_chrome_trace(self, path):
+        """
+        Writes the recorded calls as complete events in the Chrome trace event format, which can be opened in
+        chrome://tracing or Perfetto. Each event is categorised by its class.
+
+        Args:
+            path (str): The path of the JSON file to write.
+
+        Raises:
+            ValueError: If the instrumentation was not created with trace=True.
+        """
+        if not self.trace:
+            raise ValueError("create the Instrumentation with trace=True to record events for a Chrome trace")
+
+        with self._lock:
+            events = list(self._events)
+
+        pid = os.getpid()
+        trace_events = [
+            {
+                "name": f"{owner}.{name}",
+                "cat": owner,
+                "ph": "X",
+                "ts": start / 1000,
+                "dur": elapsed / 1000,
+                "pid": pid,
+                "tid": thread,
+            }
+            for (owner, name), start, elapsed, thread in events
+        ]
+
+        with open(path, "w") as file:
+            json.dump({"traceEvents": trace_events, "displayTimeUnit": "ms"}, file)
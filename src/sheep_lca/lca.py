@@ -19,8 +19,78 @@ Key Features:
 - Evaluation of ammonia emissions and their contribution to air quality issues.
 - Analysis of upstream impacts related to feed production, fertilizer use, and other inputs.
 """
-from sheep_lca.resource_manager.sheep_lca_data_manager import LCADataManager
-import copy
+from sheep_lca.resource_manager.sheep_lca_data_manager import LCADataManagerRegistry
+from sheep_lca.evaluation_context import memoised_term
+from sheep_lca import graph
+
+# The categories of the climate change emissions dictionary
+CLIMATE_CHANGE_CATEGORIES = (
+    "enteric_ch4",
+    "manure_management_N2O",
+    "manure_management_CH4",
+    "manure_applied_N",
+    "N_direct_PRP",
+    "N_indirect_PRP",
+    "N_direct_fertiliser",
+    "N_indirect_fertiliser",
+    "soils_CO2",
+    "soil_organic_N_direct",
+    "soil_organic_N_indirect",
+    "soil_inorganic_N_direct",
+    "soil_inorganic_N_indirect",
+    "soil_histosol_N_direct",
+    "crop_residue_direct",
+    "soil_N_direct",
+    "soil_N_indirect",
+    "soils_N2O",
+)
+
+# The categories of the expanded climate change emissions dictionary, with upstream emissions
+CLIMATE_CHANGE_EXPANDED_CATEGORIES = (
+    "enteric_ch4",
+    "manure_management_N2O",
+    "manure_management_CH4",
+    "manure_applied_N",
+    "N_direct_PRP",
+    "N_indirect_PRP",
+    "N_direct_fertiliser",
+    "N_indirect_fertiliser",
+    "soils_CO2",
+    "soil_organic_N_direct",
+    "soil_organic_N_indirect",
+    "soil_inorganic_N_direct",
+    "soil_inorganic_N_indirect",
+    "soil_N_direct",
+    "soil_N_indirect",
+    "soil_histosol_N_direct",
+    "crop_residue_direct",
+    "soils_N2O",
+    "upstream_fuel_fert",
+    "upstream_feed",
+    "upstream",
+)
+
+# The categories of the eutrophication emissions dictionary
+EUTROPHICATION_CATEGORIES = (
+    "manure_management",
+    "soils",
+)
+
+# The categories of the expanded eutrophication emissions dictionary, with upstream emissions
+EUTROPHICATION_EXPANDED_CATEGORIES = (
+    "manure_management",
+    "soils",
+    "upstream_fuel_fert",
+    "upstream_feed",
+    "upstream",
+)
+
+# The categories of the air quality emissions dictionary
+AIR_QUALITY_CATEGORIES = (
+    "manure_management",
+    "soils",
+)
+
 
 class Energy:
     """
@@ -28,6 +98,7 @@ class Energy:
 
     Attributes:
     - data_manager_class (LCADataManager): Manages and provides access to relevant LCA data based on the specific country's environmental factors and agricultural practices.
+    - context (EvaluationContext): Optional cache of per-animal terms. When set, each energy term is computed once per animal.
     
     Methods:
     - ratio_of_net_energy_maintenance(animal): Calculates the ratio of net energy needed for maintenance (REM) of sheep.
@@ -43,8 +114,9 @@ class Energy:
     - gross_energy_from_grass(animal): Calculates the total energy intake from grass, the primary forage source for grazing sheep.
 
     """
-    def __init__(self, ef_country):
-        self.data_manager_class = LCADataManager(ef_country)
+    def __init__(self, ef_country, context=None):
+        self.data_manager_class = LCADataManagerRegistry.get_data_manager(ef_country)
+        self.context = context
 
     def ratio_of_net_energy_maintenance(self, animal):
         """
@@ -59,12 +131,7 @@ class Energy:
         """
         DE = self.data_manager_class.get_forage_digestibility(animal.forage)
 
-        return (
-            1.123
-            - (4.092 * (10**-3) * DE)
-            + (1.126 * (10**-5) * (DE**2))
-            - (25.4 / DE)
-        )
+        return graph.ratio_of_net_energy_maintenance(DE)
 
 
     def ratio_of_net_energy_growth(self, animal):
@@ -80,13 +147,9 @@ class Energy:
         """
         DE = self.data_manager_class.get_forage_digestibility(animal.forage)
 
-        return (
-            1.164
-            - (5.160 * (10**-3) * DE)
-            + (1.308 * (10**-5) * (DE**2))
-            - (37.4 / DE)
-        )
+        return graph.ratio_of_net_energy_growth(DE)
 
+    @memoised_term
     def net_energy_for_maintenance(self, animal):
         """
         Estimates the net energy required for maintaining the basic life functions of sheep based on their weight.
@@ -98,10 +161,11 @@ class Energy:
         - float: Total energy required for maintenance expressed in MJ/day.
         
         """
-        cfi = self.data_manager_class.get_cohort_parameter(animal.cohort, "coefficient")()
+        cfi = self.data_manager_class.factor_table.cohort[animal.cohort]["coefficient"]
 
-        return cfi * (animal.weight**0.75)
+        return graph.net_energy_for_maintenance(cfi, animal.weight)
 
+    @memoised_term
     def net_energy_for_activity(self, animal):
         """
         Determines the energy expended by sheep for their physical activities based on typical grazing and movement patterns.
@@ -113,9 +177,12 @@ class Energy:
         - float: Additional energy expended for activities, in MJ/day.
 
         """
-        return self.data_manager_class.get_grazing_type(animal.grazing)() * animal.weight
+        grazing = self.data_manager_class.factor_table.grazing[animal.grazing]
+
+        return graph.net_energy_for_activity(grazing, animal.weight)
 
 
+    @memoised_term
     def net_energy_for_weight_gain(self, animal):
         """
         Computes the net energy utilized for weight gain, considering the typical growth rates of sheep.
@@ -127,19 +194,13 @@ class Energy:
         - float: Energy used for growth in MJ/day.
         
         """
-        year = 365
+        cohort = self.data_manager_class.factor_table.cohort[animal.cohort]
 
-        a = self.data_manager_class.get_cohort_parameter(animal.cohort, "coefficient_a")()
-        b = self.data_manager_class.get_cohort_parameter(animal.cohort, "coefficient_b")()
-
-        bw_initial = self.data_manager_class.get_cohort_parameter(animal.cohort, "bwf")()
-        bw_finish = self.data_manager_class.get_cohort_parameter(animal.cohort, "bwi")()
-
-        weight_gain = bw_finish - bw_initial
-
-        return (weight_gain * (a + (0.5 * b) * (bw_initial + bw_finish))) / year
-    
+        return graph.net_energy_for_weight_gain(
+            cohort["coefficient_a"], cohort["coefficient_b"], cohort["bwf"], cohort["bwi"]
+        )
 
+    @memoised_term
     def net_energy_for_lactation(self, animal):
         """
         Calculates the energy required for lactation.
@@ -151,15 +212,14 @@ class Energy:
         - float: Energy needed for producing milk, expressed in MJ/day.
 
         """
-        milk_energy = 4.6
-        
-        if self.data_manager_class.get_cohort_parameter(animal.cohort, "lactation"):
+        lactation = self.data_manager_class.factor_table.cohort[animal.cohort]["lactation"]
 
-            return ((5 * self.data_manager_class.get_lactation_weight()) / 365) * milk_energy
-        else:
-            return 0
-        
+        # The lamb weight is only read for lactating cohorts
+        lactation_weight = self.data_manager_class.factor_table.lactation_weight if lactation else 0
 
+        return graph.net_energy_for_lactation(lactation, lactation_weight)
+
+    @memoised_term
     def net_energy_for_wool(self, animal):
         """
         Estimates the energy used for wool production.
@@ -171,13 +231,10 @@ class Energy:
         - float: Energy allocated for wool growth, in MJ/day.
 
         """
-        energy_val_wool = 24
-
-        wool_production = animal.wool
-
-        return (energy_val_wool * wool_production) / 365
+        return graph.net_energy_for_wool(animal.wool)
 
 
+    @memoised_term
     def net_energy_for_pregnancy(self, animal):
         """
         Assesses the additional energy requirements for pregnant ewes.
@@ -189,14 +246,11 @@ class Energy:
         - float: Additional energy required for supporting pregnancy, in MJ/day.
 
         """
-        coef = self.data_manager_class.get_cohort_parameter(animal.cohort, "pregnancy")
-        if coef is None:
-            nep = 0
-        else:
-            nep = coef() * self.net_energy_for_maintenance(animal)
+        coef = self.data_manager_class.factor_table.cohort[animal.cohort]["pregnancy"]
 
-        return nep
+        return graph.net_energy_for_pregnancy(coef, self.net_energy_for_maintenance(animal))
 
+    @memoised_term
     def gross_energy_from_concentrate(self, animal):
         """
         Evaluates the total energy derived from concentrate feeds.
@@ -217,7 +271,7 @@ class Energy:
             animal.con_type
         )
 
-        return (animal.con_amount * dm / 100) * mj
+        return graph.gross_energy_from_concentrate(animal.con_amount, dm, mj)
 
 
     def gross_amount_from_con_in_percent(self, animal, share_in_percent):
@@ -267,6 +321,7 @@ class Energy:
             * (share_in_percent / (100.0))
         )
 
+    @memoised_term
     def gross_energy_from_grass(self, animal):
         """
         Calculates the total gross energy intake from grass for sheep after considering the energy provided by concentrates. 
@@ -280,21 +335,18 @@ class Energy:
         Note:
         - This calculation takes into account the energy for maintenance, activity, lactation, pregnancy, growth, and wool production, adjusted for the energy supplied by concentrates.
         """
-        DMD = self.data_manager_class.get_forage_digestibility(animal.forage)
-
-        REM = self.ratio_of_net_energy_maintenance(animal)
-        REG = self.ratio_of_net_energy_growth(animal)
-        NEM = self.net_energy_for_maintenance(animal)
-        NEA = self.net_energy_for_activity(animal)
-        NEL = self.net_energy_for_lactation(animal)
-        NEP = self.net_energy_for_pregnancy(animal)
-        NEG = self.net_energy_for_weight_gain(animal)
-        NEW = self.net_energy_for_wool(animal)
-        con = self.gross_energy_from_concentrate(animal)
-
-        return (
-            (((NEM + NEA + NEL + NEP) / REM) + ((NEG + NEW) / REG)) / (DMD / 100.0)
-        ) - con
+        return graph.gross_energy_from_grass(
+            self.data_manager_class.get_forage_digestibility(animal.forage),
+            self.ratio_of_net_energy_maintenance(animal),
+            self.ratio_of_net_energy_growth(animal),
+            self.net_energy_for_maintenance(animal),
+            self.net_energy_for_activity(animal),
+            self.net_energy_for_lactation(animal),
+            self.net_energy_for_pregnancy(animal),
+            self.net_energy_for_weight_gain(animal),
+            self.net_energy_for_wool(animal),
+            self.gross_energy_from_concentrate(animal),
+        )
 
 
 class GrassFeed:
@@ -306,14 +358,16 @@ class GrassFeed:
     Attributes:
         energy_class (Energy): Instance of the Energy class to access energy-related calculations.
         data_manager_class (LCADataManager): Instance of the LCADataManager class for accessing livestock and environmental parameters.
+        context (EvaluationContext): Optional cache of per-animal terms shared with the energy class.
 
     Methods:
         dry_matter_from_grass: Estimates the amount of dry matter consumed from grass after accounting for the energy provided by concentrates.
         ch4_emissions_factor: Calculates the methane emissions factor based on the animal's total energy intake from grass and concentrates.
     """
-    def __init__(self, ef_country):
-        self.energy_class = Energy(ef_country)
-        self.data_manager_class = LCADataManager(ef_country)
+    def __init__(self, ef_country, context=None):
+        self.energy_class = Energy(ef_country, context)
+        self.data_manager_class = LCADataManagerRegistry.get_data_manager(ef_country)
+        self.context = context
 
     def dry_matter_from_grass(self, animal):
         """
@@ -328,33 +382,20 @@ class GrassFeed:
         Note:
         - This calculation integrates various energy needs of the animal, such as maintenance, activity, lactation, pregnancy, and growth, and adjusts for the energy supplied by concentrates.
         """
-
-        DMD = self.data_manager_class.get_forage_digestibility(animal.forage)
-
-        REM = self.energy_class.ratio_of_net_energy_maintenance(animal)
-        REG = self.energy_class.ratio_of_net_energy_growth(animal)
-        NEM = self.energy_class.net_energy_for_maintenance(animal)
-        NEA = self.energy_class.net_energy_for_activity(animal)
-        NEL = self.energy_class.net_energy_for_lactation(animal)
-        NEP = self.energy_class.net_energy_for_pregnancy(animal)
-        NEG = self.energy_class.net_energy_for_weight_gain(animal)
-        con = self.energy_class.gross_energy_from_concentrate(animal)
-        GE = self.data_manager_class.get_grass_dry_matter_gross_energy(animal.forage)
-        dm = self.data_manager_class.get_concentrate_digestibility(
-            animal.con_type
+        return graph.dry_matter_from_grass(
+            self.data_manager_class.get_forage_digestibility(animal.forage),
+            self.data_manager_class.get_grass_dry_matter_gross_energy(animal.forage),
+            self.data_manager_class.get_concentrate_digestibility(animal.con_type),
+            self.energy_class.ratio_of_net_energy_maintenance(animal),
+            self.energy_class.ratio_of_net_energy_growth(animal),
+            self.energy_class.net_energy_for_maintenance(animal),
+            self.energy_class.net_energy_for_activity(animal),
+            self.energy_class.net_energy_for_lactation(animal),
+            self.energy_class.net_energy_for_pregnancy(animal),
+            self.energy_class.net_energy_for_weight_gain(animal),
+            self.energy_class.gross_energy_from_concentrate(animal),
         )
 
-        share_con = con / (((NEM + NEA + NEL + NEP) / REM) + (NEG / REG))
-
-        DMD_average = share_con * dm + (1 - share_con) * DMD
-
-        return (
-            (
-                (((NEM + NEA + NEL + NEP) / REM) + (NEG / REG)) / (DMD_average / 100.0)
-                - con
-            )
-        ) / GE
-
     #########################################################################################################
     # CH4 CAlculations
     ########################################################################################################
@@ -384,17 +425,12 @@ class GrassFeed:
             GET = Gross Energy total
             Ym  = Methane conversion factor, percent of gross energy content of methane
         """
-
-        year = 365
-        Ym = self.data_manager_class.get_cohort_parameter(animal.cohort, "methane_conversion_factor")()
-        methane_energy = 55.65  # MJ/kg of CH4
+        Ym = self.data_manager_class.factor_table.cohort[animal.cohort]["methane_conversion_factor"]
 
         GEC = self.energy_class.gross_energy_from_concentrate(animal)
         GEG = self.energy_class.gross_energy_from_grass(animal)
 
-        GET = GEC + GEG
-
-        return (GET * Ym * year) / methane_energy
+        return graph.ch4_emissions_factor(GEC, GEG, Ym)
 
 
 #############################################################################################
@@ -415,6 +451,8 @@ class GrazingStage:
             An instance of the GrassFeed class, used to calculate energy intake from grasses.
         data_manager_class : LCADataManager
             An instance of the LCADataManager class, used to access data necessary for the calculations.
+        context : EvaluationContext
+            Optional cache of per-animal terms. When set, excretion terms are computed once per animal.
 
     Methods:
         percent_outdoors(animal)
@@ -437,10 +475,11 @@ class GrazingStage:
             Calculates the indirect nitrous oxide emissions from atmospheric deposition and leaching related to pasture, 
             range, and paddock due to the grazing animal.
         """
-    def __init__(self, ef_country):
-        self.data_manager_class = LCADataManager(ef_country)
-        self.energy_class = Energy(ef_country)
-        self.grass_feed_class = GrassFeed(ef_country)
+    def __init__(self, ef_country, context=None):
+        self.data_manager_class = LCADataManagerRegistry.get_data_manager(ef_country)
+        self.energy_class = Energy(ef_country, context)
+        self.grass_feed_class = GrassFeed(ef_country, context)
+        self.context = context
 
     def percent_outdoors(self, animal):
         """
@@ -452,9 +491,9 @@ class GrazingStage:
         Returns:
         - float: The percentage of the day the animal spends outdoors.
         """
-        hours = 24
-        return animal.t_outdoors / hours
+        return graph.percent_outdoors(animal.t_outdoors)
 
+    @memoised_term
     def volatile_solids_excretion_rate_GRAZING(self, animal):
         """
         Calculates the rate at which volatile solids are excreted to pasture by the animal, an essential factor in assessing the environmental impact of grazing. 
@@ -478,19 +517,14 @@ class GrazingStage:
         DEC = self.data_manager_class.get_concentrate_digestable_energy(
             animal.con_type
         )  # Digestibility
-        UE = 0.04
-        ASH = 0.08
         DMD = self.data_manager_class.get_forage_digestibility(animal.forage)
         GEC = self.energy_class.gross_energy_from_concentrate(animal)
         GEG = self.energy_class.gross_energy_from_grass(animal)
         OUT = self.percent_outdoors(animal)
 
-        return (
-            (((GEG * (1 - (DMD / 100))) + (UE * GEG)) * ((1 - ASH) / 18.45))
-            + ((GEC * (1 - (DEC / 100)) + (UE * GEC)) * (((1 - ASH) / 18.45)))
-        ) * OUT
-    
+        return graph.volatile_solids_excretion_rate_GRAZING(DEC, DMD, GEC, GEG, OUT)
 
+    @memoised_term
     def net_excretion_GRAZING(self, animal):
         """
         Calculates the net nitrogen excretion per kilogram to pasture by grazing animals.
@@ -509,12 +543,8 @@ class GrazingStage:
         GEC = self.energy_class.gross_energy_from_concentrate(animal)
         GEG = self.energy_class.gross_energy_from_grass(animal)
         OUT = self.percent_outdoors(animal)
-        N_retention_frac = 0.10
 
-        return (
-            (((GEC * 365) / 18.45) * ((CP / 100) / 6.25) * (1 - N_retention_frac))
-            + ((((GEG * 365) / 18.45) * (FCP / 100.0) / 6.25) * (1 - N_retention_frac))
-        ) * OUT
+        return graph.net_excretion_GRAZING(CP, FCP, GEC, GEG, OUT)
 
     def ch4_emissions_for_grazing(self, animal):
         """
@@ -529,13 +559,7 @@ class GrazingStage:
         Note:
         The estimation follows the IPCC 2019 methodology and adjusts for animal size and time spent outdoors.
         """
-        year = 365
-        return (
-            (self.volatile_solids_excretion_rate_GRAZING(animal) * year)
-            * 0.1
-            * 0.67
-            * 0.19
-        )
+        return graph.ch4_emissions_for_grazing(self.volatile_solids_excretion_rate_GRAZING(animal))
 
     def nh3_emissions_per_year_GRAZING(self, animal):
         """
@@ -550,9 +574,9 @@ class GrazingStage:
         Note:
         This calculation is based on net nitrogen excretion and the time the animal spends grazing.
         """
-        TAN = self.data_manager_class.get_cohort_parameter(animal.cohort, "total_ammonia_nitrogen")()
+        TAN = self.data_manager_class.factor_table.cohort[animal.cohort]["total_ammonia_nitrogen"]
 
-        return self.net_excretion_GRAZING(animal) * 0.6 * TAN
+        return graph.nh3_emissions_per_year_GRAZING(self.net_excretion_GRAZING(animal), TAN)
 
     def Nleach_GRAZING(self, animal):
         """
@@ -565,9 +589,7 @@ class GrazingStage:
         - float: Estimated nitrogen leached from the pasture, as a percentage of total nitrogen excretion.
         
         """
-        ten_percent_nex = 0.1
-
-        return self.net_excretion_GRAZING(animal) * ten_percent_nex
+        return graph.Nleach_GRAZING(self.net_excretion_GRAZING(animal))
 
     def PLeach_GRAZING(self, animal):
         """
@@ -580,7 +602,7 @@ class GrazingStage:
         - float: Estimated phosphorus leached from the pasture.
         
         """
-        return (self.net_excretion_GRAZING(animal) * (1.8 / 5)) * 0.03
+        return graph.PLeach_GRAZING(self.net_excretion_GRAZING(animal))
 
     # direct and indirect (from leaching) N20 from PRP
 
@@ -597,8 +619,9 @@ class GrazingStage:
         Note:
         Applies IPCC guidelines for direct N2O emissions from animal excretion on pasture.
         """
-        EF = self.data_manager_class.get_cohort_parameter(animal.cohort, "direct_n2o")()
-        return self.net_excretion_GRAZING(animal) * EF
+        EF = self.data_manager_class.factor_table.cohort[animal.cohort]["direct_n2o"]
+
+        return graph.PRP_N2O_direct(self.net_excretion_GRAZING(animal), EF)
 
     def PRP_N2O_indirect(self, animal):
         """
@@ -613,13 +636,13 @@ class GrazingStage:
         Note:
         Indirect emissions are calculated based on ammonia emissions and nitrogen leaching, following IPCC guidelines.
         """
-        indirect_atmosphere = self.data_manager_class.get_cohort_parameter(animal.cohort, "atmospheric_deposition")()
-        indirect_leaching = self.data_manager_class.get_cohort_parameter(animal.cohort, "leaching")()
+        indirect_atmosphere = self.data_manager_class.factor_table.cohort[animal.cohort]["atmospheric_deposition"]
+        indirect_leaching = self.data_manager_class.factor_table.cohort[animal.cohort]["leaching"]
 
         NH3 = self.nh3_emissions_per_year_GRAZING(animal)
         NL = self.Nleach_GRAZING(animal)
 
-        return (NH3 * indirect_atmosphere) + (NL * indirect_leaching)
+        return graph.PRP_N2O_indirect(NH3, NL, indirect_atmosphere, indirect_leaching)
 
 
 class HousingStage:
@@ -628,6 +651,7 @@ class HousingStage:
 
     Parameters:
     - ef_country: A country-specific factor that might affect the environmental calculations.
+    - context: Optional EvaluationContext. When set, excretion terms are computed once per animal.
 
     Methods:
     - percent_indoors(animal): Calculates the percentage of time animals spend indoors.
@@ -637,9 +661,10 @@ class HousingStage:
     - nh3_emissions_per_year_HOUSED(animal): Calculates the total ammonia emissions per year from housing.
     - HOUSING_N2O_indirect(animal): Calculates indirect nitrous oxide emissions from housing.
     """    
-    def __init__(self, ef_country):
-        self.data_manager_class = LCADataManager(ef_country)
-        self.energy_class = Energy(ef_country)
+    def __init__(self, ef_country, context=None):
+        self.data_manager_class = LCADataManagerRegistry.get_data_manager(ef_country)
+        self.energy_class = Energy(ef_country, context)
+        self.context = context
 
     def percent_indoors(self, animal):
         """
@@ -651,9 +676,9 @@ class HousingStage:
         Returns:
             - float: The percentage of the day that the animal spends indoors.
         """        
-        hours = 24
-        return (animal.t_indoors + animal.t_stabled) / hours
+        return graph.percent_indoors(animal.t_indoors, animal.t_stabled)
 
+    @memoised_term
     def VS_HOUSED(self, animal):
         """
         Calculates the volatile solids excreted per day for animals during the period they are housed. This measurement is essential for understanding the potential environmental impact of manure produced indoors.
@@ -678,21 +703,15 @@ class HousingStage:
         DEC = self.data_manager_class.get_concentrate_digestable_energy(
             animal.con_type
         )  # Digestibility of concentrate
-        UE = 0.04
-        ASH = 0.08
         DMD = self.data_manager_class.get_forage_digestibility(animal.forage)
         GEC = self.energy_class.gross_energy_from_concentrate(animal)
         GEG = self.energy_class.gross_energy_from_grass(animal)
         IN = self.percent_indoors(animal)
 
-        # The second instance of GEG in part 2 of equation may need to be changed to GEC
-
-        return (
-            (((GEC * (1 - (DEC / 100))) + (UE * GEC)) * ((1 - ASH) / 18.45))
-            + ((GEG * (1 - (DMD / 100)) + (UE * GEG)) * ((1 - ASH) / 18.45))
-        ) * IN
+        return graph.VS_HOUSED(DEC, DMD, GEC, GEG, IN)
 
 
+    @memoised_term
     def net_excretion_HOUSED(self, animal):
         """
         Calculates the amount of nitrogen excreted per year by housed animals. 
@@ -712,15 +731,9 @@ class HousingStage:
         FCP = self.data_manager_class.get_grass_crude_protein(animal.forage)
         GEC = self.energy_class.gross_energy_from_concentrate(animal)
         GEG = self.energy_class.gross_energy_from_grass(animal)
-
-        N_retention_frac = 0.10
-
         IN = self.percent_indoors(animal)
 
-        return (
-            (((GEC * 365) / 18.45) * ((CP / 100) / 6.25) * (1 - N_retention_frac))
-            + ((((GEG * 365) / 18.45) * (FCP / 100.0) / 6.25) * (1 - N_retention_frac))
-        ) * IN
+        return graph.net_excretion_HOUSED(CP, FCP, GEC, GEG, IN)
 
 
     def total_ammonia_nitrogen_nh4_HOUSED(self, animal):
@@ -736,9 +749,7 @@ class HousingStage:
         Note:
             The calculation assumes that TAN constitutes 60% of the total nitrogen excreted (Nex).
         """
-        percentage_nex = 0.6
-
-        return self.net_excretion_HOUSED(animal) * percentage_nex
+        return graph.total_ammonia_nitrogen_nh4_HOUSED(self.net_excretion_HOUSED(animal))
 
     def nh3_emissions_per_year_HOUSED(self, animal):
         """
@@ -755,9 +766,9 @@ class HousingStage:
             The method utilizes emission factors from IPCC 2019 guidelines and adjustments from the 
             National Inventory Report (NIR) 2020 to account for the management of sheep manure.
         """
-        return (
-            self.total_ammonia_nitrogen_nh4_HOUSED(animal)
-            * self.data_manager_class.get_storage_TAN(animal.mm_storage)()
+        return graph.nh3_emissions_per_year_HOUSED(
+            self.total_ammonia_nitrogen_nh4_HOUSED(animal),
+            self.data_manager_class.factor_table.storage_TAN[animal.mm_storage],
         )
 
     def HOUSING_N2O_indirect(self, animal):
@@ -777,13 +788,11 @@ class HousingStage:
             self.data_manager_class.get_indirect_atmospheric_deposition()
         )
 
-        indirect_n2o = self.nh3_emissions_per_year_HOUSED(animal) * ef
-
-        return indirect_n2o
+        return graph.HOUSING_N2O_indirect(self.nh3_emissions_per_year_HOUSED(animal), ef)
 
 
 class StorageStage:
-    def __init__(self, ef_country):
+    def __init__(self, ef_country, context=None):
         """
         The StorageStage class calculates emissions and nutrient loss from manure storage systems. It provides methods for calculating 
         net nitrogen excretion, ammonia nitrogen production, methane emissions, direct and indirect nitrous oxide emissions from manure storage.
@@ -791,6 +800,7 @@ class StorageStage:
         Attributes:
             data_manager_class (LCADataManager): Provides access to necessary data for calculations.
             housing_class (HousingStage): Allows access to calculations from the housing stage for use in storage calculations.
+            context (EvaluationContext): Optional cache of per-animal terms shared with the housing stage.
 
         Methods:
             net_excretion_STORAGE(animal): Calculates net nitrogen excretion from storage.
@@ -801,8 +811,9 @@ class StorageStage:
             STORAGE_N2O_indirect(animal): Calculates indirect nitrous oxide emissions related to storage.
 
         """
-        self.data_manager_class = LCADataManager(ef_country)
-        self.housing_class = HousingStage(ef_country)
+        self.data_manager_class = LCADataManagerRegistry.get_data_manager(ef_country)
+        self.housing_class = HousingStage(ef_country, context)
+        self.context = context
 
     def net_excretion_STORAGE(self, animal):
         """
@@ -814,9 +825,10 @@ class StorageStage:
         Returns:
             float: Net nitrogen excretion from storage, in kilograms per year.
         """
-        return self.housing_class.net_excretion_HOUSED(
-            animal
-        ) - self.housing_class.nh3_emissions_per_year_HOUSED(animal)
+        return graph.net_excretion_STORAGE(
+            self.housing_class.net_excretion_HOUSED(animal),
+            self.housing_class.nh3_emissions_per_year_HOUSED(animal),
+        )
 
     def total_ammonia_nitrogen_nh4_STORAGE(self, animal):
         """
@@ -828,9 +840,7 @@ class StorageStage:
         Returns:
             float: Total ammonia nitrogen produced per year in storage, in kilograms.
         """
-        percentage_nex = 0.6
-
-        return self.net_excretion_STORAGE(animal) * percentage_nex
+        return graph.total_ammonia_nitrogen_nh4_STORAGE(self.net_excretion_STORAGE(animal))
 
     def CH4_STORAGE(self, animal):
         """
@@ -842,8 +852,8 @@ class StorageStage:
         Returns:
             float: Methane emissions from manure storage per year, in kilograms.
         """
-        return (self.housing_class.VS_HOUSED(animal) * 365) * (
-            0.1 * 0.67 * self.data_manager_class.get_storage_MCF(animal.mm_storage)()
+        return graph.CH4_STORAGE(
+            self.housing_class.VS_HOUSED(animal), self.data_manager_class.factor_table.storage_MCF[animal.mm_storage]
         )
 
     def STORAGE_N2O_direct(self, animal):
@@ -856,7 +866,9 @@ class StorageStage:
         Returns:
             float: Direct nitrous oxide emissions from manure storage per year, in kilograms.
         """
-        return self.net_excretion_STORAGE(animal) * self.data_manager_class.get_storage_N2O(animal.mm_storage)()
+        return graph.STORAGE_N2O_direct(
+            self.net_excretion_STORAGE(animal), self.data_manager_class.factor_table.storage_N2O[animal.mm_storage]
+        )
 
 
     def nh3_emissions_per_year_STORAGE(self, animal):
@@ -869,9 +881,9 @@ class StorageStage:
         Returns:
             float: Ammonia emissions from manure storage per year, in kilograms.
         """
-        return (
-            self.total_ammonia_nitrogen_nh4_STORAGE(animal)
-            * self.data_manager_class.get_storage_TAN(animal.mm_storage)()
+        return graph.nh3_emissions_per_year_STORAGE(
+            self.total_ammonia_nitrogen_nh4_STORAGE(animal),
+            self.data_manager_class.factor_table.storage_TAN[animal.mm_storage],
         )
 
     def STORAGE_N2O_indirect(self, animal):
@@ -884,11 +896,9 @@ class StorageStage:
         Returns:
             float: Indirect nitrous oxide emissions from storage per year, in kilograms.
         """
-        indirect_atmosphere = self.data_manager_class.get_cohort_parameter(animal.cohort, "atmospheric_deposition")()
-
-        NH3 = self.nh3_emissions_per_year_STORAGE(animal)
+        indirect_atmosphere = self.data_manager_class.factor_table.cohort[animal.cohort]["atmospheric_deposition"]
 
-        return NH3 * indirect_atmosphere
+        return graph.STORAGE_N2O_indirect(self.nh3_emissions_per_year_STORAGE(animal), indirect_atmosphere)
 
 
 class DailySpread:
@@ -900,6 +910,7 @@ class DailySpread:
     Attributes:
         data_manager_class (LCADataManager): Provides access to necessary data for calculations.
         storage_class (StorageStage): Allows access to calculations from the storage stage for use in spreading calculations.
+        context (EvaluationContext): Optional cache of per-animal terms shared with the storage stage.
     
     Methods:
         net_excretion_SPREAD(animal): Calculates the net nitrogen excretion from daily spreading.
@@ -910,9 +921,10 @@ class DailySpread:
         leach_phosphorous_SPREAD(animal): Estimates the amount of phosphorus leached from daily spreading.
         SPREAD_N2O_indirect(animal): Calculates indirect nitrous oxide emissions from daily spreading.
     """
-    def __init__(self, ef_country):
-        self.data_manager_class = LCADataManager(ef_country)
-        self.storage_class = StorageStage(ef_country)
+    def __init__(self, ef_country, context=None):
+        self.data_manager_class = LCADataManagerRegistry.get_data_manager(ef_country)
+        self.storage_class = StorageStage(ef_country, context)
+        self.context = context
 
     def net_excretion_SPREAD(self, animal):
         """
@@ -924,12 +936,12 @@ class DailySpread:
         Returns:
             float: Net nitrogen excretion from daily spreading, in kilograms per year.
         """
-        nex_storage = self.net_excretion_STORAGE(animal)
-        direct_n2o = self.STORAGE_N2O_direct(animal)
-        nh3_emissions = self.nh3_emissions_per_year_STORAGE(animal)
-        indirect_n2o = self.STORAGE_N2O_indirect(animal)
+        nex_storage = self.storage_class.net_excretion_STORAGE(animal)
+        direct_n2o = self.storage_class.STORAGE_N2O_direct(animal)
+        nh3_emissions = self.storage_class.nh3_emissions_per_year_STORAGE(animal)
+        indirect_n2o = self.storage_class.STORAGE_N2O_indirect(animal)
 
-        return nex_storage - direct_n2o - nh3_emissions - indirect_n2o
+        return graph.net_excretion_SPREAD(nex_storage, direct_n2o, nh3_emissions, indirect_n2o)
 
     def total_ammonia_nitrogen_nh4_SPREAD(self, animal):
         """
@@ -941,9 +953,7 @@ class DailySpread:
         Returns:
             float: Total ammonia nitrogen produced from daily spreading, in kilograms per year.
         """
-        percentage_nex = 0.6
-
-        return self.net_excretion_SPREAD(animal) * percentage_nex
+        return graph.total_ammonia_nitrogen_nh4_SPREAD(self.net_excretion_SPREAD(animal))
 
 
     def SPREAD_N2O_direct(self, animal):
@@ -956,7 +966,9 @@ class DailySpread:
         Returns:
             float: Direct nitrous oxide emissions from daily spreading, in kilograms per year.
         """
-        return self.net_excretion_SPREAD(animal) * self.data_manager_class.get_cohort_parameter(animal.cohort, "direct_soil_n2o")()
+        EF = self.data_manager_class.factor_table.cohort[animal.cohort]["direct_soil_n2o"]
+
+        return graph.SPREAD_N2O_direct(self.net_excretion_SPREAD(animal), EF)
 
 
     def nh3_emissions_per_year_SPREAD(self, animal):
@@ -971,7 +983,9 @@ class DailySpread:
         """
         nh4 = self.total_ammonia_nitrogen_nh4_SPREAD(animal)
 
-        return nh4 * self.data_manager_class.get_daily_spreading(animal.daily_spreading)()
+        spreading = self.data_manager_class.factor_table.daily_spreading[animal.daily_spreading]
+
+        return graph.nh3_emissions_per_year_SPREAD(nh4, spreading)
 
     def leach_nitrogen_SPREAD(self, animal):
         """
@@ -983,9 +997,7 @@ class DailySpread:
         Returns:
             float: Nitrogen leached from daily spreading, in kilograms per year.
         """
-        ten_percent_nex = 0.1
-
-        return self.net_excretion_SPREAD(animal) * ten_percent_nex
+        return graph.leach_nitrogen_SPREAD(self.net_excretion_SPREAD(animal))
 
     def leach_phospherous_SPREAD(self, animal):
         """
@@ -997,7 +1009,7 @@ class DailySpread:
         Returns:
             float: Phosphorus leached from daily spreading, in kilograms per year.
         """
-        return (self.net_excretion_SPREAD(animal) * (1.8 / 5)) * 0.03
+        return graph.leach_phospherous_SPREAD(self.net_excretion_SPREAD(animal))
 
     def SPREAD_N2O_indirect(self, animal):
         """
@@ -1009,13 +1021,13 @@ class DailySpread:
         Returns:
             float: Indirect nitrous oxide emissions from daily spreading, in kilograms per year.
         """
-        indirect_atmosphere = self.data_manager_class.get_cohort_parameter(animal.cohort, "atmospheric_deposition")()
-        indirect_leaching = self.data_manager_class.get_cohort_parameter(animal.cohort, "leaching")()
+        indirect_atmosphere = self.data_manager_class.factor_table.cohort[animal.cohort]["atmospheric_deposition"]
+        indirect_leaching = self.data_manager_class.factor_table.cohort[animal.cohort]["leaching"]
 
         NH3 = self.nh3_emissions_per_year_SPREAD(animal)
         NL = self.leach_nitrogen_SPREAD(animal)
 
-        return (NH3 * indirect_atmosphere) + (NL * indirect_leaching)
+        return graph.SPREAD_N2O_indirect(NH3, NL, indirect_atmosphere, indirect_leaching)
 
 
 ###############################################################################
@@ -1046,7 +1058,7 @@ class FertiliserInputs:
         p_fertiliser_P_leach: Calculates phosphorus leached from phosphorus fertiliser application.
     """
     def __init__(self, ef_country):
-        self.data_manager_class = LCADataManager(ef_country)
+        self.data_manager_class = LCADataManagerRegistry.get_data_manager(ef_country)
 
     # Urea Fertiliser
     def urea_N2O_direct(self, total_urea, total_urea_abated):
@@ -1316,7 +1328,7 @@ class Upstream:
         fert_upstream_EP: Estimates PO4 emissions from the production of various fertilisers.
     """
     def __init__(self, ef_country):
-        self.data_manager_class = LCADataManager(ef_country)
+        self.data_manager_class = LCADataManagerRegistry.get_data_manager(ef_country)
 
     def co2_from_concentrate_production(self, animal):
         """
@@ -1742,14 +1754,16 @@ class ClimateChangeTotals:
         storage_class (StorageStage): Manages manure storage-related calculations.
         fertiliser_class (FertiliserInputs): Manages fertiliser input-related calculations.
         upstream_class (Upstream): Manages upstream emissions calculations.
+        context (EvaluationContext): Optional cache of per-animal terms shared by all of the stage classes above.
     """
-    def __init__(self, ef_country):
-        self.data_manager_class = LCADataManager(ef_country)
-        self.grass_feed_class = GrassFeed(ef_country)
-        self.grazing_class = GrazingStage(ef_country)
-        self.spread_class = DailySpread(ef_country)
-        self.housing_class = HousingStage(ef_country)
-        self.storage_class = StorageStage(ef_country)
+    def __init__(self, ef_country, context=None):
+        self.data_manager_class = LCADataManagerRegistry.get_data_manager(ef_country)
+        self.grass_feed_class = GrassFeed(ef_country, context)
+        self.grazing_class = GrazingStage(ef_country, context)
+        self.spread_class = DailySpread(ef_country, context)
+        self.housing_class = HousingStage(ef_country, context)
+        self.storage_class = StorageStage(ef_country, context)
+        self.context = context
         self.fertiliser_class = FertiliserInputs(ef_country)
         self.upstream_class = Upstream(ef_country)
 
@@ -1763,38 +1777,23 @@ class ClimateChangeTotals:
         Returns:
             dict: A dictionary of dictionaries for organizing emissions data.
         """
-        key_list = [
-            "enteric_ch4",
-            "manure_management_N2O",
-            "manure_management_CH4",
-            "manure_applied_N",
-            "N_direct_PRP",
-            "N_direct_PRP",
-            "N_indirect_PRP",
-            "N_direct_fertiliser",
-            "N_indirect_fertiliser",
-            "soils_CO2",
-            "soil_organic_N_direct",
-            "soil_organic_N_indirect",
-            "soil_inorganic_N_direct",
-            "soil_inorganic_N_indirect",
-            "soil_histosol_N_direct",
-            "crop_residue_direct",
-            "soil_N_direct",
-            "soil_N_indirect",
-            "soils_N2O",
-        ]
-
-        keys_dict = dict.fromkeys(keys)
-
-        emissions_dict = dict.fromkeys(key_list)
-
-        for key in emissions_dict.keys():
-            emissions_dict[key] = copy.deepcopy(keys_dict)
-            for inner_k in keys_dict.keys():
-                emissions_dict[key][inner_k] = 0
-
-        return emissions_dict
+        return {category: dict.fromkeys(keys, 0) for category in CLIMATE_CHANGE_CATEGORIES}
+
+    def create_emissions_table(self, keys):
+        """
+        Creates an array-backed template for emissions calculations, with the categories of create_emissions_dictionary
+        and zero-initialized values. Each category can be assigned as a vector aligned with keys, and the dictionary
+        layout is only built by its to_dict method.
+
+        Parameters:
+            keys (list): List of animal cohorts or other categories for emissions calculation.
+
+        Returns:
+            EmissionsTable: A table of the values of each category and key.
+        """
+        from sheep_lca.emissions_table import EmissionsTable
+
+        return EmissionsTable(CLIMATE_CHANGE_CATEGORIES, keys)
     
 
     def create_expanded_emissions_dictionary(self, keys):
@@ -1808,41 +1807,21 @@ class ClimateChangeTotals:
         Returns:
             dict: An expanded dictionary of dictionaries for organizing detailed emissions data.
         """
-        key_list = [
-            "enteric_ch4",
-            "manure_management_N2O",
-            "manure_management_CH4",
-            "manure_applied_N",
-            "N_direct_PRP",
-            "N_direct_PRP",
-            "N_indirect_PRP",
-            "N_direct_fertiliser",
-            "N_indirect_fertiliser",
-            "soils_CO2",
-            "soil_organic_N_direct",
-            "soil_organic_N_indirect",
-            "soil_inorganic_N_direct",
-            "soil_inorganic_N_indirect",
-            "soil_N_direct",
-            "soil_N_indirect",
-            "soil_histosol_N_direct",
-            "crop_residue_direct",
-            "soils_N2O",
-            "upstream_fuel_fert",
-            "upstream_feed",
-            "upstream",
-        ]
-
-        keys_dict = dict.fromkeys(keys)
-
-        emissions_dict = dict.fromkeys(key_list)
-
-        for key in emissions_dict.keys():
-            emissions_dict[key] = copy.deepcopy(keys_dict)
-            for inner_k in keys_dict.keys():
-                emissions_dict[key][inner_k] = 0
-
-        return emissions_dict
+        return {category: dict.fromkeys(keys, 0) for category in CLIMATE_CHANGE_EXPANDED_CATEGORIES}
+
+    def create_expanded_emissions_table(self, keys):
+        """
+        Creates an array-backed template with the categories of create_expanded_emissions_dictionary.
+
+        Parameters:
+            keys (list): List of animal cohorts or other categories for detailed emissions calculation.
+
+        Returns:
+            EmissionsTable: A table of the values of each category and key.
+        """
+        from sheep_lca.emissions_table import EmissionsTable
+
+        return EmissionsTable(CLIMATE_CHANGE_EXPANDED_CATEGORIES, keys)
     
 
     def Enteric_CH4(self, animal):
@@ -2171,10 +2150,12 @@ class EutrophicationTotals:
         spread_class (DailySpread): An instance of the DailySpread class to access spreading-related eutrophication contributions.
         fertiliser_class (FertiliserInputs): An instance of the FertiliserInputs class to access fertiliser-related eutrophication contributions.
         upstream_class (Upstream): An instance of the Upstream class to access upstream-related eutrophication contributions.
+        context (EvaluationContext): Optional cache of per-animal terms shared by all of the stage classes above.
 
     Methods:
         create_emissions_dictionary(keys): Creates a structured dictionary for tracking eutrophication emissions.
         create_expanded_emissions_dictionary(keys): Creates a more detailed structured dictionary for tracking eutrophication emissions, including upstream processes.
+        create_emissions_table(keys) and create_expanded_emissions_table(keys): Create array-backed tables with the same categories.
         total_manure_NH3_EP(animal): Calculates the total ammonia emissions from manure management, converted to phosphate equivalents.
         total_fertiliser_soils_NH3_and_LEACH_EP(total_urea, total_urea_abated, total_n_fert): Calculates total ammonia and leaching from fertiliser application to soils, converted to phosphate equivalents.
         total_grazing_soils_NH3_and_LEACH_EP(animal): Calculates total ammonia and leaching from grazing management to soils, converted to phosphate equivalents.
@@ -2185,14 +2166,15 @@ class EutrophicationTotals:
         upstream_and_inputs_and_fuel_po4(diesel_kg, elec_kwh, total_n_fert, total_urea, total_urea_abated, total_p_fert, total_k_fert, total_lime_fert): Calculates total eutrophication potential from upstream activities and inputs, including fuel and electricity usage.
         po4_from_concentrate_production(animal): Calculates total phosphorus emissions from concentrate production used in animal diets.
     """
-    def __init__(self, ef_country):
-        self.data_manager_class = LCADataManager(ef_country)
-        self.grazing_class = GrazingStage(ef_country)
-        self.housing_class = HousingStage(ef_country)
-        self.storage_class = StorageStage(ef_country)
-        self.spread_class = DailySpread(ef_country)
+    def __init__(self, ef_country, context=None):
+        self.data_manager_class = LCADataManagerRegistry.get_data_manager(ef_country)
+        self.grazing_class = GrazingStage(ef_country, context)
+        self.housing_class = HousingStage(ef_country, context)
+        self.storage_class = StorageStage(ef_country, context)
+        self.spread_class = DailySpread(ef_country, context)
         self.fertiliser_class = FertiliserInputs(ef_country)
         self.upstream_class = Upstream(ef_country)
+        self.context = context
     
     def create_emissions_dictionary(self, keys):
         """
@@ -2204,21 +2186,22 @@ class EutrophicationTotals:
         Returns:
             A dictionary with initialized values for each key and sub-key.
         """
-        key_list = [
-            "manure_management",
-            "soils",
-        ]
+        return {category: dict.fromkeys(keys, 0) for category in EUTROPHICATION_CATEGORIES}
 
-        keys_dict = dict.fromkeys(keys)
+    def create_emissions_table(self, keys):
+        """
+        Creates an array-backed table to store eutrophication emissions data, with the categories of
+        create_emissions_dictionary.
 
-        emissions_dict = dict.fromkeys(key_list)
+        Parameters:
+            keys: A list of keys representing different farm activities or emission sources.
 
-        for key in emissions_dict.keys():
-            emissions_dict[key] = copy.deepcopy(keys_dict)
-            for inner_k in keys_dict.keys():
-                emissions_dict[key][inner_k] = 0
+        Returns:
+            An EmissionsTable with zero values for each category and key.
+        """
+        from sheep_lca.emissions_table import EmissionsTable
 
-        return emissions_dict
+        return EmissionsTable(EUTROPHICATION_CATEGORIES, keys)
     
 
     def create_expanded_emissions_dictionary(self, keys):
@@ -2231,24 +2214,21 @@ class EutrophicationTotals:
         Returns:
             An expanded dictionary with initialized values for each category and sub-category.
         """
-        key_list = [
-            "manure_management",
-            "soils",
-            "upstream_fuel_fert",
-            "upstream_feed",
-            "upstream",
-        ]
+        return {category: dict.fromkeys(keys, 0) for category in EUTROPHICATION_EXPANDED_CATEGORIES}
 
-        keys_dict = dict.fromkeys(keys)
+    def create_expanded_emissions_table(self, keys):
+        """
+        Creates an array-backed table with the categories of create_expanded_emissions_dictionary.
 
-        emissions_dict = dict.fromkeys(key_list)
+        Parameters:
+            keys: A list of keys representing different farm activities or emission sources.
 
-        for key in emissions_dict.keys():
-            emissions_dict[key] = copy.deepcopy(keys_dict)
-            for inner_k in keys_dict.keys():
-                emissions_dict[key][inner_k] = 0
+        Returns:
+            An EmissionsTable with zero values for each category and key, including the upstream categories.
+        """
+        from sheep_lca.emissions_table import EmissionsTable
 
-        return emissions_dict
+        return EmissionsTable(EUTROPHICATION_EXPANDED_CATEGORIES, keys)
 
     # Manure Management
     def total_manure_NH3_EP(self, animal):
@@ -2508,15 +2488,17 @@ class AirQualityTotals:
         storage_class (StorageStage): A class instance to calculate emissions from manure storage practices.
         spread_class (DailySpread): A class instance to calculate emissions from manure spreading practices.
         fertiliser_class (FertiliserInputs): A class instance to calculate emissions from fertiliser application.
+        context (EvaluationContext): Optional cache of per-animal terms shared by all of the stage classes above.
     """
-    def __init__(self, ef_country):
-        self.data_manager_class = LCADataManager(ef_country)
-        self.grazing_class = GrazingStage(ef_country)
-        self.housing_class = HousingStage(ef_country)
-        self.storage_class = StorageStage(ef_country)
-        self.spread_class = DailySpread(ef_country)
+    def __init__(self, ef_country, context=None):
+        self.data_manager_class = LCADataManagerRegistry.get_data_manager(ef_country)
+        self.grazing_class = GrazingStage(ef_country, context)
+        self.housing_class = HousingStage(ef_country, context)
+        self.storage_class = StorageStage(ef_country, context)
+        self.spread_class = DailySpread(ef_country, context)
         self.fertiliser_class = FertiliserInputs(ef_country)
         self.upstream_class = Upstream(ef_country)
+        self.context = context
 
 
     def create_emissions_dictionary(self, keys):
@@ -2529,21 +2511,21 @@ class AirQualityTotals:
         Returns:
             dict: A nested dictionary structured to hold emission values.
         """
-        key_list = [
-            "manure_management",
-            "soils",
-        ]
+        return {category: dict.fromkeys(keys, 0) for category in AIR_QUALITY_CATEGORIES}
 
-        keys_dict = dict.fromkeys(keys)
+    def create_emissions_table(self, keys):
+        """
+        Creates an array-backed table to store NH3 emission values, with the categories of create_emissions_dictionary.
 
-        emissions_dict = dict.fromkeys(key_list)
+        Parameters:
+            keys (list): A list of keys, such as farms or scenarios, to hold emission values for.
 
-        for key in emissions_dict.keys():
-            emissions_dict[key] = copy.deepcopy(keys_dict)
-            for inner_k in keys_dict.keys():
-                emissions_dict[key][inner_k] = 0
+        Returns:
+            EmissionsTable: A table of the values of each category and key.
+        """
+        from sheep_lca.emissions_table import EmissionsTable
 
-        return emissions_dict
+        return EmissionsTable(AIR_QUALITY_CATEGORIES, keys)
     
 
     # Manure Management
@@ -0,0 +1,113 @@
+"""
+Parallel LCA Module
+-------------------
+
+This module contains the ParallelFarmEvaluator class, which spreads the evaluation of a batch of farms across a pool of
+worker processes. The farms are split into chunks and each chunk is evaluated by a FarmBatchEvaluator living in a worker.
+
+The data managers are never sent to the workers: each worker loads the country data once, in its initializer, and reuses
+it for every chunk it receives. Only the animal collections, the farm data and the result rows cross process boundaries.
+Results are returned in the same farm order as FarmBatchEvaluator.evaluate, regardless of the number of workers.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from sheep_lca.batch_lca import FarmBatchEvaluator, pair_farm_data
+
+# The evaluator of the current worker process, created by _initialise_worker
+_worker_evaluator = None
+
+
+def _initialise_worker(ef_country, farm_input_columns):
+    """
+    Creates the evaluator of a worker process, loading the country data once for the lifetime of the worker.
+
+    Args:
+        ef_country (str): The emissions factor country.
+        farm_input_columns (dict): The farm input mapping passed to FarmBatchEvaluator.
+    """
+    global _worker_evaluator
+    _worker_evaluator = FarmBatchEvaluator(ef_country, farm_input_columns)
+
+
+def _evaluate_chunk(chunk):
+    """
+    Evaluates a chunk of farms in a worker process.
+
+    Args:
+        chunk (list): (animal_collection, farm) pairs, either of which may be None.
+
+    Returns:
+        list: The result row of each farm in the chunk.
+    """
+    return [
+        _worker_evaluator.evaluate_farm(animal_collection, farm)
+        for animal_collection, farm in chunk
+    ]
+
+
+class ParallelFarmEvaluator:
+    """
+    Evaluates the climate change, eutrophication and air quality totals for a batch of farms using a pool of worker
+    processes.
+
+    The results are identical to those of FarmBatchEvaluator, with one row per farm in the same order.
+
+    Attributes:
+        ef_country (str): The emissions factor country.
+        max_workers (int): The number of worker processes.
+        chunk_size (int): The number of farms sent to a worker at a time.
+        farm_input_columns (dict): Overrides for the farm input mapping of FarmBatchEvaluator.
+
+    Args:
+        ef_country (str): The emissions factor country.
+        max_workers (int, optional): The number of worker processes. Defaults to the number of CPUs.
+        chunk_size (int, optional): The number of farms sent to a worker at a time. Defaults to 64.
+        farm_input_columns (dict, optional): Overrides for the farm input mapping of FarmBatchEvaluator.
+
+    Methods:
+        evaluate(animals, farms=None): Returns a DataFrame of every impact category, indexed by farm_id.
+    """
+    def __init__(self, ef_country, max_workers=None, chunk_size=64, farm_input_columns=None):
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+
+        self.ef_country = ef_country
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.farm_input_columns = farm_input_columns
+
+    def evaluate(self, animals, farms=None):
+        """
+        Evaluates every impact category for each farm across the worker pool.
+
+        Parameters:
+            animals (dict or pandas.DataFrame): The output of load_livestock_data, or livestock data in the format it accepts.
+            farms (dict or pandas.DataFrame, optional): The output of load_farm_data, or farm data in the format it accepts.
+
+        Returns:
+            pandas.DataFrame: One row per farm, indexed by farm_id, in order of first appearance in the livestock data
+            followed by any farms that only appear in the farm data.
+        """
+        farm_ids, work = pair_farm_data(animals, farms)
+
+        chunks = [
+            work[start:start + self.chunk_size]
+            for start in range(0, len(work), self.chunk_size)
+        ]
+
+        rows = []
+
+        if chunks:
+            with ProcessPoolExecutor(
+                max_workers=min(self.max_workers, len(chunks)),
+                initializer=_initialise_worker,
+                initargs=(self.ef_country, self.farm_input_columns),
+            ) as executor:
+                # map yields in submission order, so the farm order does not depend on scheduling
+                for chunk_rows in executor.map(_evaluate_chunk, chunks):
+                    rows.extend(chunk_rows)
+
+        return pd.DataFrame(rows, index=pd.Index(farm_ids, name="farm_id"))
@@ -0,0 +1,243 @@
+"""
+Arrow Reader Module
+-------------------
+
+This module reads livestock and farm data from Apache Parquet and Arrow IPC files, as an alternative to building the pandas
+DataFrames accepted by load_livestock_data, load_farm_data and the batch evaluators in memory first.
+
+Only the columns of the AnimalCategory and Farm schemas (ANIMAL_CATEGORY_FIELDS and FARM_FIELDS) are read, so any other
+columns of a national dataset are never loaded, and the categorical columns (cohort, forage, grazing, con_type,
+mm_storage, daily_spreading and ef_country) are returned as pandas categoricals, which hold each distinct string once.
+Columns of the schema that a file does not have are left out, and take their AnimalCategory defaults as they would from a
+DataFrame.
+
+Files can be read whole, with read_livestock_data and read_farm_data, or as a sequence of DataFrames of at most batch_size
+rows with iter_livestock_batches and iter_farm_batches. Parquet files are read row group by row group, so the batches of a
+file larger than memory can be processed in turn.
+
+pyarrow is an optional dependency, imported when a file is first read. Install it with the "arrow" extra.
+"""
+from sheep_lca.resource_manager.models import ANIMAL_CATEGORY_FIELDS, FARM_FIELDS
+
+# The columns read from livestock and farm files
+LIVESTOCK_COLUMNS = ANIMAL_CATEGORY_FIELDS
+FARM_COLUMNS = FARM_FIELDS
+
+# The columns returned as pandas categoricals
+CATEGORICAL_COLUMNS = ("ef_country", "cohort", "forage", "grazing", "con_type", "mm_storage", "daily_spreading")
+
+# The default number of rows in each batch
+DEFAULT_BATCH_SIZE = 65536
+
+# The file format of each file extension; Arrow IPC files use the random access format and .arrows the stream format
+FORMATS = {
+    ".parquet": "parquet",
+    ".pq": "parquet",
+    ".arrow": "ipc",
+    ".feather": "ipc",
+    ".ipc": "ipc",
+    ".arrows": "stream",
+}
+
+
+def import_pyarrow():
+    """
+    Imports pyarrow, with a clear message if the optional dependency is not installed.
+
+    Returns:
+        module: The pyarrow module.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+    """
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError(
+            "pyarrow is required to read and write Parquet and Arrow files; install sheep_lca with the 'arrow' extra"
+        ) from None
+
+    return pyarrow
+
+
+def resolve_file_format(source, file_format=None):
+    """
+    Returns the format of a file: the given one, or the one implied by the extension of its path.
+
+    Args:
+        source (str or file-like): The path of the file.
+        file_format (str, optional): "parquet", "ipc" or "stream".
+
+    Returns:
+        str: "parquet", "ipc" or "stream".
+
+    Raises:
+        ValueError: If the given format is unknown, or none is given and the extension does not imply one.
+    """
+    if file_format is not None:
+        if file_format not in set(FORMATS.values()):
+            raise ValueError(f"unknown file format {file_format!r}, expected one of 'parquet', 'ipc' or 'stream'")
+
+        return file_format
+
+    path = str(source).lower()
+
+    for extension, extension_format in FORMATS.items():
+        if path.endswith(extension):
+            return extension_format
+
+    raise ValueError(f"cannot tell the format of {source!r} from its extension; pass file_format")
+
+
+def _projection(schema, columns):
+    """
+    Returns the requested columns that the schema has, in the requested order.
+    """
+    names = set(schema.names)
+
+    return [column for column in columns if column in names]
+
+
+def iter_record_batches(source, columns, batch_size=DEFAULT_BATCH_SIZE, file_format=None):
+    """
+    Reads the selected columns of a Parquet or Arrow IPC file as Arrow record batches of at most batch_size rows.
+
+    Args:
+        source (str or file-like): The path of the file, or an open file.
+        columns (iterable): The columns to read. Columns the file does not have are skipped.
+        batch_size (int, optional): The maximum number of rows in a batch. Defaults to DEFAULT_BATCH_SIZE.
+        file_format (str, optional): "parquet", "ipc" or "stream". Defaults to the format implied by the file extension.
+
+    Yields:
+        pyarrow.RecordBatch: The next batch of rows.
+
+    Raises:
+        ValueError: If the format is unknown, or batch_size is less than 1.
+    """
+    pyarrow = import_pyarrow()
+    file_format = resolve_file_format(source, file_format)
+
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+
+    if file_format == "parquet":
+        import pyarrow.parquet
+
+        parquet_file = pyarrow.parquet.ParquetFile(source)
+        projection = _projection(parquet_file.schema_arrow, columns)
+
+        yield from parquet_file.iter_batches(batch_size=batch_size, columns=projection)
+        return
+
+    import pyarrow.ipc
+
+    if file_format == "ipc":
+        reader = pyarrow.ipc.open_file(source)
+        batches = (reader.get_batch(index) for index in range(reader.num_record_batches))
+    else:
+        reader = pyarrow.ipc.open_stream(source)
+        batches = iter(reader)
+
+    projection = _projection(reader.schema, columns)
+
+    # IPC batches are stored as written, so large ones are sliced, which does not copy
+    for batch in batches:
+        batch = batch.select(projection)
+
+        for offset in range(0, batch.num_rows, batch_size):
+            yield batch.slice(offset, batch_size)
+
+
+def _to_pandas(data, **options):
+    """
+    Converts an Arrow table or record batch to pandas, with the categorical columns as pandas categoricals.
+    """
+    categories = [column for column in CATEGORICAL_COLUMNS if column in data.schema.names]
+
+    return data.to_pandas(categories=categories, **options)
+
+
+def _read_table(source, columns, file_format):
+    """
+    Reads the selected columns of a whole file as an Arrow table.
+    """
+    pyarrow = import_pyarrow()
+    file_format = resolve_file_format(source, file_format)
+
+    if file_format == "parquet":
+        import pyarrow.parquet
+
+        schema = pyarrow.parquet.read_schema(source)
+
+        return pyarrow.parquet.read_table(source, columns=_projection(schema, columns))
+
+    import pyarrow.ipc
+
+    reader = pyarrow.ipc.open_file(source) if file_format == "ipc" else pyarrow.ipc.open_stream(source)
+
+    return reader.read_all().select(_projection(reader.schema, columns))
+
+
+def iter_livestock_batches(source, columns=LIVESTOCK_COLUMNS, batch_size=DEFAULT_BATCH_SIZE, file_format=None):
+    """
+    Reads livestock data from a Parquet or Arrow IPC file in batches.
+
+    Args:
+        source (str or file-like): The path of the file, or an open file.
+        columns (iterable, optional): The columns to read. Defaults to the AnimalCategory schema.
+        batch_size (int, optional): The maximum number of rows in a batch. Defaults to DEFAULT_BATCH_SIZE.
+        file_format (str, optional): "parquet", "ipc" or "stream". Defaults to the format implied by the file extension.
+
+    Yields:
+        pandas.DataFrame: The next batch of livestock rows, in the format accepted by load_livestock_data.
+    """
+    for batch in iter_record_batches(source, columns, batch_size, file_format):
+        yield _to_pandas(batch)
+
+
+def iter_farm_batches(source, columns=FARM_COLUMNS, batch_size=DEFAULT_BATCH_SIZE, file_format=None):
+    """
+    Reads farm data from a Parquet or Arrow IPC file in batches.
+
+    Args:
+        source (str or file-like): The path of the file, or an open file.
+        columns (iterable, optional): The columns to read. Defaults to the Farm schema.
+        batch_size (int, optional): The maximum number of rows in a batch. Defaults to DEFAULT_BATCH_SIZE.
+        file_format (str, optional): "parquet", "ipc" or "stream". Defaults to the format implied by the file extension.
+
+    Yields:
+        pandas.DataFrame: The next batch of farm rows, in the format accepted by load_farm_data.
+    """
+    for batch in iter_record_batches(source, columns, batch_size, file_format):
+        yield _to_pandas(batch)
+
+
+def read_livestock_data(source, columns=LIVESTOCK_COLUMNS, file_format=None):
+    """
+    Reads the livestock data of a Parquet or Arrow IPC file.
+
+    Args:
+        source (str or file-like): The path of the file, or an open file.
+        columns (iterable, optional): The columns to read. Defaults to the AnimalCategory schema.
+        file_format (str, optional): "parquet", "ipc" or "stream". Defaults to the format implied by the file extension.
+
+    Returns:
+        pandas.DataFrame: The livestock data, in the format accepted by load_livestock_data and the batch evaluators.
+    """
+    # the Arrow buffers are released column by column as they are converted, rather than held until the end
+    return _to_pandas(_read_table(source, columns, file_format), self_destruct=True, split_blocks=True)
+
+
+def read_farm_data(source, columns=FARM_COLUMNS, file_format=None):
+    """
+    Reads the farm data of a Parquet or Arrow IPC file.
+
+    Args:
+        source (str or file-like): The path of the file, or an open file.
+        columns (iterable, optional): The columns to read. Defaults to the Farm schema.
+        file_format (str, optional): "parquet", "ipc" or "stream". Defaults to the format implied by the file extension.
+
+    Returns:
+        pandas.DataFrame: The farm data, in the format accepted by load_farm_data and the batch evaluators.
+    """
+    return _to_pandas(_read_table(source, columns, file_format), self_destruct=True, split_blocks=True)
@@ -0,0 +1,120 @@
+"""
+Multi-Country Store Module
+--------------------------
+
+This module contains the MultiCountryStore class, which reads the reference data of every emissions factor country in the
+sheep database in a single bulk load and holds an LCADataManager for each country, indexed by ef_country.
+
+Comparing countries otherwise means building a separate LCADataManager, and its own round of database reads, per country.
+With a store, the generic tables are read once and shared, the country-specific tables are read once for all countries and
+split by ef_country, and a mixed-country livestock table can be evaluated in one batched run by the vectorised classes,
+which resolve the factors of each row from that row's ef_country.
+"""
+from types import MappingProxyType
+
+from sheep_lca.resource_manager.data_loader import Loader
+from sheep_lca.resource_manager.sheep_lca_data_manager import LCADataManager, LCADataManagerRegistry
+
+
+class MultiCountryStore:
+    """
+    The reference data of several emissions factor countries, loaded at once and indexed by country.
+
+    Attributes:
+        country_tables (tuple): The reference data names, as in DataManager.tables, that are filtered by country.
+        countries (tuple): The emissions factor countries held by the store, in database order.
+        data_managers (Mapping): The read-only LCADataManager of each country, keyed by ef_country.
+        timings (dict): The time in seconds spent reading each table during the bulk load.
+
+    Args:
+        countries (iterable, optional): The countries to hold. Defaults to every country in the emissions factors table.
+
+    Raises:
+        ValueError: If a requested country has no emissions factors in the database.
+
+    Methods:
+        get_data_manager(ef_country): Returns the LCADataManager of a country.
+        get_cohort_keys(): Returns the names of the sheep cohorts, which are the same for every country.
+        register(): Hands the data managers of the store to the LCADataManagerRegistry, so that the stage classes reuse them.
+    """
+    country_tables = ("emissions_factors", "animal_features")
+
+    def __init__(self, countries=None):
+        from sheep_lca.resource_manager.database_manager import DataManager
+
+        database = DataManager(None)
+        dataframes = database.bulk_load(all_countries=True)
+        self.timings = database.timings
+
+        by_country = {
+            name: {
+                country: frame.reset_index(drop=True)
+                for country, frame in dataframes[name].groupby("ef_country", sort=False)
+            }
+            for name in self.country_tables
+        }
+
+        available = tuple(by_country["emissions_factors"])
+
+        if countries is None:
+            countries = available
+        else:
+            countries = tuple(countries)
+            missing = [country for country in countries if country not in available]
+
+            if missing:
+                raise ValueError(f"No reference data for ef_country: {', '.join(map(repr, missing))}")
+
+        self.countries = countries
+
+        data_managers = {}
+
+        for country in countries:
+            country_dataframes = dict(dataframes)
+
+            for name in self.country_tables:
+                country_dataframes[name] = by_country[name].get(country, dataframes[name].iloc[:0])
+
+            data_managers[country] = LCADataManager(
+                country, loader=Loader(country, dataframes=country_dataframes)
+            )
+
+        self.data_managers = MappingProxyType(data_managers)
+
+    def __contains__(self, ef_country):
+        return ef_country in self.data_managers
+
+    def get_data_manager(self, ef_country):
+        """
+        Returns the data manager of a country.
+
+        Args:
+            ef_country (str): The emissions factor country.
+
+        Returns:
+            LCADataManager: The data manager of the country.
+
+        Raises:
+            KeyError: If the country is not held by the store.
+        """
+        try:
+            return self.data_managers[ef_country]
+        except KeyError:
+            raise KeyError(f"ef_country {ef_country!r} is not in the store") from None
+
+    def get_cohort_keys(self):
+        """
+        Retrieves the names of the sheep cohorts. The cohorts are defined by LCADataManager and do not depend on the country.
+
+        Returns:
+            list: A list of all sheep cohort names.
+        """
+        return list(self.data_managers[self.countries[0]].get_cohort_keys())
+
+    def register(self):
+        """
+        Hands the data manager of every country in the store to the LCADataManagerRegistry, so that stage and totals classes
+        constructed for those countries reuse them instead of loading the database again.
+        """
+        for country, data_manager in self.data_managers.items():
+            LCADataManagerRegistry.register(country, data_manager)
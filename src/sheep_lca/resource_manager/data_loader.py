@@ -4,8 +4,11 @@ Data Loader Module
 
 This module contains the Loader class, which is responsible for loading and providing access to various data categories required for 
 lifecycle assessment (LCA) calculations.
+
+When a cache directory is configured (see the reference_cache module), the parsed data is read from the cache when it is current, 
+and the database, SQLAlchemy and pandas are only used to build the cache. Otherwise every table is read in a single bulk load.
 """
-from sheep_lca.resource_manager.database_manager import DataManager
+from sheep_lca.resource_manager.reference_cache import ReferenceDataCache
 from sheep_lca.resource_manager.models import (
     Animal_Features,
     Grass,
@@ -24,7 +27,8 @@ class Loader:
 
     Attributes:
         ef_country (str): A string representing the country for which the emission factors and related data are to be loaded.
-        dataframes (DataManager): An instance of DataManager initialized with the country-specific data.
+        dataframes (DataManager): An instance of DataManager initialized with the country-specific data, created on first use.
+        cache (ReferenceDataCache): The on-disk cache of parsed data, or None if caching is not enabled.
         grass (Grass): An object containing grass-related data.
         animal_features (Animal_Features): An object containing data related to animal features.
         concentrates (Concentrate): An object containing data related to concentrates (animal feed).
@@ -33,6 +37,10 @@ class Loader:
 
     Args:
         ef_country (str): The country identifier used to retrieve country-specific data for LCA calculations.
+        cache_dir (str, optional): A directory for the on-disk cache of parsed data. Defaults to the SHEEP_LCA_CACHE_DIR 
+            environment variable; caching is disabled when neither is set.
+        dataframes (dict, optional): Reference tables already read for this country, keyed as in DataManager.tables. When 
+            given, neither the database nor the cache is used.
 
     Methods:
         get_grass(): Initializes and returns an instance of the Grass class containing grass-related data.
@@ -41,14 +49,65 @@ class Loader:
         get_emissions_factors(): Initializes and returns an instance of the Emissions_Factors class containing various emissions factors data.
         get_upstream(): Initializes and returns an instance of the Upstream class containing upstream data related to various inputs and processes.
     """
-    def __init__(self, ef_country):
+    def __init__(self, ef_country, cache_dir=None, dataframes=None):
         self.ef_country = ef_country
-        self.dataframes = DataManager(ef_country)
-        self.grass = self.get_grass()
-        self.animal_features = self.get_animal_features()
-        self.concentrates = self.get_concentrates()
-        self.emissions_factors = self.get_emissions_factors()
-        self.upstream = self.get_upstream()
+        self._dataframes = None
+
+        if dataframes is not None:
+            self.cache = None
+            self._load_dataframes(dataframes)
+            return
+
+        self.cache = ReferenceDataCache.from_environment(cache_dir)
+
+        contents = self.cache.load(ef_country) if self.cache is not None else None
+
+        if contents is not None:
+            self.grass = Grass.from_parsed(contents["grass"])
+            self.animal_features = Animal_Features.from_parsed(contents["animal_features"])
+            self.concentrates = Concentrate.from_parsed(contents["concentrates"])
+            self.emissions_factors = Emissions_Factors.from_parsed(contents["emissions_factors"])
+            self.upstream = Upstream.from_parsed(contents["upstream"])
+        else:
+            self._load_dataframes(self.dataframes.bulk_load())
+
+            if self.cache is not None:
+                self.cache.store(
+                    ef_country,
+                    {
+                        "grass": self.grass.grasses,
+                        "animal_features": self.animal_features.animal_features,
+                        "concentrates": self.concentrates.concentrates,
+                        "emissions_factors": self.emissions_factors.emissions_factors,
+                        "upstream": self.upstream.upstream,
+                    },
+                )
+
+    @property
+    def dataframes(self):
+        """
+        DataManager: The database access for this country, created on first use so that cached loads do not import 
+        SQLAlchemy or pandas.
+        """
+        if self._dataframes is None:
+            from sheep_lca.resource_manager.database_manager import DataManager
+
+            self._dataframes = DataManager(self.ef_country)
+
+        return self._dataframes
+
+    def _load_dataframes(self, dataframes):
+        """
+        Builds the reference data objects from the tables returned by DataManager.bulk_load.
+
+        Args:
+            dataframes (dict): A DataFrame for each reference data name in DataManager.tables.
+        """
+        self.grass = Grass(dataframes["grass"])
+        self.animal_features = Animal_Features(dataframes["animal_features"])
+        self.concentrates = Concentrate(dataframes["concentrates"])
+        self.emissions_factors = Emissions_Factors(dataframes["emissions_factors"])
+        self.upstream = Upstream(dataframes["upstream"])
 
     def get_grass(self):
         """
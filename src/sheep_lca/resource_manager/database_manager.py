@@ -4,11 +4,17 @@ Database Manager Module
 
 This module contains the DataManager class, which is responsible for handling the retrieval of country-specific and generic data 
 from the SQL database for use in lifecycle assessment calculations.
+
+SQLAlchemy and pandas are imported when a DataManager is created or data is read, rather than when the module is imported, so that 
+importing the lca module stays cheap when the reference data comes from the cache.
+
+All queries are parameterised: the country is passed as a bound parameter and table names come from the fixed 
+DataManager.tables mapping. DataManager.bulk_load reads every reference table over a single connection and transaction, 
+recording how long each table took.
 """
-import sqlalchemy as sqa
-import pandas as pd
 from sheep_lca.database import get_local_dir
 import os
+import time
 
 
 class DataManager:
@@ -18,25 +24,38 @@ class DataManager:
     The data is returned as Pandas DataFrames for easy manipulation and access within the Python ecosystem.
 
     Attributes:
+        tables (dict): Maps each reference data name to its database table and whether the table is filtered by country.
         database_dir (str): Directory where the SQL database is stored.
         engine (sqa.engine.Engine): SQLAlchemy engine instance for connecting to the database.
         ef_country (str): The country identifier used to retrieve country-specific data.
+        timings (dict): The time in seconds spent reading each table during the last call to bulk_load.
 
     Args:
         ef_country (str): A string representing the country for which the data is to be loaded. It is used to filter the data in country-specific tables.
 
     Methods:
         data_engine_creater(): Initializes and returns a SQLAlchemy engine connected to the local sheep LCA database.
+        read_table(name, connection, index=None, all_countries=False): Reads one reference table over an open connection using a parameterised query.
+        bulk_load(all_countries=False): Reads every reference table over a single connection and transaction, recording the time taken by each.
         grass_data(index=None): Retrieves grass-related data from the database. Optional index parameter sets a column as DataFrame index.
         upstream_data(index=None): Retrieves upstream (pre-farm gate inputs and processes) data. Optional index parameter for DataFrame indexing.
         emissions_factor_data(index=None): Fetches emissions factors specific to the set country. Can set an index column if provided.
         concentrate_data(index=None): Gathers data regarding animal feed concentrates. Optional indexing with the index parameter.
         animal_features_data(index=None): Collects data related to the features of various animal types, filtered by country. Indexing option available.
     """    
+    tables = {
+        "grass": ("grass_database", False),
+        "animal_features": ("sheep_animal_features_database", True),
+        "concentrates": ("concentrate_database", False),
+        "emissions_factors": ("sheep_emissions_factors_database", True),
+        "upstream": ("upstream_database", False),
+    }
+
     def __init__(self, ef_country):
         self.database_dir = get_local_dir()
         self.engine = self.data_engine_creater()
         self.ef_country = ef_country
+        self.timings = {}
 
     def data_engine_creater(self):
         """
@@ -45,6 +64,8 @@ class DataManager:
         Returns:
             sqa.engine.Engine: SQLAlchemy engine instance for connecting to the database.
         """        
+        import sqlalchemy as sqa
+
         database_path = os.path.abspath(
             os.path.join(self.database_dir, "sheep_database.db")
         )
@@ -52,53 +73,89 @@ class DataManager:
 
         return sqa.create_engine(engine_url)
 
-    def grass_data(self, index=None):
+    def read_table(self, name, connection, index=None, all_countries=False):
         """
-        Retrieves grass-related data from the database. Optional index parameter sets a column as DataFrame index.
+        Reads one reference table over an open connection. Country-specific tables are filtered on ef_country, which is passed 
+        as a bound parameter rather than formatted into the query.
 
         Args:
+            name (str): The reference data name, one of the keys of DataManager.tables.
+            connection (sqa.engine.Connection): An open connection to the database.
             index (str): The column to use as the DataFrame index.
+            all_countries (bool): If True, country-specific tables are read for every country rather than filtered.
 
         Returns:
-            pd.DataFrame: A DataFrame containing grass-related data.
+            pd.DataFrame: A DataFrame containing the table, filtered by country where relevant.
         """        
-        table = "grass_database"
+        import pandas as pd
+        import sqlalchemy as sqa
 
-        if index == None:
-            dataframe = pd.read_sql("SELECT * FROM '%s'" % (table), self.engine)
+        table, country_specific = self.tables[name]
 
-        else:
-            dataframe = pd.read_sql(
-                "SELECT * FROM '%s'" % (table),
-                self.engine,
-                index_col=[index],
-            )
+        query = f'SELECT * FROM "{table}"'
+        params = {}
 
-        return dataframe
+        if country_specific and not all_countries:
+            query += " WHERE ef_country = :ef_country"
+            params["ef_country"] = self.ef_country
 
-    def upstream_data(self, index=None):
+        return pd.read_sql(
+            sqa.text(query),
+            connection,
+            params=params,
+            index_col=[index] if index is not None else None,
+        )
+
+    def bulk_load(self, all_countries=False):
         """
-        Retrieves upstream (pre-farm gate inputs and processes) data. Optional index parameter for DataFrame indexing.
+        Reads every reference table over a single connection, inside one transaction, so that the tables are consistent with 
+        each other and the connection is only set up once. The time spent on each table is stored in the timings attribute.
+
+        Args:
+            all_countries (bool): If True, country-specific tables are read for every country rather than filtered.
+
+        Returns:
+            dict: A DataFrame for each reference data name in DataManager.tables.
+        """        
+        dataframes = {}
+        timings = {}
+
+        with self.engine.connect() as connection:
+            with connection.begin():
+                for name in self.tables:
+                    start = time.perf_counter()
+                    dataframes[name] = self.read_table(name, connection, all_countries=all_countries)
+                    timings[name] = time.perf_counter() - start
+
+        self.timings = timings
+
+        return dataframes
+
+    def grass_data(self, index=None):
+        """
+        Retrieves grass-related data from the database. Optional index parameter sets a column as DataFrame index.
 
         Args:
             index (str): The column to use as the DataFrame index.
 
         Returns:
-            pd.DataFrame: A DataFrame containing upstream data.
+            pd.DataFrame: A DataFrame containing grass-related data.
         """        
-        table = "upstream_database"
+        with self.engine.connect() as connection:
+            return self.read_table("grass", connection, index)
 
-        if index == None:
-            dataframe = pd.read_sql("SELECT * FROM '%s'" % (table), self.engine)
+    def upstream_data(self, index=None):
+        """
+        Retrieves upstream (pre-farm gate inputs and processes) data. Optional index parameter for DataFrame indexing.
 
-        else:
-            dataframe = pd.read_sql(
-                "SELECT * FROM '%s'" % (table),
-                self.engine,
-                index_col=[index],
-            )
+        Args:
+            index (str): The column to use as the DataFrame index.
 
-        return dataframe
+        Returns:
+            pd.DataFrame: A DataFrame containing upstream data.
+        """        
+        with self.engine.connect() as connection:
+            return self.read_table("upstream", connection, index)
 
     def emissions_factor_data(self, index=None):
         """
@@ -110,22 +167,8 @@ class DataManager:
         Returns:
             pd.DataFrame: A DataFrame containing emissions factors data.
         """        
-        table = "sheep_emissions_factors_database"
-
-        if index == None:
-            dataframe = pd.read_sql(
-                "SELECT * FROM '%s' WHERE ef_country = '%s'" % (table, self.ef_country),
-                self.engine,
-            )
-
-        else:
-            dataframe = pd.read_sql(
-                "SELECT * FROM '%s' WHERE ef_country = '%s'" % (table, self.ef_country),
-                self.engine,
-                index_col=[index],
-            )
-
-        return dataframe
+        with self.engine.connect() as connection:
+            return self.read_table("emissions_factors", connection, index)
 
     def concentrate_data(self, index=None):
         """
@@ -137,19 +180,8 @@ class DataManager:
         Returns:
             pd.DataFrame: A DataFrame containing concentrate feed data.
         """        
-        table = "concentrate_database"
-
-        if index == None:
-            dataframe = pd.read_sql("SELECT * FROM '%s'" % (table), self.engine)
-
-        else:
-            dataframe = pd.read_sql(
-                "SELECT * FROM '%s'" % (table),
-                self.engine,
-                index_col=[index],
-            )
-
-        return dataframe
+        with self.engine.connect() as connection:
+            return self.read_table("concentrates", connection, index)
 
     def animal_features_data(self, index=None):
         """
@@ -161,19 +193,5 @@ class DataManager:
         Returns:
             pd.DataFrame: A DataFrame containing animal features data.
         """        
-        table = "sheep_animal_features_database"
-
-        if index == None:
-            dataframe = pd.read_sql(
-                "SELECT * FROM '%s' WHERE ef_country = '%s'" % (table, self.ef_country),
-                self.engine,
-            )
-
-        else:
-            dataframe = pd.read_sql(
-                "SELECT * FROM '%s' WHERE ef_country = '%s'" % (table, self.ef_country),
-                self.engine,
-                index_col=[index],
-            )
-
-        return dataframe
+        with self.engine.connect() as connection:
+            return self.read_table("animal_features", connection, index)
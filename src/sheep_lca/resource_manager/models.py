@@ -9,6 +9,8 @@ Classes:
     AnimalCategory: Represents different categories of animals on a farm, inheriting from DynamicData.
     AnimalCollection: Represents a collection of animal categories, inheriting from DynamicData.
     Farm: Represents a farm entity, inheriting from DynamicData.
+    LivestockData: A read-only mapping of farm ID to animal collection, built on demand from a livestock DataFrame.
+    FarmData: A read-only mapping of row position to Farm, built on demand from a farm DataFrame.
     Animal_Features: Contains all features related to animals used in lifecycle assessment.
     Emissions_Factors: Holds emissions factors data relevant to lifecycle assessment.
     Grass: Contains data about different types of grasses.
@@ -21,13 +23,77 @@ Functions:
     load_upstream_data(): Loads and returns upstream data.
     load_emissions_factors_data(): Loads and returns emissions factors data.
     load_animal_features_data(): Loads and returns animal features data.
-    load_farm_data(farm_data_frame): Takes a DataFrame and returns a dictionary of Farm objects.
-    load_livestock_data(animal_data_frame): Takes a DataFrame and returns a dictionary of AnimalCollection objects mapped by farm ID.
+    load_farm_data(farm_data_frame, lazy=False): Takes a DataFrame and returns a dictionary of Farm objects.
+    load_livestock_data(animal_data_frame, lazy=False): Takes a DataFrame and returns a dictionary of AnimalCollection objects mapped by farm ID.
     print_livestock_data(data): Utility function to print livestock data for debugging or logging.
 
 The classes mainly serve as containers for the data loaded from external sources like databases or CSV files, enabling structured access and manipulation of this data within the lifecycle assessment processes.
 """
-import pandas
+from collections.abc import Mapping
+import numbers
+
+
+# Default attribute values applied to every AnimalCategory before the row data is assigned
+ANIMAL_CATEGORY_DEFAULTS = {
+    "pop": 0,
+    "wool": 0,
+    "weight": 0,
+    "forage": "average",
+    "grazing": "pasture",
+    "con_type": "concentrate",
+    "con_amount": 0,
+    "t_outdoors": 24,
+    "t_indoors": 0,
+    "t_stabled": 0,
+    "mm_storage": "solid",
+    "daily_spreading": "none",
+    "n_sold": 0,
+    "n_bought": 0,
+    "meat_price_kg": 0,
+    "wool_price_kg": 0,
+}
+
+# The fixed schema of an AnimalCategory, stored in slots; an AnimalCategory has no per-instance __dict__
+ANIMAL_CATEGORY_FIELDS = (
+    "ef_country",
+    "farm_id",
+    "year",
+    "cohort",
+    "pop",
+    "weight",
+    "daily_milk",
+    "forage",
+    "grazing",
+    "con_type",
+    "con_amount",
+    "t_outdoors",
+    "t_indoors",
+    "wool",
+    "t_stabled",
+    "mm_storage",
+    "daily_spreading",
+    "n_sold",
+    "n_bought",
+    "meat_price_kg",
+    "wool_price_kg",
+)
+
+# The fixed schema of a Farm, stored in slots; a Farm has no per-instance __dict__
+FARM_FIELDS = (
+    "ef_country",
+    "farm_id",
+    "year",
+    "total_urea_kg",
+    "total_lime_kg",
+    "an_n_fert",
+    "urea_n_fert",
+    "total_urea_abated",
+    "total_p_fert",
+    "total_k_fert",
+    "diesel_kg",
+    "elec_kwh",
+)
+
 
 class DynamicData(object):
     """
@@ -39,23 +105,87 @@ class DynamicData(object):
     provides initial values for attributes, ensuring that the object has all necessary attributes with default values.
     The data dictionary contains actual values meant to override these defaults where applicable.
 
+    Subclasses with a known schema list it in fields and declare it, with _extras, as __slots__, so that those attributes
+    are stored compactly in an instance without a __dict__. Any other value in the data is kept in the extras mapping,
+    and can still be read as an attribute. Subclasses without a schema keep every attribute in the instance __dict__.
+
     Parameters:
         data (dict): A dictionary containing actual values for attributes of the instance. Keys correspond to attribute
                      names, and values correspond to the values those attributes should take.
         defaults (dict, optional): A dictionary containing default values for attributes of the instance. Keys
                                    correspond to attribute names, and values are the default values those attributes
-                                   should take. Defaults to an empty dictionary if not provided.
+                                   should take. Defaults to None, meaning no defaults.
 
     """
-    def __init__(self, data, defaults={}):
+    __slots__ = ("__weakref__",)
+
+    fields = ()
+
+    def __init__(self, data, defaults=None):
 
-        # Set the defaults first
-        for variable, value in defaults.items():
-            setattr(self, variable, value)
+        # Set the defaults that are not overwritten by a real value
+        if defaults is not None:
+            for variable, value in defaults.items():
+                if variable not in data:
+                    setattr(self, variable, value)
 
-        # Overwrite the defaults with the real values
+        # Set the real values
         for variable, value in data.items():
-            setattr(self, variable, value)
+            try:
+                setattr(self, variable, value)
+            except AttributeError:
+                # A slotted instance has no __dict__, so a value outside its schema goes to extras
+                self._add_extra(variable, value)
+
+    @property
+    def extras(self):
+        """
+        Returns the values of the data that are not fields of the schema, such as additional columns of the input data.
+
+        Returns:
+            dict: The names of the extra values and the values, empty if there are none.
+        """
+        try:
+            return self._extras
+        except AttributeError:
+            return {}
+
+    def __getattr__(self, name):
+        # Only called when the attribute is not found, so fields are read from their slots without this lookup
+        if name != "_extras":
+            try:
+                return self._extras[name]
+            except (AttributeError, KeyError):
+                pass
+
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+    def _add_extra(self, variable, value):
+        try:
+            self._extras[variable] = value
+        except AttributeError:
+            self._extras = {variable: value}
+
+    def to_dict(self):
+        """
+        Returns the attributes of the instance, the fixed schema fields first followed by any other attributes and extras.
+
+        Returns:
+            dict: The attribute names and their values.
+        """
+        values = {}
+
+        for field in self.fields:
+            try:
+                values[field] = getattr(self, field)
+            except AttributeError:
+                pass
+
+        values.update(getattr(self, "__dict__", {}))
+        values.pop("_extras", None)
+        values.update(self.extras)
+
+        return values
 
 
 class AnimalCategory(DynamicData):
@@ -85,33 +215,21 @@ class AnimalCategory(DynamicData):
         meat_price_kg (float): Price of meat per kilogram (default: 0.0).
         wool_price_kg (float): Price of wool per kilogram (default: 0.0).
 
+    The columns of the livestock data (ANIMAL_CATEGORY_FIELDS) are stored in slots, and any other column in the extras
+    mapping. Use to_dict() rather than vars() to list the attributes of an instance.
+
     Parameters:
         data (dict): A dictionary containing actual values for attributes of the animal category. Keys correspond
                      to attribute names, and values correspond to the values those attributes should take.
 
     """
+    __slots__ = ANIMAL_CATEGORY_FIELDS + ("_extras",)
+
+    fields = ANIMAL_CATEGORY_FIELDS
+
     def __init__(self, data):
 
-        defaults = {
-            "pop": 0,
-            "wool": 0,
-            "weight": 0,
-            "forage": "average",
-            "grazing": "pasture",
-            "con_type": "concentrate",
-            "con_amount": 0,
-            "t_outdoors": 24,
-            "t_indoors": 0,
-            "t_stabled": 0,
-            "mm_storage": "solid",
-            "daily_spreading": "none",
-            "n_sold": 0,
-            "n_bought": 0,
-            "meat_price_kg": 0,
-            "wool_price_kg": 0,
-        }
-
-        super(AnimalCategory, self).__init__(data, defaults)
+        super(AnimalCategory, self).__init__(data, ANIMAL_CATEGORY_DEFAULTS)
 
 
 class AnimalCollection(DynamicData):
@@ -145,11 +263,83 @@ class Farm(DynamicData):
         data (dict): A dictionary containing attributes and values that represent various aspects of the farm. This
                      can include information such as the farm's ID, location, size, and any specific animal collections
                      associated with the farm.
+
+    The columns of the farm data (FARM_FIELDS) are stored in slots, and any other column in the extras mapping. Use
+    to_dict() rather than vars() to list the attributes of an instance.
     """
+    __slots__ = FARM_FIELDS + ("_extras",)
+
+    fields = FARM_FIELDS
+
     def __init__(self, data): 
         super(Farm, self).__init__(data)
 
 
+class LivestockData(Mapping):
+    """
+    A read-only mapping of farm ID to {"animals": AnimalCollection}, with the same keys, order and contents as the dictionary
+    returned by load_livestock_data, but backed by the livestock DataFrame rather than by one object per row.
+
+    The rows are grouped by farm ID once, when the mapping is created. The AnimalCategory and AnimalCollection objects of a
+    farm are only built when the farm is looked up, and are not kept, so memory use is proportional to the column data.
+    Changes made to a returned collection are therefore not seen by later lookups.
+
+    Parameters:
+        animal_data_frame (pandas.DataFrame): The DataFrame containing the livestock data.
+    """
+    def __init__(self, animal_data_frame):
+        import numpy as np
+
+        self.data_frame = animal_data_frame
+
+        codes, farm_ids = animal_data_frame["farm_id"].factorize(
+            sort=False, use_na_sentinel=False
+        )
+        order = np.argsort(codes, kind="stable")
+        bounds = np.cumsum(np.bincount(codes, minlength=len(farm_ids)))[:-1]
+
+        self._positions = dict(zip(farm_ids.tolist(), np.split(order, bounds)))
+
+    def __getitem__(self, farm_id):
+        raw_data = {}
+
+        # Rows keep their original order, so the last row for a cohort wins as in load_livestock_data
+        for data in self.data_frame.iloc[self._positions[farm_id]].to_dict("records"):
+            raw_data[data.get("cohort")] = AnimalCategory(data)
+
+        return {"animals": AnimalCollection(raw_data)}
+
+    def __iter__(self):
+        return iter(self._positions)
+
+    def __len__(self):
+        return len(self._positions)
+
+
+class FarmData(Mapping):
+    """
+    A read-only mapping of row position to Farm, with the same keys and contents as the dictionary returned by
+    load_farm_data, but backed by the farm DataFrame. Each Farm is built when it is looked up and is not kept.
+
+    Parameters:
+        farm_data_frame (pandas.DataFrame): The DataFrame containing the farm data.
+    """
+    def __init__(self, farm_data_frame):
+        self.data_frame = farm_data_frame
+
+    def __getitem__(self, index):
+        if not isinstance(index, numbers.Integral) or not 0 <= index < len(self.data_frame):
+            raise KeyError(index)
+
+        return Farm(self.data_frame.iloc[[index]].to_dict("records")[0])
+
+    def __iter__(self):
+        return iter(range(len(self.data_frame)))
+
+    def __len__(self):
+        return len(self.data_frame)
+
+
 ######################################################################################
 # Animal Features Data
 ######################################################################################
@@ -170,44 +360,33 @@ class Animal_Features(object):
     Methods:
         Various getter methods for each animal feature, such as get_mature_weight_male(), etc.
     """    
+    feature_names = (
+        "mature_weight_male",
+        "mature_weight_female",
+        "ewe_weight_after_weaning",
+        "lamb_less_1_yr_weight_after_weaning",
+        "lamb_more_1_yr_weight_after_weaning",
+        "lamb_weight_gain",
+        "ram_weight_after_weaning",
+        "ewe_weight_1_year_old",
+        "lamb_less_1_yr_weight",
+        "lamb_more_1_yr_weight",
+        "lamb_male_more_1_year_old",
+        "ram_weight_1_year_old",
+        "lamb_weight_at_birth",
+    )
+
     def __init__(self, data):
         self.data_frame = data
         self.animal_features = {}
 
-        for _, row in self.data_frame.iterrows():
-
-            mature_weight_male = row.get("mature_weight_male")
-            mature_weight_female = row.get("mature_weight_female")
-            ewe_weight_after_weaning = row.get("ewe_weight_after_weaning")
-            lamb_less_1_yr_weight_after_weaning = row.get(
-                "lamb_less_1_yr_weight_after_weaning"
-            )
-            lamb_more_1_yr_weight_after_weaning = row.get(
-                "lamb_more_1_yr_weight_after_weaning"
-            )
-            lamb_weight_gain = row.get("lamb_weight_gain")
-            ram_weight_after_weaning = row.get("ram_weight_after_weaning")
-            ewe_weight_1_year_old = row.get("ewe_weight_1_year_old")
-            lamb_less_1_yr_weight = row.get("lamb_less_1_yr_weight")
-            lamb_more_1_yr_weight = row.get("lamb_more_1_yr_weight")
-            lamb_male_more_1_year_old = row.get("lamb_male_more_1_year_old")
-            ram_weight_1_year_old = row.get("ram_weight_1_year_old")
-            lamb_weight_at_birth = row.get("lamb_weight_at_birth")
+        records = self.data_frame.to_dict("records")
 
+        # Only the last row is kept, as each row describes the same set of features
+        if records:
+            row = records[-1]
             self.animal_features = {
-                "mature_weight_male": mature_weight_male,
-                "mature_weight_female": mature_weight_female,
-                "ewe_weight_after_weaning": ewe_weight_after_weaning,
-                "lamb_less_1_yr_weight_after_weaning": lamb_less_1_yr_weight_after_weaning,
-                "lamb_more_1_yr_weight_after_weaning": lamb_more_1_yr_weight_after_weaning,
-                "lamb_weight_gain": lamb_weight_gain,
-                "ram_weight_after_weaning": ram_weight_after_weaning,
-                "ewe_weight_1_year_old": ewe_weight_1_year_old,
-                "lamb_less_1_yr_weight": lamb_less_1_yr_weight,
-                "lamb_more_1_yr_weight": lamb_more_1_yr_weight,
-                "lamb_male_more_1_year_old": lamb_male_more_1_year_old,
-                "ram_weight_1_year_old": ram_weight_1_year_old,
-                "lamb_weight_at_birth": lamb_weight_at_birth,
+                feature: row.get(feature) for feature in self.feature_names
             }
 
     def get_mature_weight_male(self):
@@ -327,14 +506,31 @@ class Animal_Features(object):
         """
         return self.animal_features.get("lamb_weight_at_birth")
 
+    @classmethod
+    def from_parsed(cls, animal_features):
+        """
+        Create an instance from previously parsed animal features data, such as a cached copy, without a DataFrame.
+
+        Args:
+            animal_features (dict): The parsed data, as held in the animal_features attribute.
+
+        Returns:
+            Animal_Features: An instance holding the parsed data, with data_frame set to None.
+        """
+        instance = cls.__new__(cls)
+        instance.data_frame = None
+        instance.animal_features = animal_features
+
+        return instance
+
     def is_loaded(self):
         """
         Checks if the data frame has been loaded successfully.
 
         Returns:
-            bool: True if the data frame is not None, False otherwise.
+            bool: True if the data frame is not None or parsed data is held, False otherwise.
         """
-        if self.data_frame is not None:
+        if self.data_frame is not None or self.animal_features:
             return True
         else:
             return False
@@ -365,184 +561,69 @@ class Emissions_Factors(object):
         energy required for maintenance of a sheep up to a year old.
 
     """
+    factor_columns = {
+        "ef_net_energy_for_maintenance_sheep_up_to_a_year": "ef_net_energy_for_maintenance_sheep_up_to_a_year",
+        "ef_net_energy_for_maintenance_sheep_more_than_a_year": "ef_net_energy_for_maintenance_sheep_more_than_a_year",
+        "ef_net_energy_for_maintenance_intact_male_up_to_year": "ef_net_energy_for_maintenance_intact_male_up_to_year",
+        "ef_net_energy_for_maintenance_intact_male_more_than_a_year": "ef_net_energy_for_maintenance_intact_male_more_than_a_year",
+        "ef_feeding_situation_housed_ewes": "ef_feeding_situation_housed_ewes",
+        "ef_feeding_situation_grazing_flat_pasture": "ef_feeding_situation_grazing_flat_pasture",
+        "ef_feeding_situation_grazing_hilly_pasture": "ef_feeding_situation_grazing_hilly_pasture",
+        "ef_feeding_situation_housed_fattening_lambs": "ef_feeding_situation_housed_fattening_lambs",
+        "ef_net_energy_for_growth_females_a": "ef_net_energy_for_growth_females_a",
+        "ef_net_energy_for_growth_males_a": "ef_net_energy_for_growth_males_a",
+        "ef_net_energy_for_growth_castrates_a": "ef_net_energy_for_growth_castrates_a",
+        "ef_net_energy_for_growth_females_b": "ef_net_energy_for_growth_females_b",
+        "ef_net_energy_for_growth_males_b": "ef_net_energy_for_growth_males_b",
+        "ef_net_energy_for_growth_castrates_b": "ef_net_energy_for_growth_castrates_b",
+        "ef_net_energy_for_pregnancy": "ef_net_energy_for_pregnancy",
+        "ef_methane_conversion_factor_sheep": "ef_methane_conversion_factor_sheep",
+        "ef_methane_conversion_factor_lamb": "ef_methane_conversion_factor_lamb",
+        "ef_fracGASM_total_ammonia_nitrogen_pasture_range_paddock_deposition": "ef_fracGASM_total_ammonia_nitrogen_pasture_range_paddock_deposition",
+        "ef3__cpp_pasture_range_paddock_sheep_direct_n2o": "ef3__cpp_pasture_range_paddock_sheep_direct_n2o",
+        "ef_direct_n2o_emissions_soils": "ef_direct_n2o_emissions_soils",
+        "ef_indirect_n2o_atmospheric_deposition_to_soils_and_water": "ef_indirect_n2o_atmospheric_deposition_to_soils_and_water",
+        "ef_indirect_n2o_from_leaching_and_runoff": "ef_indirect_n2o_from_leaching_and_runoff",
+        "ef_TAN_house_liquid": "ef_TAN_house_liquid",
+        "ef_TAN_house_solid_deep_bedding": "ef_TAN_house_solid_deep_bedding",
+        "ef_TAN_storage_tank": "ef_TAN_storage_tank",
+        "ef_TAN_storage_solid_deep_bedding": "ef_TAN_storage_solid_deep_bedding",
+        "ef_mcf_liquid_tank": "ef_mcf_liquid_tank",
+        "ef_mcf_solid_storage_deep_bedding": "ef_mcf_solid_storage_deep_bedding",
+        "ef_mcf_anaerobic_digestion": "ef_mcf_anaerobic_digestion",
+        "ef_n2o_direct_storage_tank_liquid": "ef_n2o_direct_storage_tank_liquid",
+        "ef_n2o_direct_storage_tank_solid": "ef_n2o_direct_storage_tank_solid",
+        "ef_n2o_direct_storage_solid_deep_bedding": "ef_n2o_direct_storage_solid_deep_bedding",
+        "ef_n2o_direct_storage_tank_anaerobic_digestion": "ef_n2o_direct_storage_tank_anaerobic_digestion",
+        "ef_nh3_daily_spreading_none": "ef_nh3_daily_spreading_none",
+        "ef_nh3_daily_spreading_manure": "ef_nh3_daily_spreading_manure",
+        "ef_nh3_daily_spreading_broadcast": "ef_nh3_daily_spreading_broadcast",
+        "ef_nh3_daily_spreading_injection": "ef_nh3_daily_spreading_injection",
+        "ef_nh3_daily_spreading_traling_hose": "ef_nh3_daily_spreading_trailing_hose",
+        "ef_urea": "ef_urea",
+        "ef_urea_and_nbpt": "ef_urea_and_nbpt",
+        "ef_fracGASF_urea_fertilisers_to_nh3_and_nox": "ef_fracGASF_urea_fertilisers_to_nh3_and_nox",
+        "ef_fracGASF_urea_and_nbpt_to_nh3_and_nox": "ef_fracGASF_urea_and_nbpt_to_nh3_and_nox",
+        "ef_frac_leach_runoff": "ef_frac_leach_runoff",
+        "ef_ammonium_nitrate": "ef_ammonium_nitrate",
+        "ef_fracGASF_ammonium_fertilisers_to_nh3_and_nox": "ef_fracGASF_ammonium_fertilisers_to_nh3_and_nox",
+        "ef_Frac_P_Leach": "Frac_P_Leach",
+        "ef_urea_co2": "ef_urea_co2",
+        "ef_lime_co2": "ef_lime_co2",
+    }
+
     def __init__(self, data):
 
         self.data_frame = data
         self.emissions_factors = {}
 
-        for _, row in self.data_frame.iterrows():
-
-            ef_net_energy_for_maintenance_sheep_up_to_a_year = row.get(
-                "ef_net_energy_for_maintenance_sheep_up_to_a_year"
-            )
-            ef_net_energy_for_maintenance_sheep_more_than_a_year = row.get(
-                "ef_net_energy_for_maintenance_sheep_more_than_a_year"
-            )
-            ef_net_energy_for_maintenance_intact_male_up_to_year = row.get(
-                "ef_net_energy_for_maintenance_intact_male_up_to_year"
-            )
-            ef_net_energy_for_maintenance_intact_male_more_than_a_year = row.get(
-                "ef_net_energy_for_maintenance_intact_male_more_than_a_year"
-            )
-
-            ef_feeding_situation_housed_ewes = row.get(
-                "ef_feeding_situation_housed_ewes"
-            )
-            ef_feeding_situation_grazing_flat_pasture = row.get(
-                "ef_feeding_situation_grazing_flat_pasture"
-            )
-            ef_feeding_situation_grazing_hilly_pasture = row.get(
-                "ef_feeding_situation_grazing_hilly_pasture"
-            )
-            ef_feeding_situation_housed_fattening_lambs = row.get(
-                "ef_feeding_situation_housed_fattening_lambs"
-            )
-
-            ef_net_energy_for_growth_females_a = row.get(
-                "ef_net_energy_for_growth_females_a"
-            )
-            ef_net_energy_for_growth_males_a = row.get(
-                "ef_net_energy_for_growth_males_a"
-            )
-            ef_net_energy_for_growth_castrates_a = row.get(
-                "ef_net_energy_for_growth_castrates_a"
-            )
-
-            ef_net_energy_for_growth_females_b = row.get(
-                "ef_net_energy_for_growth_females_b"
-            )
-            ef_net_energy_for_growth_males_b = row.get(
-                "ef_net_energy_for_growth_males_b"
-            )
-            ef_net_energy_for_growth_castrates_b = row.get(
-                "ef_net_energy_for_growth_castrates_b"
-            )
-
-            ef_net_energy_for_pregnancy = row.get("ef_net_energy_for_pregnancy")
-
-            ef_methane_conversion_factor_sheep = row.get(
-                "ef_methane_conversion_factor_sheep"
-            )
-            ef_methane_conversion_factor_lamb = row.get(
-                "ef_methane_conversion_factor_lamb"
-            )
-
-            ef_fracGASM_total_ammonia_nitrogen_pasture_range_paddock_deposition = row.get(
-                "ef_fracGASM_total_ammonia_nitrogen_pasture_range_paddock_deposition"
-            )
-
-            ef3__cpp_pasture_range_paddock_sheep_direct_n2o = row.get(
-                "ef3__cpp_pasture_range_paddock_sheep_direct_n2o"
-            )
-
-            ef_direct_n2o_emissions_soils = row.get("ef_direct_n2o_emissions_soils")
-            ef_indirect_n2o_atmospheric_deposition_to_soils_and_water = row.get(
-                "ef_indirect_n2o_atmospheric_deposition_to_soils_and_water"
-            )
-            ef_indirect_n2o_from_leaching_and_runoff = row.get(
-                "ef_indirect_n2o_from_leaching_and_runoff"
-            )
-            ef_TAN_house_liquid = row.get("ef_TAN_house_liquid")
-            ef_TAN_house_solid_deep_bedding = row.get("ef_TAN_house_solid_deep_bedding")
-            ef_TAN_storage_tank = row.get("ef_TAN_storage_tank")
-            ef_TAN_storage_solid_deep_bedding = row.get(
-                "ef_TAN_storage_solid_deep_bedding"
-            )
-            ef_mcf_liquid_tank = row.get("ef_mcf_liquid_tank")
-            ef_mcf_solid_storage_deep_bedding = row.get(
-                "ef_mcf_solid_storage_deep_bedding"
-            )
-            ef_mcf_anaerobic_digestion = row.get("ef_mcf_anaerobic_digestion")
-            ef_n2o_direct_storage_tank_liquid = row.get(
-                "ef_n2o_direct_storage_tank_liquid"
-            )
-            ef_n2o_direct_storage_tank_solid = row.get(
-                "ef_n2o_direct_storage_tank_solid"
-            )
-            ef_n2o_direct_storage_solid_deep_bedding = row.get(
-                "ef_n2o_direct_storage_solid_deep_bedding"
-            )
-            ef_n2o_direct_storage_tank_anaerobic_digestion = row.get(
-                "ef_n2o_direct_storage_tank_anaerobic_digestion"
-            )
-            ef_nh3_daily_spreading_none = row.get("ef_nh3_daily_spreading_none")
-            ef_nh3_daily_spreading_manure = row.get("ef_nh3_daily_spreading_manure")
-            ef_nh3_daily_spreading_broadcast = row.get(
-                "ef_nh3_daily_spreading_broadcast"
-            )
-            ef_nh3_daily_spreading_injection = row.get(
-                "ef_nh3_daily_spreading_injection"
-            )
-            ef_nh3_daily_spreading_traling_hose = row.get(
-                "ef_nh3_daily_spreading_trailing_hose"
-            )
-            ef_urea = row.get("ef_urea")
-            ef_urea_and_nbpt = row.get("ef_urea_and_nbpt")
-            ef_fracGASF_urea_fertilisers_to_nh3_and_nox = row.get(
-                "ef_fracGASF_urea_fertilisers_to_nh3_and_nox"
-            )
-            ef_fracGASF_urea_and_nbpt_to_nh3_and_nox = row.get(
-                "ef_fracGASF_urea_and_nbpt_to_nh3_and_nox"
-            )
-            ef_frac_leach_runoff = row.get("ef_frac_leach_runoff")
-            ef_ammonium_nitrate = row.get("ef_ammonium_nitrate")
-            ef_fracGASF_ammonium_fertilisers_to_nh3_and_nox = row.get(
-                "ef_fracGASF_ammonium_fertilisers_to_nh3_and_nox"
-            )
-            Frac_P_Leach = row.get("Frac_P_Leach")
-            ef_urea_co2 = row.get("ef_urea_co2")
-            ef_lime_co2 = row.get("ef_lime_co2")
-
+        records = self.data_frame.to_dict("records")
 
+        # Only the last row is kept, as each row describes the same set of factors
+        if records:
+            row = records[-1]
             self.emissions_factors = {
-                "ef_net_energy_for_maintenance_sheep_up_to_a_year": ef_net_energy_for_maintenance_sheep_up_to_a_year,
-                "ef_net_energy_for_maintenance_sheep_more_than_a_year": ef_net_energy_for_maintenance_sheep_more_than_a_year,
-                "ef_net_energy_for_maintenance_intact_male_up_to_year": ef_net_energy_for_maintenance_intact_male_up_to_year,
-                "ef_net_energy_for_maintenance_intact_male_more_than_a_year": ef_net_energy_for_maintenance_intact_male_more_than_a_year,
-                "ef_feeding_situation_housed_ewes": ef_feeding_situation_housed_ewes,
-                "ef_feeding_situation_grazing_flat_pasture": ef_feeding_situation_grazing_flat_pasture,
-                "ef_feeding_situation_grazing_hilly_pasture": ef_feeding_situation_grazing_hilly_pasture,
-                "ef_feeding_situation_housed_fattening_lambs": ef_feeding_situation_housed_fattening_lambs,
-                "ef_net_energy_for_growth_females_a": ef_net_energy_for_growth_females_a,
-                "ef_net_energy_for_growth_males_a": ef_net_energy_for_growth_males_a,
-                "ef_net_energy_for_growth_castrates_a": ef_net_energy_for_growth_castrates_a,
-                "ef_net_energy_for_growth_females_b": ef_net_energy_for_growth_females_b,
-                "ef_net_energy_for_growth_males_b": ef_net_energy_for_growth_males_b,
-                "ef_net_energy_for_growth_castrates_b": ef_net_energy_for_growth_castrates_b,
-                "ef_net_energy_for_pregnancy": ef_net_energy_for_pregnancy,
-                "ef_methane_conversion_factor_sheep": ef_methane_conversion_factor_sheep,
-                "ef_methane_conversion_factor_lamb": ef_methane_conversion_factor_lamb,
-                "ef_fracGASM_total_ammonia_nitrogen_pasture_range_paddock_deposition": ef_fracGASM_total_ammonia_nitrogen_pasture_range_paddock_deposition,
-                "ef3__cpp_pasture_range_paddock_sheep_direct_n2o": ef3__cpp_pasture_range_paddock_sheep_direct_n2o,
-                "ef_direct_n2o_emissions_soils": ef_direct_n2o_emissions_soils,
-                "ef_indirect_n2o_atmospheric_deposition_to_soils_and_water": ef_indirect_n2o_atmospheric_deposition_to_soils_and_water,
-                "ef_indirect_n2o_from_leaching_and_runoff": ef_indirect_n2o_from_leaching_and_runoff,
-                "ef_TAN_house_liquid": ef_TAN_house_liquid,
-                "ef_TAN_house_solid_deep_bedding": ef_TAN_house_solid_deep_bedding,
-                "ef_TAN_storage_tank": ef_TAN_storage_tank,
-                "ef_TAN_storage_solid_deep_bedding": ef_TAN_storage_solid_deep_bedding,
-                "ef_mcf_liquid_tank": ef_mcf_liquid_tank,
-                "ef_mcf_solid_storage_deep_bedding": ef_mcf_solid_storage_deep_bedding,
-                "ef_mcf_anaerobic_digestion": ef_mcf_anaerobic_digestion,
-                "ef_n2o_direct_storage_tank_liquid": ef_n2o_direct_storage_tank_liquid,
-                "ef_n2o_direct_storage_tank_solid": ef_n2o_direct_storage_tank_solid,
-                "ef_n2o_direct_storage_solid_deep_bedding": ef_n2o_direct_storage_solid_deep_bedding,
-                "ef_n2o_direct_storage_tank_anaerobic_digestion": ef_n2o_direct_storage_tank_anaerobic_digestion,
-                "ef_nh3_daily_spreading_none": ef_nh3_daily_spreading_none,
-                "ef_nh3_daily_spreading_manure": ef_nh3_daily_spreading_manure,
-                "ef_nh3_daily_spreading_broadcast": ef_nh3_daily_spreading_broadcast,
-                "ef_nh3_daily_spreading_injection": ef_nh3_daily_spreading_injection,
-                "ef_nh3_daily_spreading_traling_hose": ef_nh3_daily_spreading_traling_hose,
-                "ef_urea": ef_urea,
-                "ef_urea_and_nbpt": ef_urea_and_nbpt,
-                "ef_fracGASF_urea_fertilisers_to_nh3_and_nox": ef_fracGASF_urea_fertilisers_to_nh3_and_nox,
-                "ef_fracGASF_urea_and_nbpt_to_nh3_and_nox": ef_fracGASF_urea_and_nbpt_to_nh3_and_nox,
-                "ef_frac_leach_runoff": ef_frac_leach_runoff,
-                "ef_ammonium_nitrate": ef_ammonium_nitrate,
-                "ef_fracGASF_ammonium_fertilisers_to_nh3_and_nox": ef_fracGASF_ammonium_fertilisers_to_nh3_and_nox,
-                "ef_Frac_P_Leach": Frac_P_Leach,
-                "ef_urea_co2":ef_urea_co2,
-                "ef_lime_co2":ef_lime_co2,
+                factor: row.get(column) for factor, column in self.factor_columns.items()
             }
 
     def get_ef_net_energy_for_maintenance_sheep_up_to_a_year(self):
@@ -995,6 +1076,23 @@ class Emissions_Factors(object):
         """        
         return self.emissions_factors.get("ef_lime_co2")
 
+    @classmethod
+    def from_parsed(cls, emissions_factors):
+        """
+        Create an instance from previously parsed emissions factors data, such as a cached copy, without a DataFrame.
+
+        Args:
+            emissions_factors (dict): The parsed data, as held in the emissions_factors attribute.
+
+        Returns:
+            Emissions_Factors: An instance holding the parsed data, with data_frame set to None.
+        """
+        instance = cls.__new__(cls)
+        instance.data_frame = None
+        instance.emissions_factors = emissions_factors
+
+        return instance
+
     def is_loaded(self):
         """
         Check if the emissions factors data has been successfully loaded.
@@ -1002,7 +1100,7 @@ class Emissions_Factors(object):
         Returns:
             bool: True if the data has been loaded, False otherwise.
         """        
-        if self.data_frame is not None:
+        if self.data_frame is not None or self.emissions_factors:
             return True
         else:
             return False
@@ -1033,40 +1131,26 @@ class Grass(object):
     """    
     def average(self, property):
 
-        values = [
-            row.get(property)
-            for _, row in self.data_frame.iterrows()
-            if pandas.notna(row.get(property))
-        ]
-
-        return sum(values) / len(values)
+        return _column_averages(self.data_frame, [property])[property]
 
     def __init__(self, data):
 
         self.data_frame = data
         self.grasses = {}
 
-        for _, row in self.data_frame.iterrows():
-
-            genus = row.get("grass_genus".lower())
-            dmd = row.get("forage_dry_matter_digestibility")
-            cp = row.get("crude_protein")
-            ge = row.get("gross_energy")
+        properties = [
+            "forage_dry_matter_digestibility",
+            "crude_protein",
+            "gross_energy",
+        ]
 
-            self.grasses[genus] = {
-                "forage_dry_matter_digestibility": dmd,
-                "crude_protein": cp,
-                "gross_energy": ge,
+        for row in self.data_frame.to_dict("records"):
+            self.grasses[row.get("grass_genus")] = {
+                property: row.get(property) for property in properties
             }
 
         # Pre-compute averages
-        self.grasses["average"] = {
-            "forage_dry_matter_digestibility": self.average(
-                "forage_dry_matter_digestibility"
-            ),
-            "crude_protein": self.average("crude_protein"),
-            "gross_energy": self.average("gross_energy"),
-        }
+        self.grasses["average"] = _column_averages(self.data_frame, properties)
 
     def get_forage_dry_matter_digestibility(self, forage):
         """
@@ -1104,6 +1188,23 @@ class Grass(object):
         """        
         return self.grasses.get(forage).get("gross_energy")
 
+    @classmethod
+    def from_parsed(cls, grasses):
+        """
+        Create an instance from previously parsed grass data, such as a cached copy, without a DataFrame.
+
+        Args:
+            grasses (dict): The parsed data, as held in the grasses attribute.
+
+        Returns:
+            Grass: An instance holding the parsed data, with data_frame set to None.
+        """
+        instance = cls.__new__(cls)
+        instance.data_frame = None
+        instance.grasses = grasses
+
+        return instance
+
     def is_loaded(self):
         """
         Check if the grass data has been successfully loaded.
@@ -1111,7 +1212,7 @@ class Grass(object):
         Returns:
             bool: True if the data has been loaded, False otherwise.
         """        
-        if self.data_frame is not None:
+        if self.data_frame is not None or self.grasses:
             return True
         else:
             return False
@@ -1143,49 +1244,36 @@ class Concentrate(object):
     """    
     def average(self, property):
 
-        values = [
-            row.get(property)
-            for _, row in self.data_frame.iterrows()
-            if pandas.notna(row.get(property))
-        ]
-
-        try:
-            return sum(values) / len(values)
-        except ZeroDivisionError as err:
-            pass
+        return _column_averages(self.data_frame, [property])[property]
 
     def __init__(self, data):
 
         self.data_frame = data
         self.concentrates = {}
 
-        for _, row in self.data_frame.iterrows():
-
-            con_type = row.get("con_type".lower())
-            con_dmd = row.get("con_dry_matter_digestibility")
-            con_de = row.get("con_digestible_energy")
-            con_cp = row.get("con_crude_protein")
-            con_gross_energy = row.get("gross_energy_mje_dry_matter")
-            con_co2_e = row.get("con_co2_e")
-            con_po4_e = row.get("con_po4_e")
-
-            self.concentrates[con_type] = {
-                "con_dry_matter_digestibility": con_dmd,
-                "con_digestible_energy": con_de,
-                "con_crude_protein": con_cp,
-                "gross_energy_mje_dry_matter": con_gross_energy,
-                "con_co2_e": con_co2_e,
-                "con_po4_e": con_po4_e,
+        properties = [
+            "con_dry_matter_digestibility",
+            "con_digestible_energy",
+            "con_crude_protein",
+            "gross_energy_mje_dry_matter",
+            "con_co2_e",
+            "con_po4_e",
+        ]
+
+        for row in self.data_frame.to_dict("records"):
+            self.concentrates[row.get("con_type")] = {
+                property: row.get(property) for property in properties
             }
 
         # Pre-compute averages
-        self.concentrates["average"] = {
-            "con_dry_matter_digestibility": self.average(
-                "con_dry_matter_digestibility"
-            ),
-            "con_digestible_energy": self.average("con_digestible_energy"),
-            "con_crude_protein": self.average("con_crude_protein"),
-        }
+        self.concentrates["average"] = _column_averages(
+            self.data_frame,
+            [
+                "con_dry_matter_digestibility",
+                "con_digestible_energy",
+                "con_crude_protein",
+            ],
+        )
 
     def get_con_dry_matter_digestibility(self, concentrate):
         """
@@ -1260,6 +1348,23 @@ class Concentrate(object):
         return self.concentrates.get(concentrate).get("con_po4_e")
     
 
+    @classmethod
+    def from_parsed(cls, concentrates):
+        """
+        Create an instance from previously parsed concentrate data, such as a cached copy, without a DataFrame.
+
+        Args:
+            concentrates (dict): The parsed data, as held in the concentrates attribute.
+
+        Returns:
+            Concentrate: An instance holding the parsed data, with data_frame set to None.
+        """
+        instance = cls.__new__(cls)
+        instance.data_frame = None
+        instance.concentrates = concentrates
+
+        return instance
+
     def is_loaded(self):
         """
         Check if the concentrate data has been successfully loaded.
@@ -1267,7 +1372,7 @@ class Concentrate(object):
         Returns:
             bool: True if the data has been loaded, False otherwise.
         """        
-        if self.data_frame is not None:
+        if self.data_frame is not None or self.concentrates:
             return True
         else:
             return False
@@ -1301,23 +1406,18 @@ class Upstream(object):
         self.data_frame = data
         self.upstream = {}
 
-        for _, row in self.data_frame.iterrows():
-
-            upstream_type = row.get("upstream_type".lower())
-            upstream_fu = row.get("upstream_fu")
-            upstream_kg_co2e = row.get("upstream_kg_co2e")
-            upstream_kg_po4e = row.get("upstream_kg_po4e")
-            upstream_kg_so2e = row.get("upstream_kg_so2e")
-            upstream_mje = row.get("upstream_mje")
-            upstream_kg_sbe = row.get("upstream_kg_sbe")
-
-            self.upstream[upstream_type] = {
-                "upstream_fu": upstream_fu,
-                "upstream_kg_co2e": upstream_kg_co2e,
-                "upstream_kg_po4e": upstream_kg_po4e,
-                "upstream_kg_so2e": upstream_kg_so2e,
-                "upstream_mje": upstream_mje,
-                "upstream_kg_sbe": upstream_kg_sbe,
+        properties = [
+            "upstream_fu",
+            "upstream_kg_co2e",
+            "upstream_kg_po4e",
+            "upstream_kg_so2e",
+            "upstream_mje",
+            "upstream_kg_sbe",
+        ]
+
+        for row in self.data_frame.to_dict("records"):
+            self.upstream[row.get("upstream_type")] = {
+                property: row.get(property) for property in properties
             }
 
     def get_upstream_fu(self, upstream):
@@ -1392,6 +1492,23 @@ class Upstream(object):
         """        
         return self.upstream.get(upstream).get("upstream_kg_sbe")
 
+    @classmethod
+    def from_parsed(cls, upstream):
+        """
+        Create an instance from previously parsed upstream data, such as a cached copy, without a DataFrame.
+
+        Args:
+            upstream (dict): The parsed data, as held in the upstream attribute.
+
+        Returns:
+            Upstream: An instance holding the parsed data, with data_frame set to None.
+        """
+        instance = cls.__new__(cls)
+        instance.data_frame = None
+        instance.upstream = upstream
+
+        return instance
+
     def is_loaded(self):
         """
         Check if the upstream data has been successfully loaded.
@@ -1399,12 +1516,33 @@ class Upstream(object):
         Returns:
             bool: True if the data has been loaded, False otherwise.
         """        
-        if self.data_frame is not None:
+        if self.data_frame is not None or self.upstream:
             return True
         else:
             return False
 
 
+def _column_averages(data_frame, properties):
+    """
+    Calculate the average of several columns in a single reduction, ignoring missing values.
+
+    Args:
+        data_frame (pandas.DataFrame): The DataFrame containing the columns.
+        properties (list): The names of the columns to average.
+
+    Returns:
+        dict: The average of each column, or None for a column with no values.
+    """
+    columns = data_frame.reindex(columns=properties)
+    counts = columns.count()
+    means = columns.mean()
+
+    return {
+        property: float(means[property]) if counts[property] else None
+        for property in properties
+    }
+
+
 #############################################################################################
 
 
@@ -1458,57 +1596,53 @@ def load_animal_features_data():
     return Animal_Features()
 
 
-def load_farm_data(farm_data_frame):
+def load_farm_data(farm_data_frame, lazy=False):
     """
     Load the farm data.
 
     Args:
         farm_data_frame (pandas.DataFrame): The DataFrame containing the farm data.
+        lazy (bool, optional): Return a FarmData mapping that builds each Farm on demand. Defaults to False.
 
     Returns:
         dict: A dictionary containing the farm data.
     """
-    scenario_list = []
+    if lazy:
+        return FarmData(farm_data_frame)
 
-    for _, row in farm_data_frame.iterrows():
-        data = dict([(x, row.get(x)) for x in row.keys()])
-        scenario_list.append(Farm(data))
+    scenario_list = [Farm(data) for data in farm_data_frame.to_dict("records")]
 
     return dict(enumerate(scenario_list))
 
 
-def load_livestock_data(animal_data_frame):
+def load_livestock_data(animal_data_frame, lazy=False):
     """
     Load the livestock data.
 
     Args:
         animal_data_frame (pandas.DataFrame): The DataFrame containing the livestock data.
+        lazy (bool, optional): Return a LivestockData mapping that builds each farm's collection on demand. Defaults to False.
 
     Returns:
         dict: A dictionary containing the livestock data.
     """    
-    # 1. Load each animal category into an object
-
-    categories = []
-
-    for _, row in animal_data_frame.iterrows():
-        data = dict([(x, row.get(x)) for x in row.keys()])
-        categories.append(AnimalCategory(data))
+    if lazy:
+        return LivestockData(animal_data_frame)
 
-    # 2. Aggregate the animal categories into collection based on the farm ID
+    # 1. Load each animal category into an object and aggregate them into collections based on the farm ID
 
     collections = {}
 
-    for category in categories:
+    for data in animal_data_frame.to_dict("records"):
+        category = AnimalCategory(data)
         farm_id = category.farm_id
-        cohort = category.cohort
 
         if farm_id not in collections:
-            collections[farm_id] = {cohort: category}
+            collections[farm_id] = {category.cohort: category}
         else:
-            collections[farm_id][cohort] = category
+            collections[farm_id][category.cohort] = category
 
-    # 3. Convert the raw collection data into animal collection objects
+    # 2. Convert the raw collection data into animal collection objects
 
     collection_objects = {}
 
@@ -1529,7 +1663,7 @@ def print_livestock_data(data):
         for animal in data[key].keys():
             for cohort in data[key][animal].__dict__.keys():
                 for attribute in (
-                    data[key][animal].__getattribute__(cohort).__dict__.keys()
+                    data[key][animal].__getattribute__(cohort).to_dict().keys()
                 ):
                     print(
                         f"{cohort}: {attribute} = {data[key][animal].__getattribute__(cohort).__getattribute__(attribute)}"
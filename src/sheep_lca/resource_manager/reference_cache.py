@@ -0,0 +1,158 @@
+"""
+Reference Cache Module
+----------------------
+
+This module contains the ReferenceDataCache class, an on-disk cache of the parsed country reference data (grass,
+concentrate, upstream, emissions factors and animal features) read by the Loader class.
+
+Reading the reference data requires SQLAlchemy and pandas and five queries against the sheep database. With the cache
+enabled, the parsed contents are stored in a pickle file per emissions factor country, keyed by the size and modification
+time of the database file. A warm start loads the pickle instead, without importing SQLAlchemy or pandas.
+
+The cache is opt-in: pass cache_dir to the Loader (or LCADataManager), or set the SHEEP_LCA_CACHE_DIR environment variable.
+Cache files are only read back by this package, and the cache directory should not be writable by untrusted users, as
+loading a pickle can run arbitrary code.
+"""
+import hashlib
+import os
+import re
+
+from sheep_lca.database import get_local_dir
+
+CACHE_DIR_VARIABLE = "SHEEP_LCA_CACHE_DIR"
+
+# Bump when the layout of the cached contents changes, so that older cache files are ignored
+CACHE_FORMAT_VERSION = 1
+
+
+class ReferenceDataCache:
+    """
+    Stores and retrieves the parsed reference data of each emissions factor country in a cache directory.
+
+    A cache entry is only returned when it was written for the same database file, identified by its path, size and
+    modification time, and the same cache format version. Unreadable or stale entries are treated as misses.
+
+    Attributes:
+        cache_dir (str): The directory holding the cache files.
+        database_path (str): The path of the sheep database the cached contents were parsed from.
+
+    Args:
+        cache_dir (str): The directory holding the cache files. It is created if it does not exist.
+        database_path (str, optional): The database file. Defaults to the database shipped with the package.
+
+    Methods:
+        path(ef_country): Returns the cache file for a country.
+        key(ef_country): Returns the key identifying the current database contents for a country.
+        load(ef_country): Returns the cached contents for a country, or None on a miss.
+        store(ef_country, contents): Writes the contents for a country.
+    """
+    def __init__(self, cache_dir, database_path=None):
+        self.cache_dir = cache_dir
+        self.database_path = os.path.abspath(
+            database_path or os.path.join(get_local_dir(), "sheep_database.db")
+        )
+
+    @classmethod
+    def from_environment(cls, cache_dir=None):
+        """
+        Returns a cache for the given directory, or for the SHEEP_LCA_CACHE_DIR environment variable when no directory is
+        given.
+
+        Args:
+            cache_dir (str, optional): The directory holding the cache files.
+
+        Returns:
+            ReferenceDataCache: The cache, or None if caching is not enabled.
+        """
+        cache_dir = cache_dir or os.environ.get(CACHE_DIR_VARIABLE)
+
+        if not cache_dir:
+            return None
+
+        return cls(cache_dir)
+
+    def path(self, ef_country):
+        """
+        Returns the cache file for a country.
+
+        Args:
+            ef_country (str): The emissions factor country.
+
+        Returns:
+            str: The path of the cache file.
+        """
+        digest = hashlib.sha1(ef_country.encode("utf-8")).hexdigest()[:8]
+        name = re.sub(r"[^\w-]", "_", ef_country)
+
+        return os.path.join(self.cache_dir, f"{name}-{digest}.pickle")
+
+    def key(self, ef_country):
+        """
+        Returns the key identifying the current database contents for a country.
+
+        Args:
+            ef_country (str): The emissions factor country.
+
+        Returns:
+            tuple: The cache format version, country, database path, size and modification time.
+        """
+        stat = os.stat(self.database_path)
+
+        return (
+            CACHE_FORMAT_VERSION,
+            ef_country,
+            self.database_path,
+            stat.st_size,
+            stat.st_mtime_ns,
+        )
+
+    def load(self, ef_country):
+        """
+        Returns the cached contents for a country.
+
+        Args:
+            ef_country (str): The emissions factor country.
+
+        Returns:
+            dict: The cached contents, or None if there is no valid entry for the current database.
+        """
+        import pickle
+
+        try:
+            with open(self.path(ef_country), "rb") as cache_file:
+                entry = pickle.load(cache_file)
+        except Exception:
+            # A missing, truncated or otherwise unreadable entry is treated as a miss
+            return None
+
+        if not isinstance(entry, dict) or entry.get("key") != self.key(ef_country):
+            return None
+
+        return entry.get("contents")
+
+    def store(self, ef_country, contents):
+        """
+        Writes the contents for a country. The file is replaced atomically, so concurrent readers never see a partial
+        entry.
+
+        Args:
+            ef_country (str): The emissions factor country.
+            contents (dict): The parsed reference data.
+        """
+        import pickle
+        import tempfile
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        entry = {"key": self.key(ef_country), "contents": contents}
+        descriptor, temporary_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+
+        try:
+            with os.fdopen(descriptor, "wb") as cache_file:
+                pickle.dump(entry, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+
+            os.replace(temporary_path, self.path(ef_country))
+        except BaseException:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+            raise
@@ -0,0 +1,387 @@
+"""
+Result Writer Module
+--------------------
+
+This module contains the ResultWriter class, a sink for LCA results that accumulates them in preallocated NumPy columns,
+one row per farm or scenario, and writes them to Apache Parquet or Arrow IPC files a batch at a time.
+
+Results can be added as the nested emissions dictionaries of the totals classes (category -> key -> value), as flat
+records such as those of FarmBatchEvaluator.evaluate_farm and FusedFarmEvaluator.evaluate_stream, or as whole columns such
+as the DataFrames of the batch evaluators and ScenarioSweep. Each is copied into the column buffers directly, without
+building intermediate DataFrames, and every full buffer is written as one Parquet row group or Arrow record batch.
+
+Without a path, the batches are kept in memory and returned by to_frame. With append set, the path is a directory and each
+writer adds a new part file to it, so a long run can be written over several sessions and read back as one dataset with
+pyarrow.dataset or pandas.read_parquet.
+
+pyarrow is an optional dependency, imported when the first batch is written to a file. Install it with the "arrow" extra.
+"""
+import os
+
+import numpy as np
+
+from sheep_lca.emissions_table import EmissionsTable
+from sheep_lca.resource_manager.arrow_reader import DEFAULT_BATCH_SIZE, import_pyarrow, resolve_file_format
+
+# The extension of the part files of each format, in append mode
+PART_EXTENSIONS = {"parquet": ".parquet", "ipc": ".arrow", "stream": ".arrows"}
+
+
+class ResultWriter:
+    """
+    Accumulates LCA results in preallocated columns and writes them in batches.
+
+    Every row has a value for each result column; the columns a row is not given keep the value zero, as in the
+    emissions dictionary templates.
+
+    Attributes:
+        path (str): The file, or the directory of part files in append mode, that batches are written to, or None.
+        columns (list): The result columns.
+        index_name (str): The name of the column holding the key of each row.
+        batch_size (int): The number of rows buffered before a batch is written.
+        file_format (str): "parquet", "ipc" or "stream", or None without a path.
+        rows_written (int): The number of rows in the batches written so far.
+
+    Args:
+        path (str, optional): The file to write, or the directory to add a part file to if append is set. Defaults to
+            None, which keeps the batches in memory.
+        columns (iterable, optional): The result columns. Defaults to the columns of FusedFarmEvaluator.
+        index_name (str, optional): The name of the key column. Defaults to "farm_id".
+        batch_size (int, optional): The number of rows in each batch. Defaults to DEFAULT_BATCH_SIZE.
+        file_format (str, optional): "parquet", "ipc" or "stream". Defaults to the format implied by the file extension,
+            or "parquet" in append mode.
+        append (bool, optional): Whether to add a part file to the directory at path rather than write a single file.
+            Defaults to False.
+
+    Raises:
+        ValueError: If batch_size is less than 1, or append is set without a path.
+
+    Methods:
+        add(key, values): Adds a row.
+        add_records(records): Adds a row for each record.
+        add_columns(keys, columns): Adds a row for each key.
+        add_frame(data_frame): Adds a row for each row of a DataFrame indexed by key.
+        add_emissions(dictionaries): Adds a row for each key of one or more emissions dictionaries.
+        flush(): Writes the buffered rows as a batch.
+        close(): Writes the buffered rows and closes the file.
+        to_frame(): Returns every row added to an in-memory writer as a DataFrame.
+    """
+
+    def __init__(
+        self, path=None, columns=None, index_name="farm_id", batch_size=DEFAULT_BATCH_SIZE, file_format=None, append=False
+    ):
+        if columns is None:
+            from sheep_lca.fused_lca import result_columns
+
+            columns = result_columns()
+
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+
+        if append and path is None:
+            raise ValueError("append needs the path of a directory to add part files to")
+
+        self.path = None if path is None else os.fspath(path)
+        self.columns = list(columns)
+        self.index_name = index_name
+        self.batch_size = batch_size
+        self.append = append
+        self.rows_written = 0
+
+        if self.path is None:
+            self.file_format = None
+        elif append and file_format is None:
+            self.file_format = "parquet"
+        else:
+            self.file_format = resolve_file_format(self.path, file_format)
+
+        self._positions = {column: position for position, column in enumerate(self.columns)}
+        self._keys = np.empty(batch_size, dtype=object)
+        self._values = np.zeros((len(self.columns), batch_size))
+        self._size = 0
+
+        self._writer = None
+        self._batches = []
+        self._closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def add(self, key, values):
+        """
+        Adds a row.
+
+        Args:
+            key: The farm_id, scenario or other key of the row.
+            values (dict): The value of each result column of the row. Columns that are not given are zero.
+
+        Raises:
+            KeyError: If a value is given for a column the writer does not have.
+        """
+        self._check_open()
+
+        # the columns are checked before any is set, so a rejected row leaves the buffers as they were
+        positions = [(self._position(column), value) for column, value in values.items()]
+
+        for position, value in positions:
+            self._values[position, self._size] = value
+
+        self._keys[self._size] = key
+        self._advance(1)
+
+    def add_records(self, records):
+        """
+        Adds a row for each record, such as the records of FusedFarmEvaluator.evaluate_stream.
+
+        Args:
+            records (iterable): Dictionaries holding the key of the row under index_name, and the value of each result
+                column.
+        """
+        for record in records:
+            record = dict(record)
+            self.add(record.pop(self.index_name), record)
+
+    def add_columns(self, keys, columns):
+        """
+        Adds a row for each key, with the values of each column as an array, as returned by FusedFarmEvaluator.evaluate_herd.
+
+        Args:
+            keys (array-like): The key of each row.
+            columns (dict): An array, or scalar, of each result column, aligned with keys. Columns that are not given are
+                zero.
+
+        Raises:
+            KeyError: If a column is given that the writer does not have.
+        """
+        self._check_open()
+
+        keys = np.asarray(keys, dtype=object)
+        positions = [(self._position(column), np.broadcast_to(values, len(keys))) for column, values in columns.items()]
+
+        start = 0
+
+        # the rows are copied a slice at a time, writing a batch whenever the buffers fill
+        while start < len(keys):
+            stop = start + min(len(keys) - start, self.batch_size - self._size)
+            rows = slice(self._size, self._size + stop - start)
+
+            self._keys[rows] = keys[start:stop]
+
+            for position, values in positions:
+                self._values[position, rows] = values[start:stop]
+
+            self._advance(stop - start)
+            start = stop
+
+    def add_frame(self, data_frame):
+        """
+        Adds a row for each row of a DataFrame indexed by key, such as the results of FusedFarmEvaluator.evaluate or
+        ScenarioSweep.run.
+
+        Args:
+            data_frame (pandas.DataFrame): The results, with a result column for each of its columns.
+        """
+        self.add_columns(
+            data_frame.index.to_numpy(), {column: data_frame[column].to_numpy() for column in data_frame.columns}
+        )
+
+    def add_emissions(self, dictionaries):
+        """
+        Adds a row for each key of one or more emissions dictionaries, such as those of
+        ClimateChangeTotals.create_emissions_dictionary, mapping each category to the value of each key, or of the
+        EmissionsTables of create_emissions_table.
+
+        Args:
+            dictionaries (dict): Each emissions dictionary or table, keyed by the prefix of its result columns, for example
+                {"climate_change_": climate, "eutrophication_": eutrophication}. The rows are keyed as the first category
+                of the first dictionary, or the keys of the first table, and every category must have a value for each of
+                them.
+        """
+        keys = None
+        columns = {}
+
+        for prefix, emissions in dictionaries.items():
+            if isinstance(emissions, EmissionsTable):
+                # the rows of a table are already arrays, aligned with its keys
+                if keys is None:
+                    keys = emissions.keys
+
+                positions = None if keys is emissions.keys else [emissions.key_position(key) for key in keys]
+
+                for category, values in zip(emissions.categories, emissions.values):
+                    columns[prefix + category] = values if positions is None else values[positions]
+
+                continue
+
+            for category, values in emissions.items():
+                if keys is None:
+                    keys = list(values)
+
+                columns[prefix + category] = np.fromiter((values[key] for key in keys), dtype=float, count=len(keys))
+
+        if keys:
+            self.add_columns(keys, columns)
+
+    def flush(self):
+        """
+        Writes the buffered rows as a batch, to the file or to memory, and empties the buffers.
+        """
+        if not self._size:
+            return
+
+        keys = self._keys[: self._size].copy()
+        values = self._values[:, : self._size].copy()
+
+        if self.path is None:
+            self._batches.append((keys, values))
+        else:
+            self._write(keys, values)
+
+        self.rows_written += self._size
+        self._keys[: self._size] = None
+        self._values[:, : self._size] = 0
+        self._size = 0
+
+    def close(self):
+        """
+        Writes the buffered rows and closes the file. A writer that was given rows is never left without a file.
+        """
+        if self._closed:
+            return
+
+        self.flush()
+
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+        self._closed = True
+
+    def to_frame(self):
+        """
+        Returns every row added to an in-memory writer, including any still buffered.
+
+        Returns:
+            pandas.DataFrame: The result columns, indexed by index_name.
+
+        Raises:
+            ValueError: If the writer has a path; read the file instead.
+        """
+        import pandas as pd
+
+        if self.path is not None:
+            raise ValueError("the rows of a writer with a path are in its file; read it instead")
+
+        self.flush()
+
+        keys = np.concatenate([keys for keys, _ in self._batches]) if self._batches else np.empty(0, dtype=object)
+        values = np.hstack([values for _, values in self._batches]) if self._batches else self._values[:, :0]
+
+        return pd.DataFrame(
+            dict(zip(self.columns, values)), index=pd.Index(list(keys), name=self.index_name), columns=self.columns
+        )
+
+    def _position(self, column):
+        try:
+            return self._positions[column]
+        except KeyError:
+            raise KeyError(f"{column!r} is not a result column of this writer") from None
+
+    def _advance(self, n_rows):
+        self._size += n_rows
+
+        if self._size == self.batch_size:
+            self.flush()
+
+    def _check_open(self):
+        if self._closed:
+            raise ValueError("the writer is closed")
+
+    def _write(self, keys, values):
+        """
+        Writes a batch of rows to the file, opening it on the first batch.
+        """
+        pyarrow = import_pyarrow()
+
+        arrays = [pyarrow.array(keys.tolist())]
+        arrays.extend(pyarrow.array(column) for column in values)
+        batch = pyarrow.RecordBatch.from_arrays(arrays, names=[self.index_name] + self.columns)
+
+        if self._writer is None:
+            self._writer = self._open(pyarrow, batch.schema)
+
+        if self.file_format == "parquet":
+            self._writer.write_batch(batch, row_group_size=len(keys))
+        else:
+            self._writer.write_batch(batch)
+
+    def _open(self, pyarrow, schema):
+        """
+        Opens the file, or the next part file of the directory in append mode.
+        """
+        path = self.path
+
+        if self.append:
+            path = self._next_part(schema)
+
+        if self.file_format == "parquet":
+            import pyarrow.parquet
+
+            return pyarrow.parquet.ParquetWriter(path, schema)
+
+        import pyarrow.ipc
+
+        if self.file_format == "ipc":
+            return pyarrow.ipc.new_file(path, schema)
+
+        return pyarrow.ipc.new_stream(path, schema)
+
+    def _next_part(self, schema):
+        """
+        Returns the path of the next part file of the append directory, checking that the existing parts have the same
+        columns.
+        """
+        extension = PART_EXTENSIONS[self.file_format]
+        os.makedirs(self.path, exist_ok=True)
+
+        # only numbered parts count, so other files that happen to match part-*.parquet are left alone
+        parts = {}
+
+        for name in os.listdir(self.path):
+            number = name[len("part-"): -len(extension)]
+
+            if name.startswith("part-") and name.endswith(extension) and number.isascii() and number.isdigit():
+                parts[int(number)] = name
+
+        if not parts:
+            return os.path.join(self.path, f"part-{0:05d}{extension}")
+
+        last = max(parts)
+        existing = _read_schema(os.path.join(self.path, parts[last]), self.file_format)
+
+        if existing.names != schema.names:
+            raise ValueError(f"the columns of the parts in {self.path!r} differ from the columns of this writer")
+
+        return os.path.join(self.path, f"part-{last + 1:05d}{extension}")
+
+
+def _read_schema(path, file_format):
+    """
+    Reads the Arrow schema of a written part file.
+    """
+    pyarrow = import_pyarrow()
+
+    if file_format == "parquet":
+        import pyarrow.parquet
+
+        return pyarrow.parquet.read_schema(path)
+
+    import pyarrow.ipc
+
+    with pyarrow.OSFile(path) as source:
+        reader = pyarrow.ipc.open_file(source) if file_format == "ipc" else pyarrow.ipc.open_stream(source)
+
+        return reader.schema
@@ -7,7 +7,18 @@ to the life cycle assessment (LCA) of sheep within a specified region (Ireland).
 animal characteristics, and other environmental impact parameters specific to various sheep cohorts (e.g., dairy cows, bulls, calves) 
 and management practices (e.g., feeding, manure management). This centralized management supports the calculation and analysis of environmental 
 impacts associated with different livestock management strategies.
+
+The module also provides the LCADataManagerRegistry class, a process-wide registry that hands out a single, shared and 
+read-only LCADataManager per emissions factor country, so that the database is only loaded once per country per process.
+
+The FactorTable class holds the cohort, grazing, storage and spreading factors of an LCADataManager resolved to floats, 
+both as read-only mappings for the scalar stage classes and as read-only arrays indexed by integer codes for array code.
 """
+import math
+import threading
+from collections.abc import Mapping
+from functools import cached_property
+from types import MappingProxyType
 from sheep_lca.resource_manager.data_loader import Loader
 
 class LCADataManager:
@@ -34,13 +45,16 @@ class LCADataManager:
         storage_MCF (dict): Methane Conversion Factors (MCF) applicable to different storage scenarios.
         storage_N2O (dict): Nitrous Oxide (N2O) emissions factors for varying manure storage types.
         daily_spreading (dict): Ammonia emissions factors for different manure spreading practices.
+        factor_table (FactorTable): The cohort, grazing, storage and spreading factors above, resolved once to floats.
     
     Args:
         ef_country (str): A country identifier used to load specific datasets applicable to the given region.
+        cache_dir (str, optional): A directory for the on-disk cache of parsed reference data, see Loader.
+        loader (Loader, optional): An already populated Loader for the country, used instead of loading the data again.
     """
-    def __init__(self, ef_country):
+    def __init__(self, ef_country, cache_dir=None, loader=None):
 
-        self.loader_class = Loader(ef_country)
+        self.loader_class = loader if loader is not None else Loader(ef_country, cache_dir)
 
         self.cohorts_data = {
             "ewes": {
@@ -166,6 +180,18 @@ class LCADataManager:
             "trailing hose": self.loader_class.emissions_factors.get_ef_nh3_daily_spreading_traling_hose,
         }
 
+        # The lookups are shared between every stage class via the LCADataManagerRegistry, so they are exposed read-only.
+        self.cohorts_data = MappingProxyType(
+            {cohort: MappingProxyType(parameters) for cohort, parameters in self.cohorts_data.items()}
+        )
+        self.grazing_type = MappingProxyType(self.grazing_type)
+        self.storage_TAN = MappingProxyType(self.storage_TAN)
+        self.storage_MCF = MappingProxyType(self.storage_MCF)
+        self.storage_N2O = MappingProxyType(self.storage_N2O)
+        self.daily_spreading = MappingProxyType(self.daily_spreading)
+
+        self.factor_table = FactorTable(self)
+
 
     def get_lactation_weight(self):
         """
@@ -178,6 +204,16 @@ class LCADataManager:
         return self.loader_class.animal_features.get_lamb_less_1_yr_weight()- self.loader_class.animal_features.get_lamb_weight_at_birth()
     
 
+    def get_factor_table(self):
+        """
+        Retrieves the resolved cohort, grazing, storage and spreading factors.
+
+        Returns:
+            FactorTable: The factor table of this data manager.
+        """
+        return self.factor_table
+    
+
     def get_cohort_keys(self):
         """
         Retrieves the keys (names) of all sheep cohorts available in the data.
@@ -665,4 +701,290 @@ class LCADataManager:
             float: The upstream emissions po4e factor for concentrate.
         """
         return self.loader_class.concentrates.get_con_po4_e(con_type)
-    
\ No newline at end of file
+    
+
+class FactorTable:
+    """
+    The cohort, grazing type, manure storage and daily spreading factors of an LCADataManager, resolved once to floats.
+
+    The LCADataManager lookups hold bound getter methods, which must be called on every use. The FactorTable calls each of 
+    them once and keeps the results in two read-only forms:
+
+    - mappings of name to float (cohort, grazing, storage_TAN, storage_MCF, storage_N2O, daily_spreading), used by the 
+      scalar stage classes, e.g. factor_table.cohort["ewes"]["coefficient"].
+    - arrays indexed by integer codes (cohort_factors, grazing_factors, storage_TAN_factors, storage_MCF_factors, 
+      storage_N2O_factors, daily_spreading_factors), used to gather factors for many rows at once, e.g. 
+      factor_table.cohort_factors[cohort_codes, factor_table.parameter_codes["coefficient"]].
+
+    Cohorts without a pregnancy coefficient have a pregnancy factor of 0, and lactation is 1 for lactating cohorts and 0 
+    otherwise. Any other factor missing from the database raises ValueError when it is read from a mapping, and is NaN in
+    the arrays, where HerdTable raises when a term uses it. A missing factor therefore fails the formula that needs it
+    rather than reaching a total. The arrays are built from the mappings on first use.
+
+    Attributes:
+        cohort_parameters (tuple): The names of the cohort parameters, in column order of cohort_factors.
+        cohort_codes, grazing_codes, storage_codes, spreading_codes (MappingProxyType): The integer code of each name.
+        parameter_codes (MappingProxyType): The column of each cohort parameter in cohort_factors.
+        cohort_factors (numpy.ndarray): The cohort parameters, one row per cohort code.
+        grazing_factors, storage_TAN_factors, storage_MCF_factors, storage_N2O_factors, daily_spreading_factors 
+            (numpy.ndarray): The factor for each grazing, storage or spreading code.
+        cohort, grazing, storage_TAN, storage_MCF, storage_N2O, daily_spreading (FactorMapping): The same factors 
+            keyed by name.
+        lactation_weight (float): The lamb weight used for the energy of lactation.
+
+    Args:
+        data_manager (LCADataManager): The data manager whose lookups are resolved.
+    """
+    cohort_parameters = (
+        "coefficient",
+        "bwi",
+        "bwf",
+        "coefficient_a",
+        "coefficient_b",
+        "pregnancy",
+        "lactation",
+        "total_ammonia_nitrogen",
+        "direct_n2o",
+        "atmospheric_deposition",
+        "leaching",
+        "direct_soil_n2o",
+        "methane_conversion_factor",
+    )
+
+    def __init__(self, data_manager):
+        self.cohort_codes = _codes(data_manager.cohorts_data.keys())
+        self.grazing_codes = _codes(data_manager.grazing_type.keys())
+        self.storage_codes = _codes(data_manager.storage_TAN.keys())
+        self.spreading_codes = _codes(data_manager.daily_spreading.keys())
+        self.parameter_codes = _codes(self.cohort_parameters)
+
+        self.cohort = MappingProxyType(
+            {
+                cohort: FactorMapping(
+                    {
+                        parameter: _resolve(
+                            data_manager.cohorts_data[cohort][parameter],
+                            0.0 if parameter == "pregnancy" else float("nan"),
+                        )
+                        for parameter in self.cohort_parameters
+                    },
+                    f"the {{}} factor of the {cohort!r} cohort",
+                )
+                for cohort in self.cohort_codes
+            }
+        )
+        self.grazing = _resolve_all(data_manager.grazing_type, "the grazing factor of {}")
+        self.storage_TAN = _resolve_all(data_manager.storage_TAN, "the storage TAN factor of {}")
+        self.storage_MCF = _resolve_all(data_manager.storage_MCF, "the storage MCF factor of {}")
+        self.storage_N2O = _resolve_all(data_manager.storage_N2O, "the storage N2O factor of {}")
+        self.daily_spreading = _resolve_all(data_manager.daily_spreading, "the daily spreading factor of {}")
+
+        self._lactation_weight = _resolve(data_manager.get_lactation_weight())
+
+    @property
+    def lactation_weight(self):
+        if math.isnan(self._lactation_weight):
+            raise ValueError("the lactation weight is missing from the database")
+
+        return self._lactation_weight
+
+    # The arrays are built on first use, so that the scalar stage classes do not need NumPy
+
+    @cached_property
+    def cohort_factors(self):
+        return _read_only([parameters.values_or_nan() for parameters in self.cohort.values()])
+
+    @cached_property
+    def grazing_factors(self):
+        return _read_only(self.grazing.values_or_nan())
+
+    @cached_property
+    def storage_TAN_factors(self):
+        return _read_only(self.storage_TAN.values_or_nan())
+
+    @cached_property
+    def storage_MCF_factors(self):
+        return _read_only(self.storage_MCF.values_or_nan())
+
+    @cached_property
+    def storage_N2O_factors(self):
+        return _read_only(self.storage_N2O.values_or_nan())
+
+    @cached_property
+    def daily_spreading_factors(self):
+        return _read_only(self.daily_spreading.values_or_nan())
+
+
+class FactorMapping(Mapping):
+    """
+    A read-only mapping of names to the factors of a FactorTable. A factor missing from the database is held as NaN and
+    raises ValueError when it is read, so it fails the formula that uses it instead of propagating into a total.
+
+    Args:
+        factors (dict): The factor of each name, NaN where it is missing.
+        description (str): Describes a factor in error messages, with {} standing for its name.
+
+    Methods:
+        get_or_nan(name): Returns a factor, or NaN if it is missing or the name is unknown, without raising.
+        values_or_nan(): Returns every factor, in order, with NaN for those that are missing.
+    """
+    __slots__ = ("_factors", "_description")
+
+    def __init__(self, factors, description):
+        self._factors = factors
+        self._description = description
+
+    def __getitem__(self, name):
+        value = self._factors[name]
+
+        if math.isnan(value):
+            raise ValueError(f"{self._description.format(repr(name))} is missing from the database")
+
+        return value
+
+    def __iter__(self):
+        return iter(self._factors)
+
+    def __len__(self):
+        return len(self._factors)
+
+    def __repr__(self):
+        return f"FactorMapping({self._factors!r})"
+
+    def get_or_nan(self, name):
+        """
+        Returns a factor for gathering into an array, where missing values are checked when they are used.
+        """
+        return self._factors.get(name, float("nan"))
+
+    def values_or_nan(self):
+        """
+        Returns every factor for building an array, where missing values are checked when they are used.
+        """
+        return list(self._factors.values())
+
+
+def _resolve(value, missing=float("nan")):
+    """
+    Resolves a lookup entry to a float: getters are called, None becomes the missing value and booleans become 1 or 0.
+    """
+    if callable(value):
+        value = value()
+
+    if value is None:
+        return missing
+
+    return float(value)
+
+
+def _resolve_all(lookup, description):
+    """
+    Resolves every entry of a lookup, returning a read-only mapping of name to float.
+    """
+    return FactorMapping({name: _resolve(value) for name, value in lookup.items()}, description)
+
+
+def _codes(names):
+    """
+    Numbers names in order, returning a read-only mapping of name to code.
+    """
+    return MappingProxyType({name: code for code, name in enumerate(names)})
+
+
+def _read_only(values):
+    """
+    Returns values as a float array that cannot be written to.
+    """
+    import numpy as np
+
+    array = np.array(values, dtype=float)
+    array.setflags(write=False)
+
+    return array
+
+
+class LCADataManagerRegistry:
+    """
+    A process-wide registry of LCADataManager instances keyed by emissions factor country.
+
+    Constructing an LCADataManager opens the sheep database and loads every reference table, and each stage class in the 
+    lca module needs one. The registry builds the data manager for a country the first time it is requested and hands the 
+    same, read-only instance to every subsequent caller, so constructing any number of stage or totals classes costs a 
+    single database load per country per process.
+
+    The number of data managers actually built for each country is tracked, which makes it possible to verify that 
+    repeated construction of the totals classes no longer touches the database.
+
+    Methods:
+        get_data_manager(ef_country): Returns the shared LCADataManager for the given country, loading it on first use.
+        get_load_count(ef_country=None): Returns the number of times data has been loaded for a country, or in total.
+        register(ef_country, data_manager): Registers an already built data manager for a country.
+        clear(): Drops all registered data managers and resets the load counters.
+    """
+    _data_managers = {}
+    _load_counts = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_data_manager(cls, ef_country):
+        """
+        Returns the shared LCADataManager for the given country, loading it on first use.
+
+        Args:
+            ef_country (str): The emissions factor country.
+
+        Returns:
+            LCADataManager: The shared data manager for the specified country.
+        """
+        data_manager = cls._data_managers.get(ef_country)
+
+        if data_manager is None:
+            with cls._lock:
+                data_manager = cls._data_managers.get(ef_country)
+
+                if data_manager is None:
+                    data_manager = LCADataManager(ef_country)
+                    cls._data_managers[ef_country] = data_manager
+                    cls._load_counts[ef_country] = cls._load_counts.get(ef_country, 0) + 1
+
+        return data_manager
+    
+
+    @classmethod
+    def get_load_count(cls, ef_country=None):
+        """
+        Returns the number of times reference data has been loaded from the database.
+
+        Args:
+            ef_country (str, optional): The emissions factor country. If None, the total across all countries is returned.
+
+        Returns:
+            int: The number of data managers built for the specified country, or for all countries.
+        """
+        if ef_country is None:
+            return sum(cls._load_counts.values())
+        
+        return cls._load_counts.get(ef_country, 0)
+    
+
+    @classmethod
+    def clear(cls):
+        """
+        Drops all registered data managers and resets the load counters. The next request for a country will reload its data.
+        """
+        with cls._lock:
+            cls._data_managers.clear()
+            cls._load_counts.clear()
+    
+
+    @classmethod
+    def register(cls, ef_country, data_manager):
+        """
+        Registers an already built data manager for a country, replacing any registered one. This does not count as a load.
+
+        Args:
+            ef_country (str): The emissions factor country.
+            data_manager (LCADataManager): The data manager to hand out for the country.
+        """
+        with cls._lock:
+            cls._data_managers[ef_country] = data_manager
@@ -0,0 +1,116 @@
+"""
+Scenario Module
+---------------
+
+This module contains the ScenarioSweep class, which evaluates the whole-herd categories of the vectorised totals for many
+scenarios that each change a few cohort attributes of a shared baseline herd.
+
+Backcasting workflows typically vary one or two attributes, such as con_amount, t_outdoors or mm_storage, across thousands
+of scenarios while everything else stays fixed. Rather than building the herd again for each scenario, the sweep evaluates
+the baseline HerdTable once and derives each scenario from it with HerdTable.with_attributes: only the factors resolved
+from a changed categorical attribute are looked up again, and only the terms that depend on a changed attribute or factor
+are recomputed. Every other term is shared with the baseline. Changing con_amount, for example, leaves the maintenance,
+activity, growth and wool energy terms untouched.
+"""
+import numpy as np
+import pandas as pd
+
+from sheep_lca.vectorised_lca import VectorisedTotals, herd_categories
+
+
+class ScenarioSweep(VectorisedTotals):
+    """
+    Evaluates the whole-herd climate change, eutrophication and air quality categories for a set of scenarios derived
+    from a baseline herd.
+
+    Each scenario is a dictionary of attribute changes in the form accepted by HerdTable.with_attributes, for example
+    {"con_amount": lambda current: current * 1.1} to raise concentrate by 10%, {"t_outdoors": 20} to set the time outdoors
+    of every cohort, or {("mm_storage", "lambs"): "tank liquid"} to change the manure storage of a single cohort. See
+    VectorisedTotals for the ef_country and store arguments.
+
+    Attributes:
+        categories (dict): The totals method evaluated for each category, keyed by category name.
+
+    Args:
+        ef_country (str, optional): The emissions factor country.
+        store (MultiCountryStore, optional): A store of several countries, used instead of ef_country.
+
+    Methods:
+        scenario_herd(baseline, changes): Returns the HerdTable of a scenario.
+        run(baseline, scenarios, categories=None, by_farm=False): Returns the categories of the baseline and each scenario.
+    """
+    baseline_name = "baseline"
+
+    def __init__(self, ef_country=None, store=None):
+        super().__init__(ef_country, store)
+
+        self.categories = herd_categories(ef_country, store)
+
+    def scenario_herd(self, baseline, changes):
+        """
+        Derives the herd table of a scenario from the baseline.
+
+        Parameters:
+            baseline (HerdTable, pandas.DataFrame or dict): The baseline herd table, or livestock data to build it from.
+            changes (dict): The attribute changes of the scenario.
+
+        Returns:
+            HerdTable: The scenario herd table, sharing every term that does not depend on the changes with the baseline.
+        """
+        return self._as_herd(baseline).with_attributes(changes)
+
+    def run(self, baseline, scenarios, categories=None, by_farm=False):
+        """
+        Evaluates the selected categories for the baseline and for each scenario.
+
+        Parameters:
+            baseline (HerdTable, pandas.DataFrame or dict): The baseline herd table, or livestock data to build it from.
+            scenarios (dict or list): The attribute changes of each scenario, keyed by scenario name, or a list of them,
+                in which case the scenarios are numbered from zero.
+            categories (list, optional): The names of the categories to evaluate. Defaults to all of them.
+            by_farm (bool, optional): Whether to report each farm rather than the sum over all farms. Defaults to False.
+
+        Returns:
+            pandas.DataFrame: A row per scenario, starting with the baseline, and a column per category. With by_farm, a
+            row per scenario and farm, indexed by (scenario, farm_id).
+
+        Raises:
+            KeyError: If a category or changed attribute is unknown.
+            ValueError: If a scenario is named after the baseline.
+        """
+        herd = self._as_herd(baseline)
+        categories = list(self.categories) if categories is None else list(categories)
+
+        for category in categories:
+            if category not in self.categories:
+                raise KeyError(f"unknown category {category!r}")
+
+        if not isinstance(scenarios, dict):
+            scenarios = dict(enumerate(scenarios))
+
+        if self.baseline_name in scenarios:
+            raise ValueError(f"{self.baseline_name!r} is reserved for the baseline and cannot name a scenario")
+
+        names = [self.baseline_name, *scenarios]
+
+        # (scenarios, categories, farms); the baseline is evaluated first, so its terms are cached before they are shared
+        results = np.empty((len(names), len(categories), herd.n_farms))
+
+        for position, name in enumerate(names):
+            scenario = herd if position == 0 else herd.with_attributes(scenarios[name])
+
+            for index, category in enumerate(categories):
+                results[position, index] = self.categories[category](scenario)
+
+        if not by_farm:
+            return pd.DataFrame(
+                results.sum(axis=2),
+                index=pd.Index(names, name="scenario"),
+                columns=categories,
+            )
+
+        return pd.DataFrame(
+            results.transpose(0, 2, 1).reshape(-1, len(categories)),
+            index=pd.MultiIndex.from_product([names, herd.farm_ids], names=["scenario", "farm_id"]),
+            columns=categories,
+        )
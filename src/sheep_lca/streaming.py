@@ -0,0 +1,75 @@
+"""
+Streaming Module
+----------------
+
+This module regroups a stream of livestock row chunks into chunks of whole farms, so that farms can be evaluated, and
+their results passed on, as soon as all of their cohorts have been read rather than after the whole herd is loaded.
+
+The rows of each farm must be contiguous in the stream, as they are when the input is sorted or grouped by farm_id, but a
+farm may span any number of chunks. Only the rows of the farm at the end of a chunk are held back until the next chunk
+shows whether the farm continues, so memory use is bounded by the chunk size and the largest farm, whatever the size of
+the input.
+"""
+import pandas as pd
+
+
+def complete_farm_chunks(chunks, check_grouped=True):
+    """
+    Regroups livestock row chunks so that each yielded chunk holds only farms whose rows have all been seen.
+
+    Args:
+        chunks (iterable): DataFrames of livestock rows, in the format accepted by load_livestock_data, with the rows of
+            each farm contiguous across the stream.
+        check_grouped (bool, optional): Whether to check that no farm reappears after it was completed, which keeps the
+            id of every farm seen. Defaults to True.
+
+    Yields:
+        pandas.DataFrame: The rows of one or more complete farms, in stream order.
+
+    Raises:
+        ValueError: If check_grouped is set and the rows of a farm are not contiguous.
+    """
+    pending = None
+    seen = set()
+
+    for chunk in chunks:
+        if pending is not None:
+            chunk = pd.concat([pending, chunk], ignore_index=True)
+
+        if not len(chunk):
+            pending = chunk
+            continue
+
+        farm_ids = chunk["farm_id"].to_numpy()
+
+        # the rows of the last farm of the chunk, which may continue in the next chunk, are held back
+        other = farm_ids != farm_ids[-1]
+        boundary = len(farm_ids) - other[::-1].argmax() if other.any() else 0
+
+        complete, pending = chunk.iloc[:boundary], chunk.iloc[boundary:]
+
+        if len(complete):
+            _check(complete, seen, check_grouped)
+            yield complete
+
+    if pending is not None and len(pending):
+        _check(pending, seen, check_grouped)
+        yield pending
+
+
+def _check(complete, seen, check_grouped):
+    """
+    Records the farms of a complete chunk, and raises if any was already completed.
+    """
+    if not check_grouped:
+        return
+
+    farm_ids = pd.unique(complete["farm_id"])
+    repeated = seen.intersection(farm_ids)
+
+    if repeated:
+        raise ValueError(
+            f"the rows of farm {next(iter(repeated))!r} are not contiguous; sort or group the livestock data by farm_id"
+        )
+
+    seen.update(farm_ids)
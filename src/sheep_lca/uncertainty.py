@@ -0,0 +1,271 @@
+"""
+Uncertainty Module
+------------------
+
+This module contains the MonteCarloEngine class, which propagates the uncertainty of selected emissions factors and feed
+properties through the vectorised totals, and the distributions used to describe that uncertainty.
+
+The factors loaded from the sheep database are point estimates. The engine draws a number of samples of the selected
+factors, such as the methane conversion factor (Ym), the direct N2O factor for pasture, range and paddock (EF3 PRP) or the
+TAN fractions, and evaluates the farm totals for every sample in one vectorised batch: the sampled factors are given a
+leading sample axis, and every term of the HerdTable that depends on them is evaluated for all samples at once. Terms
+that do not depend on a sampled factor are evaluated once.
+
+Each draw of a factor is shared by every row of the herd, as inventory factors are national parameters rather than
+properties of individual farms.
+"""
+import numpy as np
+import pandas as pd
+
+from sheep_lca.vectorised_lca import VectorisedTotals, herd_categories
+
+
+class Distribution:
+    """
+    The base of the factor distributions. A distribution draws the samples of one factor for every row of a HerdTable.
+
+    Parameters are multipliers of the point estimate of each row when relative is True, and absolute factor values
+    otherwise. Any callable with the signature of sample can be used in place of a Distribution.
+
+    Attributes:
+        relative (bool): Whether the parameters are multipliers of the point estimate rather than absolute values.
+
+    Methods:
+        sample(rng, point, n_samples): Returns the samples of the factor for each row.
+    """
+    def __init__(self, relative=True):
+        self.relative = relative
+
+    def sample(self, rng, point, n_samples):
+        """
+        Draws the samples of a factor.
+
+        Args:
+            rng (numpy.random.Generator): The random number generator.
+            point (numpy.ndarray): The point estimate of the factor for each row.
+            n_samples (int): The number of samples.
+
+        Returns:
+            numpy.ndarray: The samples, of shape (n_samples, rows).
+        """
+        draws = self.draw(rng, n_samples)[:, None]
+
+        return point * draws if self.relative else np.broadcast_to(draws, (n_samples, len(point)))
+
+    def draw(self, rng, n_samples):
+        """
+        Draws one value per sample. Implemented by each distribution.
+        """
+        raise NotImplementedError
+
+    def __call__(self, rng, point, n_samples):
+        return self.sample(rng, point, n_samples)
+
+
+class Normal(Distribution):
+    """
+    A normal distribution. When relative, the point estimate is scaled by a draw from N(1, sd); otherwise each row's point
+    estimate is shifted by a draw from N(0, sd).
+
+    Args:
+        sd (float): The standard deviation, as a fraction of the point estimate when relative.
+        relative (bool, optional): Defaults to True.
+    """
+    def __init__(self, sd, relative=True):
+        super().__init__(relative)
+        self.sd = sd
+
+    def sample(self, rng, point, n_samples):
+        if self.relative:
+            return super().sample(rng, point, n_samples)
+
+        return point + rng.normal(0.0, self.sd, n_samples)[:, None]
+
+    def draw(self, rng, n_samples):
+        return rng.normal(1.0, self.sd, n_samples)
+
+
+class Uniform(Distribution):
+    """
+    A uniform distribution between low and high.
+
+    Args:
+        low (float): The lower bound.
+        high (float): The upper bound.
+        relative (bool, optional): Defaults to True.
+    """
+    def __init__(self, low, high, relative=True):
+        super().__init__(relative)
+        self.low = low
+        self.high = high
+
+    def draw(self, rng, n_samples):
+        return rng.uniform(self.low, self.high, n_samples)
+
+
+class Triangular(Distribution):
+    """
+    A triangular distribution between low and high, peaking at mode.
+
+    Args:
+        low (float): The lower bound.
+        mode (float): The most likely value.
+        high (float): The upper bound.
+        relative (bool, optional): Defaults to True.
+    """
+    def __init__(self, low, mode, high, relative=True):
+        super().__init__(relative)
+        self.low = low
+        self.mode = mode
+        self.high = high
+
+    def draw(self, rng, n_samples):
+        return rng.triangular(self.low, self.mode, self.high, n_samples)
+
+
+class Lognormal(Distribution):
+    """
+    A lognormal distribution whose median is the point estimate of each row.
+
+    Args:
+        sigma (float): The standard deviation of the underlying normal distribution.
+    """
+    def __init__(self, sigma):
+        super().__init__(relative=True)
+        self.sigma = sigma
+
+    def draw(self, rng, n_samples):
+        return rng.lognormal(0.0, self.sigma, n_samples)
+
+
+class MonteCarloEngine(VectorisedTotals):
+    """
+    Propagates the uncertainty of selected factors through the vectorised climate change, eutrophication and air quality
+    totals.
+
+    Distributions are given as a dictionary keyed by the name of a HerdTable factor, for example
+    "methane_conversion_factor", "direct_n2o", "total_ammonia_nitrogen", "storage_TAN" or "forage_digestibility". A key may
+    also be a (factor, cohort) pair, in which case only the rows of that cohort are sampled, for example
+    ("methane_conversion_factor", "ewes") for the Ym of adult sheep only. See VectorisedTotals for the ef_country and
+    store arguments.
+
+    Attributes:
+        categories (dict): The totals method evaluated for each category, keyed by category name.
+        n_samples (int): The number of samples drawn.
+        chunk_size (int): The number of samples evaluated at a time, bounding the memory used for large herds.
+        rng (numpy.random.Generator): The random number generator.
+
+    Args:
+        ef_country (str, optional): The emissions factor country.
+        store (MultiCountryStore, optional): A store of several countries, used instead of ef_country.
+        n_samples (int, optional): The number of samples to draw. Defaults to 1000.
+        seed (int, optional): The seed of the random number generator.
+        chunk_size (int, optional): The number of samples evaluated at a time. Defaults to 1000.
+
+    Raises:
+        ValueError: If n_samples or chunk_size is less than 1.
+
+    Methods:
+        simulate(herd, distributions, categories=None): Returns the samples of each category for each farm.
+        run(herd, distributions, percentiles=(2.5, 50, 97.5), categories=None): Returns percentiles of each category for
+            each farm.
+    """
+    def __init__(self, ef_country=None, store=None, n_samples=1000, seed=None, chunk_size=1000):
+        super().__init__(ef_country, store)
+
+        if n_samples < 1 or chunk_size < 1:
+            raise ValueError("n_samples and chunk_size must be at least 1")
+
+        self.n_samples = n_samples
+        self.chunk_size = chunk_size
+        self.rng = np.random.default_rng(seed)
+
+        self.categories = herd_categories(ef_country, store)
+
+    def simulate(self, herd, distributions, categories=None):
+        """
+        Draws the samples of each factor and evaluates the selected categories for every sample.
+
+        Parameters:
+            herd (HerdTable, pandas.DataFrame or dict): The herd table, or livestock data to build it from.
+            distributions (dict): The Distribution, or sampling callable, of each sampled factor.
+            categories (list, optional): The names of the categories to evaluate. Defaults to all of them.
+
+        Returns:
+            dict: An array of shape (n_samples, farms) for each category.
+
+        Raises:
+            KeyError: If a factor or category is unknown.
+        """
+        herd = self._as_herd(herd)
+        categories = list(self.categories) if categories is None else list(categories)
+
+        for category in categories:
+            if category not in self.categories:
+                raise KeyError(f"unknown category {category!r}")
+
+        results = {category: np.empty((self.n_samples, herd.n_farms)) for category in categories}
+
+        for start in range(0, self.n_samples, self.chunk_size):
+            stop = min(start + self.chunk_size, self.n_samples)
+            sampled = herd.with_factors(self._sample_factors(herd, distributions, stop - start))
+
+            for category in categories:
+                # categories that do not depend on a sampled factor have no sample axis
+                results[category][start:stop] = self.categories[category](sampled)
+
+        return results
+
+    def run(self, herd, distributions, percentiles=(2.5, 50, 97.5), categories=None):
+        """
+        Evaluates the selected categories for every sample and summarises them as percentiles.
+
+        Parameters:
+            herd (HerdTable, pandas.DataFrame or dict): The herd table, or livestock data to build it from.
+            distributions (dict): The Distribution, or sampling callable, of each sampled factor.
+            percentiles (tuple, optional): The percentiles to report. Defaults to the median and the 95% interval.
+            categories (list, optional): The names of the categories to evaluate. Defaults to all of them.
+
+        Returns:
+            pandas.DataFrame: One row per farm and category, indexed by (farm_id, category), with a column per percentile.
+        """
+        herd = self._as_herd(herd)
+        samples = self.simulate(herd, distributions, categories)
+
+        # (farms, categories, percentiles)
+        summary = np.stack(
+            [np.percentile(values, percentiles, axis=0).T for values in samples.values()], axis=1
+        )
+
+        return pd.DataFrame(
+            summary.reshape(-1, len(percentiles)),
+            index=pd.MultiIndex.from_product([herd.farm_ids, list(samples)], names=["farm_id", "category"]),
+            columns=list(percentiles),
+        )
+
+    def _sample_factors(self, herd, distributions, n_samples):
+        """
+        Draws the samples of each factor for every row of the herd.
+
+        Parameters:
+            herd (HerdTable): The herd table.
+            distributions (dict): The Distribution, or sampling callable, of each sampled factor.
+            n_samples (int): The number of samples.
+
+        Returns:
+            dict: An array of shape (n_samples, rows) for each sampled factor.
+        """
+        factors = {}
+
+        for key, distribution in distributions.items():
+            name, cohort = key if isinstance(key, tuple) else (key, None)
+
+            if name not in herd.factors:
+                raise KeyError(f"unknown factor {name!r}")
+
+            point = factors.get(name, herd.factors[name])
+            values = np.broadcast_to(distribution(self.rng, herd.factors[name], n_samples), (n_samples, herd.n_rows))
+
+            factors[name] = values if cohort is None else np.where(herd.cohort == cohort, values, point)
+
+        return factors
@@ -0,0 +1,1263 @@
+"""
+Vectorised Sheep LCA Module
+---------------------------
+
+This module contains a NumPy-backed implementation of the whole-herd totals in the lca module. Rather than evaluating one
+AnimalCollection at a time through the scalar stage classes, the cohorts of many farms are held in a single columnar table
+(HerdTable) and every per-cohort formula is evaluated once for all rows with array arithmetic. Farm totals are then
+obtained by summing the population weighted rows of each farm. VectorisedClimateChangeTotals,
+VectorisedEutrophicationTotals and VectorisedAirQualityTotals derive their categories from the same HerdTable terms.
+
+The per-cohort formulas are the nodes of LCA_GRAPH, which mirror those in the Energy, GrassFeed, GrazingStage,
+HousingStage, StorageStage and DailySpread classes, so results match the scalar path to floating-point tolerance. As in
+load_livestock_data, only the last row of each farm and cohort pair is used, cohorts unknown to the data manager are
+ignored and cohorts with a population of zero do not contribute.
+
+A HerdTable built with a MultiCountryStore in place of a single data manager resolves the factors of each row from the
+data manager of that row's ef_country, so livestock from several countries can be evaluated in one run.
+"""
+import copy
+from functools import cached_property
+
+import numpy as np
+import pandas as pd
+
+from sheep_lca.graph import LCA_GRAPH
+from sheep_lca.resource_manager.country_store import MultiCountryStore
+from sheep_lca.resource_manager.models import ANIMAL_CATEGORY_DEFAULTS
+from sheep_lca.resource_manager.sheep_lca_data_manager import LCADataManagerRegistry
+
+
+def _graph_term(name):
+    """
+    Returns a cached property evaluating a node of LCA_GRAPH for every row of a HerdTable. Inputs are read from the resolved
+    factors of the table, its cohort attributes or its other terms.
+
+    Factors missing from the database, or for an unknown category, are resolved to NaN. A term whose values are NaN
+    because of such a factor raises ValueError naming it, as the scalar stage classes raise when they read it.
+    """
+    node = LCA_GRAPH[name]
+
+    def term(self):
+        args = [
+            self.factors[input_name] if input_name in self.factors else getattr(self, input_name)
+            for input_name in node.inputs
+        ]
+        values = node.formula(*args)
+
+        # the factors are only checked when a value is NaN, so a missing factor masked out by the formula is allowed
+        if np.isnan(values).any():
+            for input_name in node.inputs:
+                if input_name in self.factors and np.isnan(self.factors[input_name]).any():
+                    raise ValueError(
+                        f"{name} needs the {input_name} factor, which is missing from the database or unknown for "
+                        f"{np.isnan(self.factors[input_name]).sum()} rows of the table"
+                    )
+
+        return values
+
+    term.__name__ = name
+    term.__doc__ = node.formula.__doc__
+
+    return cached_property(term)
+
+
+class HerdTable:
+    """
+    A columnar table of animal cohorts across many farms, with the emissions factors for every row resolved up front and the
+    intermediate terms of the LCA formulas computed lazily, once, as arrays.
+
+    Each intermediate term (gross energy, volatile solids, nitrogen excretion and so on) is exposed as a cached property, so any
+    number of totals can be derived from the same table while each term is only evaluated a single time.
+
+    Attributes:
+        farm_ids (numpy.ndarray): The unique farm identifiers, in order of first appearance in the livestock data.
+        farm_codes (numpy.ndarray): The position in farm_ids of the farm for each row.
+        cohort (numpy.ndarray): The cohort name of each row.
+        ef_country (numpy.ndarray): The emissions factor country of each row, or None if the data has no ef_country column.
+        farm_ef_country (numpy.ndarray): The emissions factor country of the first row of each farm, aligned with farm_ids,
+            or None if the data has no ef_country column.
+        pop, weight, wool, con_amount, t_outdoors, t_indoors, t_stabled (numpy.ndarray): Numeric cohort attributes for each row.
+        factors (dict): Emissions factors and feed properties resolved for each row, keyed by name.
+        categorical_factors (dict): The factors resolved from each categorical attribute that can be changed.
+        term_inputs (dict): The attributes, factors and terms each cached term is computed from.
+
+    Args:
+        animal_data_frame (pandas.DataFrame): Livestock data in the format accepted by load_livestock_data.
+        data_manager (LCADataManager or MultiCountryStore): The data manager used to resolve the emissions factors for each
+            row, or a store holding the data manager of every ef_country in the livestock data.
+
+    Raises:
+        ValueError: If a MultiCountryStore is given and the livestock data has no ef_country column.
+    """
+    numeric_columns = (
+        "pop",
+        "weight",
+        "wool",
+        "con_amount",
+        "t_outdoors",
+        "t_indoors",
+        "t_stabled",
+    )
+
+    categorical_columns = (
+        "cohort",
+        "forage",
+        "grazing",
+        "con_type",
+        "mm_storage",
+        "daily_spreading",
+    )
+
+    # The factors resolved from each categorical column other than cohort, which is fixed for a row
+    categorical_factors = {
+        "forage": ("forage_digestibility", "grass_gross_energy", "grass_crude_protein"),
+        "grazing": ("grazing_coefficient",),
+        "con_type": (
+            "concentrate_digestibility",
+            "concentrate_gross_energy",
+            "concentrate_crude_protein",
+            "concentrate_digestible_energy",
+            "concentrate_co2e",
+            "concentrate_po4e",
+        ),
+        "mm_storage": ("storage_TAN", "storage_MCF", "storage_N2O"),
+        "daily_spreading": ("daily_spreading_factor",),
+    }
+
+    # The attributes, factors and terms each cached term is computed from, as given by the nodes of LCA_GRAPH
+    term_inputs = {name: node.inputs for name, node in LCA_GRAPH.nodes.items()}
+
+    def __init__(self, animal_data_frame, data_manager):
+        self.data_manager_class = data_manager
+
+        # Farms are numbered in order of first appearance, as the keys of load_livestock_data are
+        farm_codes, farm_ids = _factorize(animal_data_frame["farm_id"].to_numpy())
+        self.farm_ids = farm_ids
+
+        cohort_keys = list(data_manager.get_cohort_keys())
+
+        frame = animal_data_frame.assign(_farm_code=farm_codes)
+        frame = frame[frame["cohort"].isin(cohort_keys)]
+        frame = frame.drop_duplicates(subset=["_farm_code", "cohort"], keep="last")
+        frame = frame[frame["pop"] != 0]
+
+        self.farm_codes = frame["_farm_code"].to_numpy()
+
+        for column in self.numeric_columns:
+            setattr(self, column, self._column(frame, column).astype(float))
+
+        for column in self.categorical_columns:
+            setattr(self, column, self._column(frame, column).astype(object))
+
+        if "ef_country" in frame.columns:
+            self.ef_country = frame["ef_country"].to_numpy().astype(object)
+
+            # farm codes are numbered in order of first appearance, so the first row of each farm is found in code order
+            first_rows = np.unique(farm_codes, return_index=True)[1]
+            self.farm_ef_country = animal_data_frame["ef_country"].to_numpy()[first_rows].astype(object)
+        elif isinstance(data_manager, MultiCountryStore):
+            raise ValueError("livestock data must have an ef_country column to be evaluated with a MultiCountryStore")
+        else:
+            self.ef_country = None
+            self.farm_ef_country = None
+
+        self.factors = self.resolve_factors()
+
+    @staticmethod
+    def _column(frame, column):
+        """
+        Returns a column of the livestock data as an array, using the AnimalCategory default where the column is absent.
+        """
+        if column in frame.columns:
+            return frame[column].to_numpy()
+
+        return np.full(len(frame), ANIMAL_CATEGORY_DEFAULTS[column], dtype=object)
+
+    @property
+    def n_rows(self):
+        """
+        int: The number of contributing cohort rows in the table.
+        """
+        return len(self.farm_codes)
+
+    @property
+    def n_farms(self):
+        """
+        int: The number of farms in the table.
+        """
+        return len(self.farm_ids)
+
+    def resolve_factors(self):
+        """
+        Resolves the emissions factors and feed properties needed by the formulas for every row of the table. With a
+        MultiCountryStore, the rows of each country are resolved with that country's data manager and scattered back.
+
+        Returns:
+            dict: Arrays of factors, one value per row, keyed by factor name.
+        """
+        store = self.data_manager_class
+
+        if not isinstance(store, MultiCountryStore):
+            return self._resolve_rows(self.data_manager_class, slice(None))
+
+        country_codes, countries = _factorize(self.ef_country)
+
+        if not len(countries):
+            return self._resolve_rows(store.get_data_manager(store.countries[0]), slice(None))
+
+        factors = {}
+
+        for code, country in enumerate(countries):
+            rows = np.flatnonzero(country_codes == code)
+
+            for name, values in self._resolve_rows(store.get_data_manager(country), rows).items():
+                factors.setdefault(name, np.empty(self.n_rows))[rows] = values
+
+        return factors
+
+    def _resolve_rows(self, data_manager, rows):
+        """
+        Resolves the factors of a selection of rows with a single data manager. Cohort, grazing, storage and spreading
+        factors are gathered from the data manager's FactorTable by integer code; feed properties are looked up once per
+        distinct value and gathered back onto the rows.
+
+        Args:
+            data_manager (LCADataManager): The data manager of the selected rows.
+            rows (slice or numpy.ndarray): The rows to resolve.
+
+        Returns:
+            dict: Arrays of factors, one value per selected row, keyed by factor name.
+        """
+        factor_table = data_manager.factor_table
+        n_rows = len(self.farm_codes[rows])
+
+        cohort_factors = factor_table.cohort_factors[_encode(self.cohort[rows], factor_table.cohort_codes)]
+        storage_codes = _encode(self.mm_storage[rows], factor_table.storage_codes)
+        forage = self.forage[rows]
+        con_type = self.con_type[rows]
+
+        factors = {
+            parameter: cohort_factors[:, code] for parameter, code in factor_table.parameter_codes.items()
+        }
+
+        factors.update(
+            {
+                "grazing_coefficient": factor_table.grazing_factors[_encode(self.grazing[rows], factor_table.grazing_codes)],
+                "forage_digestibility": _lookup(forage, data_manager.get_forage_digestibility),
+                "grass_gross_energy": _lookup(forage, data_manager.get_grass_dry_matter_gross_energy),
+                "grass_crude_protein": _lookup(forage, data_manager.get_grass_crude_protein),
+                "concentrate_digestibility": _lookup(con_type, data_manager.get_concentrate_digestibility),
+                "concentrate_gross_energy": _lookup(con_type, data_manager.get_con_dry_matter_gross_energy),
+                "concentrate_crude_protein": _lookup(con_type, data_manager.get_concentrate_crude_protein),
+                "concentrate_digestible_energy": _lookup(con_type, data_manager.get_concentrate_digestable_energy),
+                "concentrate_co2e": _lookup(con_type, data_manager.get_upstream_concentrate_co2e),
+                "concentrate_po4e": _lookup(con_type, data_manager.get_upstream_concentrate_po4e),
+                "storage_TAN": factor_table.storage_TAN_factors[storage_codes],
+                "storage_MCF": factor_table.storage_MCF_factors[storage_codes],
+                "storage_N2O": factor_table.storage_N2O_factors[storage_codes],
+                # only the spread terms use this factor, so an unknown practice is left as NaN rather than failing the table
+                "daily_spreading_factor": _lookup(self.daily_spreading[rows], factor_table.daily_spreading.get_or_nan),
+                "lactation_weight": np.full(n_rows, factor_table.lactation_weight),
+                "indirect_atmospheric_deposition": np.full(
+                    n_rows, float(data_manager.get_indirect_atmospheric_deposition())
+                ),
+            }
+        )
+
+        return factors
+
+    def with_farms(self, farm_ids, ef_country=None):
+        """
+        Returns a copy of the table with farms that have no livestock appended, such as farms that only appear in the farm
+        data, so that farm level categories can be evaluated for them alongside the herd. Their livestock totals are zero.
+        The copy has the same rows and factors, and shares every term already computed; see share_terms to keep the terms
+        computed on the copy afterwards.
+
+        Args:
+            farm_ids (array-like): The identifiers of the farms to append.
+            ef_country (array-like, optional): The emissions factor country of each farm, required with a MultiCountryStore.
+
+        Returns:
+            HerdTable: The table with the appended farms.
+
+        Raises:
+            ValueError: If the table was built with a MultiCountryStore and ef_country is not given.
+        """
+        if ef_country is None and isinstance(self.data_manager_class, MultiCountryStore):
+            raise ValueError("the ef_country of each farm is needed to add farms to a multi-country table")
+
+        table = copy.copy(self)
+
+        if self.farm_ef_country is not None:
+            if ef_country is None:
+                ef_country = np.full(len(farm_ids), None, dtype=object)
+
+            table.farm_ef_country = np.concatenate([self.farm_ef_country, np.asarray(ef_country, dtype=object)])
+
+        # appended through pandas so that integer farm ids keep an integer dtype
+        if len(self.farm_ids):
+            table.farm_ids = pd.Index(self.farm_ids).append(pd.Index(farm_ids)).to_numpy()
+        else:
+            table.farm_ids = pd.Index(farm_ids).to_numpy()
+
+        return table
+
+    def share_terms(self, table):
+        """
+        Keeps the terms computed on another table of the same rows and factors, such as one returned by with_farms, so
+        that they are not computed again for this table. Terms are per row, so they do not depend on the farms.
+
+        Args:
+            table (HerdTable): A table copied from this one without changing its rows or factors.
+
+        Raises:
+            ValueError: If the table does not share the rows and factors of this table.
+        """
+        if table.factors is not self.factors or table.farm_codes is not self.farm_codes:
+            raise ValueError("terms can only be shared with a table of the same rows and factors")
+
+        for name in LCA_GRAPH.nodes:
+            if name in table.__dict__:
+                self.__dict__.setdefault(name, table.__dict__[name])
+
+    def farm_factor(self, name):
+        """
+        Resolves a farm level emissions factor, such as those applied to fertiliser inputs, for each farm. With a
+        MultiCountryStore the factor of each farm comes from the data manager of its ef_country.
+
+        Args:
+            name (str): The name of the LCADataManager getter returning the factor, for example "get_ef_urea".
+
+        Returns:
+            numpy.ndarray: The factor for each farm, aligned with farm_ids.
+        """
+        data_manager = self.data_manager_class
+
+        if not isinstance(data_manager, MultiCountryStore):
+            return np.full(self.n_farms, float(getattr(data_manager, name)()))
+
+        return _lookup(
+            self.farm_ef_country,
+            lambda country: getattr(data_manager.get_data_manager(country), name)(),
+        )
+
+    def with_factors(self, factors):
+        """
+        Returns a copy of the table with some of its resolved factors replaced. The copy shares the cohort attributes of
+        this table, and every term already computed that does not depend on the replaced factors; the dependent terms are
+        evaluated again from the new factors on first use.
+
+        Replacement factors may have one value per row, or a leading sample axis of shape (samples, rows) or (samples, 1),
+        in which case every term that depends on them, and the farm totals of those terms, gain the same leading axis.
+
+        Args:
+            factors (dict): The replacement arrays, keyed by factor name.
+
+        Returns:
+            HerdTable: The table with the replaced factors.
+        """
+        table = copy.copy(self)
+        table.factors = {**self.factors, **factors}
+        table._invalidate(factors)
+
+        return table
+
+    def with_attributes(self, attributes):
+        """
+        Returns a copy of the table with some cohort attributes changed, such as con_amount, t_outdoors or mm_storage.
+        Factors resolved from changed categorical attributes are resolved again, and only the computed terms that depend on
+        a changed attribute or factor are evaluated again; every other term is shared with this table.
+
+        Each change is keyed by an attribute name, or by an (attribute, cohort) pair to change the rows of one cohort only.
+        Its value is either the new value, as a scalar or one value per row, or a callable that is given the current values
+        and returns the new ones. Changes apply to the rows of the table, so cohorts with a population of zero in the
+        livestock data, which are not in the table, cannot be given a population.
+
+        Args:
+            attributes (dict): The change of each attribute.
+
+        Returns:
+            HerdTable: The table with the changed attributes.
+
+        Raises:
+            KeyError: If an attribute is not a numeric or categorical column of the table, or is the cohort.
+        """
+        table = copy.copy(self)
+        changed = set()
+
+        for key, value in attributes.items():
+            name, cohort = key if isinstance(key, tuple) else (key, None)
+
+            if name not in self.numeric_columns and name not in self.categorical_factors:
+                raise KeyError(f"{name!r} is not a cohort attribute that can be changed")
+
+            current = getattr(table, name)
+            values = value(current) if callable(value) else value
+            values = np.broadcast_to(np.asarray(values, dtype=current.dtype), current.shape)
+
+            if cohort is not None:
+                values = np.where(self.cohort == cohort, values, current)
+
+            setattr(table, name, np.array(values, dtype=current.dtype))
+            changed.add(name)
+
+        resolved_names = [
+            factor for name in changed if name in self.categorical_factors for factor in self.categorical_factors[name]
+        ]
+
+        table.factors = dict(self.factors)
+
+        if resolved_names:
+            resolved = table.resolve_factors()
+            table.factors.update((factor, resolved[factor]) for factor in resolved_names)
+
+        table._invalidate(changed.union(resolved_names))
+
+        return table
+
+    def dependent_terms(self, names):
+        """
+        Returns the computed terms that depend, directly or through other terms, on any of the given attributes or factors.
+
+        Args:
+            names (iterable): Cohort attribute, factor or term names.
+
+        Returns:
+            set: The names of the dependent terms.
+        """
+        return LCA_GRAPH.dependents(names)
+
+    def _invalidate(self, names):
+        """
+        Drops the cached values of the terms that depend on the given attributes or factors.
+        """
+        for term in self.dependent_terms(names):
+            self.__dict__.pop(term, None)
+
+    def sum_by_farm(self, values):
+        """
+        Sums population weighted row values for each farm.
+
+        Args:
+            values (numpy.ndarray): A value per head for each row of the table, optionally with a leading sample axis.
+
+        Returns:
+            numpy.ndarray: The population weighted total for each farm, aligned with farm_ids, with the same leading axis
+            as values.
+        """
+        weighted = values * self.pop
+
+        if weighted.ndim == 1:
+            return np.bincount(self.farm_codes, weights=weighted, minlength=self.n_farms)
+
+        # one bincount over (sample, farm) pairs rather than a loop over samples
+        n_samples = weighted.shape[0]
+        codes = (np.arange(n_samples)[:, None] * self.n_farms + self.farm_codes).ravel()
+
+        return np.bincount(codes, weights=weighted.ravel(), minlength=n_samples * self.n_farms).reshape(
+            n_samples, self.n_farms
+        )
+
+    ###########################################################################
+    # Energy
+    ###########################################################################
+    ratio_of_net_energy_maintenance = _graph_term("ratio_of_net_energy_maintenance")
+    ratio_of_net_energy_growth = _graph_term("ratio_of_net_energy_growth")
+    net_energy_for_maintenance = _graph_term("net_energy_for_maintenance")
+    net_energy_for_activity = _graph_term("net_energy_for_activity")
+    net_energy_for_weight_gain = _graph_term("net_energy_for_weight_gain")
+    net_energy_for_lactation = _graph_term("net_energy_for_lactation")
+    net_energy_for_wool = _graph_term("net_energy_for_wool")
+    net_energy_for_pregnancy = _graph_term("net_energy_for_pregnancy")
+    gross_energy_from_concentrate = _graph_term("gross_energy_from_concentrate")
+    gross_energy_from_grass = _graph_term("gross_energy_from_grass")
+
+    ###########################################################################
+    # Grass feed
+    ###########################################################################
+    dry_matter_from_grass = _graph_term("dry_matter_from_grass")
+    ch4_emissions_factor = _graph_term("ch4_emissions_factor")
+
+    ###########################################################################
+    # Grazing
+    ###########################################################################
+    percent_outdoors = _graph_term("percent_outdoors")
+    volatile_solids_excretion_rate_GRAZING = _graph_term("volatile_solids_excretion_rate_GRAZING")
+    net_excretion_GRAZING = _graph_term("net_excretion_GRAZING")
+    ch4_emissions_for_grazing = _graph_term("ch4_emissions_for_grazing")
+    nh3_emissions_per_year_GRAZING = _graph_term("nh3_emissions_per_year_GRAZING")
+    Nleach_GRAZING = _graph_term("Nleach_GRAZING")
+    PLeach_GRAZING = _graph_term("PLeach_GRAZING")
+    PRP_N2O_direct = _graph_term("PRP_N2O_direct")
+    PRP_N2O_indirect = _graph_term("PRP_N2O_indirect")
+
+    ###########################################################################
+    # Housing
+    ###########################################################################
+    percent_indoors = _graph_term("percent_indoors")
+    VS_HOUSED = _graph_term("VS_HOUSED")
+    net_excretion_HOUSED = _graph_term("net_excretion_HOUSED")
+    total_ammonia_nitrogen_nh4_HOUSED = _graph_term("total_ammonia_nitrogen_nh4_HOUSED")
+    nh3_emissions_per_year_HOUSED = _graph_term("nh3_emissions_per_year_HOUSED")
+    HOUSING_N2O_indirect = _graph_term("HOUSING_N2O_indirect")
+
+    ###########################################################################
+    # Storage
+    ###########################################################################
+    net_excretion_STORAGE = _graph_term("net_excretion_STORAGE")
+    total_ammonia_nitrogen_nh4_STORAGE = _graph_term("total_ammonia_nitrogen_nh4_STORAGE")
+    CH4_STORAGE = _graph_term("CH4_STORAGE")
+    STORAGE_N2O_direct = _graph_term("STORAGE_N2O_direct")
+    nh3_emissions_per_year_STORAGE = _graph_term("nh3_emissions_per_year_STORAGE")
+    STORAGE_N2O_indirect = _graph_term("STORAGE_N2O_indirect")
+
+    ###########################################################################
+    # Daily spread
+    ###########################################################################
+    net_excretion_SPREAD = _graph_term("net_excretion_SPREAD")
+    total_ammonia_nitrogen_nh4_SPREAD = _graph_term("total_ammonia_nitrogen_nh4_SPREAD")
+    SPREAD_N2O_direct = _graph_term("SPREAD_N2O_direct")
+    nh3_emissions_per_year_SPREAD = _graph_term("nh3_emissions_per_year_SPREAD")
+    leach_nitrogen_SPREAD = _graph_term("leach_nitrogen_SPREAD")
+    leach_phospherous_SPREAD = _graph_term("leach_phospherous_SPREAD")
+    SPREAD_N2O_indirect = _graph_term("SPREAD_N2O_indirect")
+
+class VectorisedTotals:
+    """
+    The base of the vectorised totals classes, binding them to the data manager of an emissions factor country, or to a
+    MultiCountryStore, and converting livestock data into a HerdTable.
+
+    Attributes:
+        data_manager_class (LCADataManager or MultiCountryStore): The shared data manager for the emissions factor country,
+            or the store used to evaluate livestock from several countries.
+
+    Args:
+        ef_country (str, optional): The emissions factor country.
+        store (MultiCountryStore, optional): A store of several countries, used instead of ef_country to evaluate each row
+            of the livestock data with the factors of its own ef_country.
+
+    Raises:
+        ValueError: If neither or both of ef_country and store are given.
+
+    Methods:
+        herd_table(animal_data_frame): Builds a HerdTable from livestock data.
+    """
+    def __init__(self, ef_country=None, store=None):
+        if (ef_country is None) == (store is None):
+            raise ValueError("exactly one of ef_country and store must be given")
+
+        if store is not None:
+            self.data_manager_class = store
+        else:
+            self.data_manager_class = LCADataManagerRegistry.get_data_manager(ef_country)
+
+    def herd_table(self, animal_data_frame):
+        """
+        Builds a HerdTable from livestock data.
+
+        Parameters:
+            animal_data_frame (pandas.DataFrame): Livestock data in the format accepted by load_livestock_data.
+
+        Returns:
+            HerdTable: The columnar herd table with factors resolved for this country, or for each row's country.
+        """
+        return HerdTable(animal_data_frame, self.data_manager_class)
+
+    def _as_herd(self, herd):
+        if isinstance(herd, HerdTable):
+            return herd
+
+        if not isinstance(herd, pd.DataFrame):
+            # a mapping of cohort attribute arrays, one entry per column of the livestock data
+            herd = pd.DataFrame(herd)
+
+        return self.herd_table(herd)
+
+    @staticmethod
+    def _fert_upstream_CO2(herd, total_n_fert, total_urea, total_urea_abated, total_p_fert, total_k_fert, total_lime_fert):
+        """
+        Calculates upstream CO2e from fertiliser production for each farm, as Upstream.fert_upstream_CO2.
+        """
+        urea_fert_CO2 = herd.farm_factor("get_upstream_urea_fertiliser_co2e")
+
+        return (
+            (total_n_fert * herd.farm_factor("get_upstream_AN_fertiliser_co2e"))
+            + (total_urea * urea_fert_CO2)
+            + (total_urea_abated * urea_fert_CO2)
+            + (total_p_fert * herd.farm_factor("get_upstream_triple_phosphate_co2e"))
+            + (total_k_fert * herd.farm_factor("get_upstream_potassium_chloride_co2e"))
+            + (total_lime_fert * herd.farm_factor("get_upstream_lime_co2e"))
+        )
+
+
+class VectorisedClimateChangeTotals(VectorisedTotals):
+    """
+    A vectorised counterpart to ClimateChangeTotals that evaluates the whole-herd climate change categories for many farms
+    at once. Livestock data is converted into a HerdTable, after which each category costs a handful of array operations
+    regardless of the number of farms.
+
+    Each method returns one value per farm, aligned with the farm_ids of the HerdTable, and matches the result of the
+    ClimateChangeTotals method of the same name applied to each farm's AnimalCollection. See VectorisedTotals for the
+    constructor arguments.
+
+    Methods:
+        herd_table(animal_data_frame): Builds a HerdTable from livestock data.
+        CH4_enteric_ch4(herd): Enteric methane for each farm (kg CH4).
+        CH4_manure_management(herd): Methane from grazing excretion and manure storage for each farm (kg CH4).
+        Total_storage_N2O(herd): Direct and indirect N2O from manure storage and housing for each farm (kg N2O).
+        N2O_total_PRP_N2O_direct(herd): Direct N2O from pasture, range and paddock for each farm (kg N2O).
+        N2O_total_PRP_N2O_indirect(herd): Indirect N2O from pasture, range and paddock for each farm (kg N2O).
+        co2_from_concentrate_production(herd): Upstream CO2e from concentrate production for each farm (kg CO2e).
+        climate_totals(animal_data): Every category above for each farm, as a DataFrame indexed by farm_id.
+        CO2_soils_GWP(herd, total_urea, total_lime): CO2 from urea and lime application for each farm (kg CO2).
+        N2O_direct_fertiliser(herd, total_urea, total_urea_abated, total_n_fert): Direct N2O from fertiliser for each farm
+            (kg N2O).
+        N2O_fertiliser_indirect(herd, total_urea, total_urea_abated, total_n_fert): Indirect N2O from fertiliser for each
+            farm (kg N2O).
+        upstream_and_inputs_and_fuel_co2(herd, diesel_kg, elec_kwh, total_n_fert, total_urea, total_urea_abated,
+            total_p_fert, total_k_fert, total_lime_fert): Upstream CO2e from fuel, electricity and fertiliser for each farm
+            (kg CO2e).
+    """
+    def CH4_enteric_ch4(self, herd):
+        """
+        Calculates enteric methane for each farm.
+
+        Parameters:
+            herd (HerdTable or pandas.DataFrame): The herd table, or livestock data to build it from.
+
+        Returns:
+            numpy.ndarray: Enteric methane for each farm (kg CH4).
+        """
+        herd = self._as_herd(herd)
+
+        return herd.sum_by_farm(herd.ch4_emissions_factor)
+
+    def CH4_manure_management(self, herd):
+        """
+        Calculates methane from excretion while grazing and from manure storage for each farm.
+
+        Parameters:
+            herd (HerdTable or pandas.DataFrame): The herd table, or livestock data to build it from.
+
+        Returns:
+            numpy.ndarray: Manure management methane for each farm (kg CH4).
+        """
+        herd = self._as_herd(herd)
+
+        return herd.sum_by_farm(herd.ch4_emissions_for_grazing + herd.CH4_STORAGE)
+
+    def Total_storage_N2O(self, herd):
+        """
+        Calculates direct and indirect N2O from manure storage and indirect N2O from housing for each farm.
+
+        Parameters:
+            herd (HerdTable or pandas.DataFrame): The herd table, or livestock data to build it from.
+
+        Returns:
+            numpy.ndarray: Manure management N2O for each farm (kg N2O).
+        """
+        herd = self._as_herd(herd)
+        mole_weight = 44.0 / 28.0
+
+        n2o_direct = herd.sum_by_farm(herd.STORAGE_N2O_direct)
+        n2o_indirect_storage = herd.sum_by_farm(herd.STORAGE_N2O_indirect)
+        n2o_indirect_housing = herd.sum_by_farm(herd.HOUSING_N2O_indirect)
+
+        return (n2o_direct + n2o_indirect_storage + n2o_indirect_housing) * mole_weight
+
+    def N2O_total_PRP_N2O_direct(self, herd):
+        """
+        Calculates direct N2O from pasture, range and paddock for each farm.
+
+        Parameters:
+            herd (HerdTable or pandas.DataFrame): The herd table, or livestock data to build it from.
+
+        Returns:
+            numpy.ndarray: Direct PRP N2O for each farm (kg N2O).
+        """
+        herd = self._as_herd(herd)
+        mole_weight = 44.0 / 28.0
+
+        return herd.sum_by_farm(herd.PRP_N2O_direct) * mole_weight
+
+    def N2O_total_PRP_N2O_indirect(self, herd):
+        """
+        Calculates indirect N2O from pasture, range and paddock for each farm.
+
+        Parameters:
+            herd (HerdTable or pandas.DataFrame): The herd table, or livestock data to build it from.
+
+        Returns:
+            numpy.ndarray: Indirect PRP N2O for each farm (kg N2O).
+        """
+        herd = self._as_herd(herd)
+        mole_weight = 44.0 / 28.0
+
+        return herd.sum_by_farm(herd.PRP_N2O_indirect) * mole_weight
+
+    def co2_from_concentrate_production(self, herd):
+        """
+        Calculates upstream CO2e from the production of the concentrate fed to each farm's animals.
+
+        Parameters:
+            herd (HerdTable or pandas.DataFrame): The herd table, or livestock data to build it from.
+
+        Returns:
+            numpy.ndarray: Concentrate production CO2e for each farm (kg CO2e/year).
+        """
+        herd = self._as_herd(herd)
+
+        return herd.sum_by_farm(herd.con_amount * herd.factors["concentrate_co2e"]) * 365
+
+    def climate_totals(self, herd):
+        """
+        Calculates every whole-herd climate change category for each farm.
+
+        Parameters:
+            herd (HerdTable or pandas.DataFrame): The herd table, or livestock data to build it from.
+
+        Returns:
+            pandas.DataFrame: One row per farm, indexed by farm_id, with a column per category.
+        """
+        herd = self._as_herd(herd)
+
+        return pd.DataFrame(
+            {
+                "CH4_enteric_ch4": self.CH4_enteric_ch4(herd),
+                "CH4_manure_management": self.CH4_manure_management(herd),
+                "Total_storage_N2O": self.Total_storage_N2O(herd),
+                "N2O_total_PRP_N2O_direct": self.N2O_total_PRP_N2O_direct(herd),
+                "N2O_total_PRP_N2O_indirect": self.N2O_total_PRP_N2O_indirect(herd),
+                "co2_from_concentrate_production": self.co2_from_concentrate_production(herd),
+            },
+            index=pd.Index(herd.farm_ids, name="farm_id"),
+        )
+
+    def CO2_soils_GWP(self, herd, total_urea, total_lime):
+        """
+        Calculates CO2 from the application of urea and lime for each farm.
+
+        Parameters:
+            herd (HerdTable or pandas.DataFrame): The herd table, or livestock data to build it from.
+            total_urea (numpy.ndarray): Urea applied on each farm (kg).
+            total_lime (numpy.ndarray): Lime applied on each farm (kg).
+
+        Returns:
+            numpy.ndarray: Soil CO2 for each farm (kg CO2).
+        """
+        herd = self._as_herd(herd)
+
+        return (total_urea * herd.farm_factor("get_ef_urea_co2")) * (44 / 12) + (
+            total_lime * herd.farm_factor("get_ef_lime_co2")
+        ) * (44 / 12)
+
+    def N2O_direct_fertiliser(self, herd, total_urea, total_urea_abated, total_n_fert):
+        """
+        Calculates direct N2O from urea and ammonium nitrate fertiliser for each farm.
+
+        Parameters:
+            herd (HerdTable or pandas.DataFrame): The herd table, or livestock data to build it from.
+            total_urea (numpy.ndarray): Urea applied on each farm (kg).
+            total_urea_abated (numpy.ndarray): Abated urea applied on each farm (kg).
+            total_n_fert (numpy.ndarray): Ammonium nitrate fertiliser applied on each farm (kg).
+
+        Returns:
+            numpy.ndarray: Direct fertiliser N2O for each farm (kg N2O).
+        """
+        herd = self._as_herd(herd)
+
+        urea_direct = (total_urea * herd.farm_factor("get_ef_urea")) + (
+            total_urea_abated * herd.farm_factor("get_ef_urea_abated")
+        )
+        n_fert_direct = total_n_fert * herd.farm_factor("get_ef_AN_fertiliser")
+
+        return (urea_direct + n_fert_direct) * 44.0 / 28.0
+
+    def N2O_fertiliser_indirect(self, herd, total_urea, total_urea_abated, total_n_fert):
+        """
+        Calculates indirect N2O from urea and ammonium nitrate fertiliser for each farm.
+
+        Parameters:
+            herd (HerdTable or pandas.DataFrame): The herd table, or livestock data to build it from.
+            total_urea (numpy.ndarray): Urea applied on each farm (kg).
+            total_urea_abated (numpy.ndarray): Abated urea applied on each farm (kg).
+            total_n_fert (numpy.ndarray): Ammonium nitrate fertiliser applied on each farm (kg).
+
+        Returns:
+            numpy.ndarray: Indirect fertiliser N2O for each farm (kg N2O).
+        """
+        herd = self._as_herd(herd)
+
+        indirect_atmosphere = herd.farm_factor("get_indirect_atmospheric_deposition")
+        indirect_leaching = herd.farm_factor("get_indirect_leaching")
+        leach = herd.farm_factor("get_ef_fration_leach_runoff")
+
+        urea_NH3 = (total_urea * herd.farm_factor("get_ef_urea_to_nh3_and_nox")) + (
+            total_urea_abated * herd.farm_factor("get_ef_urea_abated_to_nh3_and_nox")
+        )
+        urea_indirect = (urea_NH3 * indirect_atmosphere) + (((total_urea + total_urea_abated) * leach) * indirect_leaching)
+
+        n_fert_NH3 = total_n_fert * herd.farm_factor("get_ef_AN_fertiliser_to_nh3_and_nox")
+        n_fert_indirect = (n_fert_NH3 * indirect_atmosphere) + ((total_n_fert * leach) * indirect_leaching)
+
+        return (urea_indirect + n_fert_indirect) * 44.0 / 28.0
+
+    def upstream_and_inputs_and_fuel_co2(
+        self,
+        herd,
+        diesel_kg,
+        elec_kwh,
+        total_n_fert,
+        total_urea,
+        total_urea_abated,
+        total_p_fert,
+        total_k_fert,
+        total_lime_fert,
+    ):
+        """
+        Calculates upstream CO2e from diesel, electricity and fertiliser production for each farm.
+
+        Parameters:
+            herd (HerdTable or pandas.DataFrame): The herd table, or livestock data to build it from.
+            diesel_kg, elec_kwh, total_n_fert, total_urea, total_urea_abated, total_p_fert, total_k_fert, total_lime_fert
+                (numpy.ndarray): The quantity of each input used on each farm.
+
+        Returns:
+            numpy.ndarray: Upstream CO2e for each farm (kg CO2e).
+        """
+        herd = self._as_herd(herd)
+
+        diesel = diesel_kg * (
+            herd.farm_factor("get_upstream_diesel_co2e_direct") + herd.farm_factor("get_upstream_diesel_co2e_indirect")
+        )
+        elec = elec_kwh * herd.farm_factor("get_upstream_electricity_co2e")
+
+        return (
+            diesel
+            + elec
+            + self._fert_upstream_CO2(
+                herd, total_n_fert, total_urea, total_urea_abated, total_p_fert, total_k_fert, total_lime_fert
+            )
+        )
+
+
+class VectorisedEutrophicationTotals(VectorisedTotals):
+    """
+    A vectorised counterpart to EutrophicationTotals that evaluates the eutrophication potential (PO4e) categories for many
+    farms at once. The grazing, housing and storage nitrogen terms are computed once per HerdTable and shared by every
+    category, rather than being rederived by each method for each cohort.
+
+    Each method returns one value per farm, aligned with the farm_ids of the HerdTable, and matches the result of the
+    EutrophicationTotals method of the same name applied to each farm's AnimalCollection. The fertiliser methods take the
+    fertiliser inputs of each farm as arrays aligned with farm_ids. See VectorisedTotals for the constructor arguments.
+
+    Methods:
+        herd_table(animal_data_frame): Builds a HerdTable from livestock data.
+        total_manure_NH3_EP(herd): Ammonia from housing and manure storage for each farm (kg PO4e).
+        total_grazing_soils_NH3_and_LEACH_EP(herd): Ammonia and nitrogen leaching from grazing for each farm (kg PO4e).
+        grazing_soils_P_LEACH_EP(herd): Phosphorus leaching from grazing for each farm (kg PO4e).
+        total_grazing_soils_EP(herd): Nitrogen and phosphorus losses from grazing for each farm (kg PO4e).
+        po4_from_concentrate_production(herd): Upstream PO4e from concentrate production for each farm (kg PO4e).
+        total_fertiliser_soils_NH3_and_LEACH_EP(herd, total_urea, total_urea_abated, total_n_fert): Ammonia and nitrogen
+            leaching from fertiliser for each farm (kg PO4e).
+        fertiliser_soils_P_LEACH_EP(herd, total_urea, total_urea_abated, total_n_fert, total_p_fert): Phosphorus leaching
+            from fertiliser for each farm (kg PO4e).
+        total_fertilser_soils_EP(herd, total_urea, total_urea_abated, total_n_fert, total_p_fert): Nitrogen and phosphorus
+            losses from fertiliser for each farm (kg PO4e).
+        eutrophication_totals(herd): Every livestock category above for each farm, as a DataFrame indexed by farm_id.
+        upstream_and_inputs_and_fuel_po4(herd, diesel_kg, elec_kwh, total_n_fert, total_urea, total_urea_abated,
+            total_p_fert, total_k_fert, total_lime_fert): Upstream emissions from fuel, electricity and fertiliser for each
+            farm, as EutrophicationTotals.upstream_and_inputs_and_fuel_po4.
+    """
+    def total_manure_NH3_EP(self, herd):
+        """
+        Calculates ammonia emissions from housing and manure storage for each farm, as phosphate equivalents.
+
+        Parameters:
+            herd (HerdTable or pandas.DataFrame): The herd table, or livestock data to build it from.
+
+        Returns:
+            numpy.ndarray: Manure management eutrophication potential for each farm (kg PO4e).
+        """
+        herd = self._as_herd(herd)
+
+        NH3N = herd.nh3_emissions_per_year_STORAGE + herd.nh3_emissions_per_year_HOUSED
+
+        return herd.sum_by_farm(NH3N * herd.factors["indirect_atmospheric_deposition"]) * 0.42
+
+    def total_grazing_soils_NH3_and_LEACH_EP(self, herd):
+        """
+        Calculates ammonia emissions and nitrogen leaching from grazing for each farm, as phosphate equivalents.
+
+        Parameters:
+            herd (HerdTable or pandas.DataFrame): The herd table, or livestock data to build it from.
+
+        Returns:
+            numpy.ndarray: Grazing nitrogen eutrophication potential for each farm (kg PO4e).
+        """
+        herd = self._as_herd(herd)
+
+        NH3N = herd.sum_by_farm(herd.nh3_emissions_per_year_GRAZING * herd.factors["indirect_atmospheric_deposition"])
+        LEACH = herd.sum_by_farm(herd.Nleach_GRAZING)
+
+        return NH3N + LEACH * 0.42
+
+    def grazing_soils_P_LEACH_EP(self, herd):
+        """
+        Calculates phosphorus leaching from grazing for each farm, as phosphate equivalents.
+
+        Parameters:
+            herd (HerdTable or pandas.DataFrame): The herd table, or livestock data to build it from.
+
+        Returns:
+            numpy.ndarray: Grazing phosphorus eutrophication potential for each farm (kg PO4e).
+        """
+        herd = self._as_herd(herd)
+
+        return herd.sum_by_farm(herd.PLeach_GRAZING) * 3.06
+
+    def total_grazing_soils_EP(self, herd):
+        """
+        Calculates the nitrogen and phosphorus losses from grazing for each farm, as phosphate equivalents.
+
+        Parameters:
+            herd (HerdTable or pandas.DataFrame): The herd table, or livestock data to build it from.
+
+        Returns:
+            numpy.ndarray: Grazing eutrophication potential for each farm (kg PO4e).
+        """
+        herd = self._as_herd(herd)
+
+        return self.total_grazing_soils_NH3_and_LEACH_EP(herd) + self.grazing_soils_P_LEACH_EP(herd)
+
+    def po4_from_concentrate_production(self, herd):
+        """
+        Calculates upstream PO4e from the production of the concentrate fed to each farm's animals.
+
+        Parameters:
+            herd (HerdTable or pandas.DataFrame): The herd table, or livestock data to build it from.
+
+        Returns:
+            numpy.ndarray: Concentrate production PO4e for each farm (kg PO4e/year).
+        """
+        herd = self._as_herd(herd)
+
+        return herd.sum_by_farm(herd.con_amount * herd.factors["concentrate_po4e"]) * 365
+
+    def total_fertiliser_soils_NH3_and_LEACH_EP(self, herd, total_urea, total_urea_abated, total_n_fert):
+        """
+        Calculates ammonia emissions and nitrogen leaching from fertiliser application for each farm, as phosphate
+        equivalents.
+
+        Parameters:
+            herd (HerdTable or pandas.DataFrame): The herd table, or livestock data to build it from.
+            total_urea (numpy.ndarray): Urea applied on each farm (kg).
+            total_urea_abated (numpy.ndarray): Abated urea applied on each farm (kg).
+            total_n_fert (numpy.ndarray): Ammonium nitrate fertiliser applied on each farm (kg).
+
+        Returns:
+            numpy.ndarray: Fertiliser nitrogen eutrophication potential for each farm (kg PO4e).
+        """
+        herd = self._as_herd(herd)
+
+        leach = herd.farm_factor("get_ef_fration_leach_runoff")
+
+        LEACH = (total_urea + total_urea_abated) * leach + total_n_fert * leach
+        NH3N = (
+            total_urea * herd.farm_factor("get_ef_urea_to_nh3_and_nox")
+            + total_urea_abated * herd.farm_factor("get_ef_urea_abated_to_nh3_and_nox")
+            + total_n_fert * herd.farm_factor("get_ef_AN_fertiliser_to_nh3_and_nox")
+        )
+
+        return (NH3N * herd.farm_factor("get_indirect_atmospheric_deposition")) + LEACH * 0.42
+
+    def fertiliser_soils_P_LEACH_EP(self, herd, total_urea, total_urea_abated, total_n_fert, total_p_fert):
+        """
+        Calculates phosphorus leaching from fertiliser application for each farm, as phosphate equivalents.
+
+        Parameters:
+            herd (HerdTable or pandas.DataFrame): The herd table, or livestock data to build it from.
+            total_urea (numpy.ndarray): Urea applied on each farm (kg).
+            total_urea_abated (numpy.ndarray): Abated urea applied on each farm (kg).
+            total_n_fert (numpy.ndarray): Ammonium nitrate fertiliser applied on each farm (kg).
+            total_p_fert (numpy.ndarray): Phosphorus fertiliser applied on each farm (kg).
+
+        Returns:
+            numpy.ndarray: Fertiliser phosphorus eutrophication potential for each farm (kg PO4e).
+        """
+        herd = self._as_herd(herd)
+
+        frac_leach = herd.farm_factor("get_frac_p_leach")
+
+        PLEACH = (
+            (total_urea + total_urea_abated) * frac_leach
+            + total_n_fert * frac_leach
+            + total_p_fert * frac_leach
+        )
+
+        return PLEACH * 3.06
+
+    def total_fertilser_soils_EP(self, herd, total_urea, total_urea_abated, total_n_fert, total_p_fert):
+        """
+        Calculates the nitrogen and phosphorus losses from fertiliser application for each farm, as phosphate equivalents.
+
+        Parameters:
+            herd (HerdTable or pandas.DataFrame): The herd table, or livestock data to build it from.
+            total_urea (numpy.ndarray): Urea applied on each farm (kg).
+            total_urea_abated (numpy.ndarray): Abated urea applied on each farm (kg).
+            total_n_fert (numpy.ndarray): Ammonium nitrate fertiliser applied on each farm (kg).
+            total_p_fert (numpy.ndarray): Phosphorus fertiliser applied on each farm (kg).
+
+        Returns:
+            numpy.ndarray: Fertiliser eutrophication potential for each farm (kg PO4e).
+        """
+        herd = self._as_herd(herd)
+
+        return self.total_fertiliser_soils_NH3_and_LEACH_EP(
+            herd, total_urea, total_urea_abated, total_n_fert
+        ) + self.fertiliser_soils_P_LEACH_EP(
+            herd, total_urea, total_urea_abated, total_n_fert, total_p_fert
+        )
+
+    def eutrophication_totals(self, herd):
+        """
+        Calculates every livestock eutrophication category for each farm.
+
+        Parameters:
+            herd (HerdTable or pandas.DataFrame): The herd table, or livestock data to build it from.
+
+        Returns:
+            pandas.DataFrame: One row per farm, indexed by farm_id, with a column per category.
+        """
+        herd = self._as_herd(herd)
+
+        return pd.DataFrame(
+            {
+                "total_manure_NH3_EP": self.total_manure_NH3_EP(herd),
+                "total_grazing_soils_NH3_and_LEACH_EP": self.total_grazing_soils_NH3_and_LEACH_EP(herd),
+                "grazing_soils_P_LEACH_EP": self.grazing_soils_P_LEACH_EP(herd),
+                "total_grazing_soils_EP": self.total_grazing_soils_EP(herd),
+                "po4_from_concentrate_production": self.po4_from_concentrate_production(herd),
+            },
+            index=pd.Index(herd.farm_ids, name="farm_id"),
+        )
+
+    def upstream_and_inputs_and_fuel_po4(
+        self,
+        herd,
+        diesel_kg,
+        elec_kwh,
+        total_n_fert,
+        total_urea,
+        total_urea_abated,
+        total_p_fert,
+        total_k_fert,
+        total_lime_fert,
+    ):
+        """
+        Calculates upstream emissions from diesel, electricity and fertiliser production for each farm. As in
+        EutrophicationTotals.upstream_and_inputs_and_fuel_po4, diesel uses the PO4e factors while electricity and
+        fertiliser use the CO2e factors.
+
+        Parameters:
+            herd (HerdTable or pandas.DataFrame): The herd table, or livestock data to build it from.
+            diesel_kg, elec_kwh, total_n_fert, total_urea, total_urea_abated, total_p_fert, total_k_fert, total_lime_fert
+                (numpy.ndarray): The quantity of each input used on each farm.
+
+        Returns:
+            numpy.ndarray: Upstream emissions for each farm.
+        """
+        herd = self._as_herd(herd)
+
+        diesel = diesel_kg * (
+            herd.farm_factor("get_upstream_diesel_po4e_direct") + herd.farm_factor("get_upstream_diesel_po4e_indirect")
+        )
+        elec = elec_kwh * herd.farm_factor("get_upstream_electricity_co2e")
+
+        return (
+            diesel
+            + elec
+            + self._fert_upstream_CO2(
+                herd, total_n_fert, total_urea, total_urea_abated, total_p_fert, total_k_fert, total_lime_fert
+            )
+        )
+
+
+class VectorisedAirQualityTotals(VectorisedTotals):
+    """
+    A vectorised counterpart to AirQualityTotals that evaluates ammonia (NH3) emissions for many farms at once. Only the
+    terms needed for NH3 are computed: the nitrogen excreted by each cohort row is evaluated once, as an array, and shared
+    by the housing, storage and grazing ammonia terms.
+
+    Each method returns one value per farm, aligned with the farm_ids of the HerdTable, and matches the result of the
+    AirQualityTotals method of the same name applied to each farm's AnimalCollection. Herds may be given as a HerdTable, a
+    livestock DataFrame or a mapping of cohort attribute arrays in the same columns. See VectorisedTotals for the
+    constructor arguments.
+
+    Methods:
+        herd_table(animal_data_frame): Builds a HerdTable from livestock data.
+        total_manure_NH3_AQ(herd): Ammonia from housing and manure storage for each farm (kg NH3).
+        total_grazing_soils_NH3_AQ(herd): Ammonia from grazing for each farm (kg NH3).
+        total_fertiliser_soils_NH3_AQ(herd, total_urea, total_urea_abated, total_n_fert): Ammonia from fertiliser for each
+            farm (kg NH3).
+        air_quality_totals(herd, total_urea=0, total_urea_abated=0, total_n_fert=0): Every category above for each farm, as
+            a DataFrame indexed by farm_id.
+    """
+    def total_manure_NH3_AQ(self, herd):
+        """
+        Calculates ammonia emissions from housing and manure storage for each farm.
+
+        Parameters:
+            herd (HerdTable, pandas.DataFrame or dict): The herd table, or livestock data to build it from.
+
+        Returns:
+            numpy.ndarray: Manure management NH3 for each farm (kg).
+        """
+        herd = self._as_herd(herd)
+
+        return herd.sum_by_farm(herd.nh3_emissions_per_year_STORAGE + herd.nh3_emissions_per_year_HOUSED)
+
+    def total_grazing_soils_NH3_AQ(self, herd):
+        """
+        Calculates ammonia emissions from excretion while grazing for each farm.
+
+        Parameters:
+            herd (HerdTable, pandas.DataFrame or dict): The herd table, or livestock data to build it from.
+
+        Returns:
+            numpy.ndarray: Grazing NH3 for each farm (kg).
+        """
+        herd = self._as_herd(herd)
+
+        return herd.sum_by_farm(herd.nh3_emissions_per_year_GRAZING)
+
+    def total_fertiliser_soils_NH3_AQ(self, herd, total_urea, total_urea_abated, total_n_fert):
+        """
+        Calculates ammonia emissions from fertiliser application for each farm.
+
+        Parameters:
+            herd (HerdTable, pandas.DataFrame or dict): The herd table, or livestock data to build it from.
+            total_urea (numpy.ndarray): Urea applied on each farm (kg).
+            total_urea_abated (numpy.ndarray): Abated urea applied on each farm (kg).
+            total_n_fert (numpy.ndarray): Ammonium nitrate fertiliser applied on each farm (kg).
+
+        Returns:
+            numpy.ndarray: Fertiliser NH3 for each farm (kg).
+        """
+        herd = self._as_herd(herd)
+
+        return (
+            total_urea * herd.farm_factor("get_ef_urea_to_nh3_and_nox")
+            + total_urea_abated * herd.farm_factor("get_ef_urea_abated_to_nh3_and_nox")
+            + total_n_fert * herd.farm_factor("get_ef_AN_fertiliser_to_nh3_and_nox")
+        )
+
+    def air_quality_totals(self, herd, total_urea=0, total_urea_abated=0, total_n_fert=0):
+        """
+        Calculates manure, grazing and fertiliser ammonia emissions for each farm.
+
+        Parameters:
+            herd (HerdTable, pandas.DataFrame or dict): The herd table, or livestock data to build it from.
+            total_urea (numpy.ndarray, optional): Urea applied on each farm (kg). Defaults to none.
+            total_urea_abated (numpy.ndarray, optional): Abated urea applied on each farm (kg). Defaults to none.
+            total_n_fert (numpy.ndarray, optional): Ammonium nitrate fertiliser applied on each farm (kg). Defaults to none.
+
+        Returns:
+            pandas.DataFrame: One row per farm, indexed by farm_id, with a column per category.
+        """
+        herd = self._as_herd(herd)
+
+        return pd.DataFrame(
+            {
+                "total_manure_NH3_AQ": self.total_manure_NH3_AQ(herd),
+                "total_grazing_soils_NH3_AQ": self.total_grazing_soils_NH3_AQ(herd),
+                "total_fertiliser_soils_NH3_AQ": self.total_fertiliser_soils_NH3_AQ(
+                    herd, total_urea, total_urea_abated, total_n_fert
+                ),
+            },
+            index=pd.Index(herd.farm_ids, name="farm_id"),
+        )
+
+
+def herd_categories(ef_country=None, store=None):
+    """
+    Returns the whole-herd categories of the vectorised totals that depend only on a HerdTable, such as those sampled by
+    MonteCarloEngine or compared by ScenarioSweep. Farm level inputs such as fertiliser are not included.
+
+    Args:
+        ef_country (str, optional): The emissions factor country.
+        store (MultiCountryStore, optional): A store of several countries, used instead of ef_country.
+
+    Returns:
+        dict: The bound totals method evaluated for each category, keyed by category name.
+    """
+    climatechange = VectorisedClimateChangeTotals(ef_country, store)
+    eutrophication = VectorisedEutrophicationTotals(ef_country, store)
+    air_quality = VectorisedAirQualityTotals(ef_country, store)
+
+    return {
+        "CH4_enteric_ch4": climatechange.CH4_enteric_ch4,
+        "CH4_manure_management": climatechange.CH4_manure_management,
+        "Total_storage_N2O": climatechange.Total_storage_N2O,
+        "N2O_total_PRP_N2O_direct": climatechange.N2O_total_PRP_N2O_direct,
+        "N2O_total_PRP_N2O_indirect": climatechange.N2O_total_PRP_N2O_indirect,
+        "co2_from_concentrate_production": climatechange.co2_from_concentrate_production,
+        "total_manure_NH3_EP": eutrophication.total_manure_NH3_EP,
+        "total_grazing_soils_EP": eutrophication.total_grazing_soils_EP,
+        "po4_from_concentrate_production": eutrophication.po4_from_concentrate_production,
+        "total_manure_NH3_AQ": air_quality.total_manure_NH3_AQ,
+        "total_grazing_soils_NH3_AQ": air_quality.total_grazing_soils_NH3_AQ,
+    }
+
+
+def _factorize(values):
+    """
+    Encodes an array as integer codes, numbering the unique values in order of first appearance.
+
+    Args:
+        values (numpy.ndarray): The values to encode.
+
+    Returns:
+        tuple: The codes for each value and the array of unique values.
+    """
+    codes, uniques = pd.factorize(values, sort=False, use_na_sentinel=False)
+
+    return codes, np.asarray(uniques)
+
+
+def _encode(values, codes):
+    """
+    Converts the categorical values of each row to the integer codes of a FactorTable.
+
+    Args:
+        values (numpy.ndarray): The categorical values for each row.
+        codes (Mapping): The code of each known value.
+
+    Returns:
+        numpy.ndarray: The code for each row.
+
+    Raises:
+        KeyError: If a value has no code, as the scalar lookups would.
+    """
+    value_codes, uniques = _factorize(values)
+    table = np.array([codes[value] for value in uniques], dtype=np.intp)
+
+    return table[value_codes] if len(value_codes) else np.empty(0, dtype=np.intp)
+
+
+def _lookup(values, getter):
+    """
+    Resolves a factor for each element of a categorical array, calling the getter once per distinct value.
+
+    Args:
+        values (numpy.ndarray): The categorical values for each row.
+        getter (callable): Returns the factor for a single category value.
+
+    Returns:
+        numpy.ndarray: The factor for each row, as floats.
+    """
+    codes, uniques = _factorize(values)
+    table = np.array([getter(value) for value in uniques], dtype=float)
+
+    return table[codes] if len(codes) else np.empty(0)
@@ -0,0 +1,114 @@
+import os
+import tempfile
+import unittest
+import pandas as pd
+from pandas.testing import assert_frame_equal
+from sheep_lca.fused_lca import FusedFarmEvaluator
+from sheep_lca.resource_manager.arrow_reader import (
+    iter_livestock_batches,
+    iter_farm_batches,
+    read_livestock_data,
+    read_farm_data,
+)
+from vectorised_lca_test import create_livestock_data_frame
+from batch_lca_test import create_farm_data_frame
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+
+@unittest.skipIf(pyarrow is None, "pyarrow is not installed")
+class ArrowReaderTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.livestock = create_livestock_data_frame(n_farms=10, seed=51).assign(notes="not read")
+        self.farms = create_farm_data_frame(self.livestock["farm_id"].unique(), seed=51)
+
+        self.table = pyarrow.Table.from_pandas(self.livestock, preserve_index=False)
+        self.parquet_path = self.path("livestock.parquet")
+        pyarrow.parquet.write_table(self.table, self.parquet_path, row_group_size=12)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def path(self, name):
+        return os.path.join(self.directory.name, name)
+
+    def expected(self, data_frame):
+        return data_frame.drop(columns="notes")
+
+    def test_read_projects_columns(self):
+        data_frame = read_livestock_data(self.parquet_path)
+
+        self.assertNotIn("notes", data_frame.columns)
+        self.assertEqual(data_frame["cohort"].dtype, "category")
+        assert_frame_equal(data_frame.astype(self.expected(self.livestock).dtypes), self.expected(self.livestock))
+
+    def test_batches(self):
+        batches = list(iter_livestock_batches(self.parquet_path, batch_size=7))
+
+        self.assertTrue(all(len(batch) <= 7 for batch in batches))
+        self.assertEqual(sum(len(batch) for batch in batches), len(self.livestock))
+
+        data_frame = pd.concat([batch.astype({"cohort": object}) for batch in batches], ignore_index=True)
+        self.assertEqual(list(data_frame["cohort"]), list(self.livestock["cohort"]))
+
+    def test_ipc_formats(self):
+        file_path = self.path("livestock.arrow")
+        stream_path = self.path("livestock.arrows")
+
+        with pyarrow.ipc.new_file(file_path, self.table.schema) as writer:
+            writer.write_table(self.table, max_chunksize=20)
+
+        with pyarrow.ipc.new_stream(stream_path, self.table.schema) as writer:
+            writer.write_table(self.table, max_chunksize=20)
+
+        expected = read_livestock_data(self.parquet_path)
+
+        for path in (file_path, stream_path):
+            assert_frame_equal(read_livestock_data(path), expected)
+            self.assertEqual(max(len(batch) for batch in iter_livestock_batches(path, batch_size=8)), 8)
+
+    def test_farm_data(self):
+        path = self.path("farms.feather")
+        self.farms.to_feather(path)
+
+        self.assertEqual(len(read_farm_data(path)), len(self.farms))
+        self.assertEqual(sum(len(batch) for batch in iter_farm_batches(path, batch_size=3)), len(self.farms))
+
+    def test_missing_columns_take_defaults(self):
+        path = self.path("partial.parquet")
+        pyarrow.parquet.write_table(
+            pyarrow.Table.from_pandas(self.livestock.drop(columns=["t_stabled", "daily_spreading"])), path
+        )
+
+        data_frame = read_livestock_data(path)
+
+        self.assertNotIn("t_stabled", data_frame.columns)
+        evaluator = FusedFarmEvaluator("ireland")
+        assert_frame_equal(
+            evaluator.evaluate(data_frame), evaluator.evaluate(self.livestock.drop(columns=["t_stabled", "daily_spreading"]))
+        )
+
+    def test_evaluate_files(self):
+        farm_path = self.path("farms.parquet")
+        self.farms.to_parquet(farm_path)
+
+        evaluator = FusedFarmEvaluator("ireland")
+
+        assert_frame_equal(
+            evaluator.evaluate_files(self.parquet_path, farm_path),
+            evaluator.evaluate(self.livestock, self.farms),
+        )
+
+    def test_unknown_format(self):
+        with self.assertRaises(ValueError):
+            read_livestock_data(self.path("livestock.csv"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+import unittest
+import numpy as np
+import pandas as pd
+from sheep_lca.resource_manager.models import load_livestock_data, load_farm_data
+from sheep_lca.lca import ClimateChangeTotals, EutrophicationTotals, AirQualityTotals
+from sheep_lca.batch_lca import FarmBatchEvaluator
+from vectorised_lca_test import create_livestock_data_frame
+
+
+def create_farm_data_frame(farm_ids, seed=42):
+    rng = np.random.default_rng(seed)
+    n_farms = len(farm_ids)
+
+    return pd.DataFrame(
+        {
+            "ef_country": "ireland",
+            "farm_id": farm_ids,
+            "year": 2020,
+            "total_urea_kg": rng.uniform(0, 5000, n_farms),
+            "total_lime_kg": rng.uniform(0, 5000, n_farms),
+            "an_n_fert": rng.uniform(0, 5000, n_farms),
+            "urea_n_fert": rng.uniform(0, 5000, n_farms),
+            "total_urea_abated": rng.uniform(0, 5000, n_farms),
+            "total_p_fert": rng.uniform(0, 1000, n_farms),
+            "total_k_fert": rng.uniform(0, 1000, n_farms),
+            "diesel_kg": rng.uniform(0, 1000, n_farms),
+            "elec_kwh": rng.uniform(0, 1000, n_farms),
+        }
+    )
+
+
+class FarmBatchEvaluatorTestCase(unittest.TestCase):
+    def setUp(self):
+        self.livestock_data_frame = create_livestock_data_frame(n_farms=5)
+        self.farm_data_frame = create_farm_data_frame(
+            self.livestock_data_frame["farm_id"].unique()
+        )
+        self.evaluator = FarmBatchEvaluator("ireland")
+
+    def test_matches_totals_classes(self):
+        results = self.evaluator.evaluate(self.livestock_data_frame, self.farm_data_frame)
+
+        animals = load_livestock_data(self.livestock_data_frame)
+        farms = load_farm_data(self.farm_data_frame)
+        climatechange = ClimateChangeTotals("ireland")
+        eutrophication = EutrophicationTotals("ireland")
+        air_quality = AirQualityTotals("ireland")
+
+        self.assertEqual(list(results.index), list(animals.keys()))
+
+        for farm in farms.values():
+            collection = animals[farm.farm_id]["animals"]
+            row = results.loc[farm.farm_id]
+            fertiliser = (farm.urea_n_fert, farm.total_urea_abated, farm.an_n_fert)
+
+            n_direct = climatechange.N2O_total_PRP_N2O_direct(
+                collection
+            ) + climatechange.N2O_direct_fertiliser(*fertiliser)
+            n_indirect = climatechange.N2O_total_PRP_N2O_indirect(
+                collection
+            ) + climatechange.N2O_fertiliser_indirect(*fertiliser)
+
+            self.assertAlmostEqual(row["climate_change_enteric_ch4"], climatechange.CH4_enteric_ch4(collection))
+            self.assertAlmostEqual(row["climate_change_soils_N2O"], n_direct + n_indirect)
+            self.assertAlmostEqual(
+                row["climate_change_soils_CO2"],
+                climatechange.CO2_soils_GWP(farm.total_urea_kg, farm.total_lime_kg),
+            )
+            self.assertAlmostEqual(
+                row["eutrophication_soils"],
+                eutrophication.total_grazing_soils_EP(collection)
+                + eutrophication.total_fertilser_soils_EP(*fertiliser, farm.total_p_fert),
+            )
+            self.assertAlmostEqual(
+                row["air_quality_manure_management"], air_quality.total_manure_NH3_AQ(collection)
+            )
+            self.assertAlmostEqual(
+                row["air_quality_soils"],
+                air_quality.total_grazing_soils_NH3_AQ(collection)
+                + air_quality.total_fertiliser_soils_NH3_AQ(*fertiliser),
+            )
+
+    def test_accepts_loaded_data(self):
+        from_frames = self.evaluator.evaluate(self.livestock_data_frame, self.farm_data_frame)
+        from_loaded = self.evaluator.evaluate(
+            load_livestock_data(self.livestock_data_frame), load_farm_data(self.farm_data_frame)
+        )
+
+        pd.testing.assert_frame_equal(from_frames, from_loaded)
+
+    def test_missing_farm_data(self):
+        results = self.evaluator.evaluate(self.livestock_data_frame)
+
+        self.assertEqual(len(results), 5)
+        self.assertTrue((results["climate_change_N_direct_fertiliser"] == 0).all())
+        self.assertTrue((results["climate_change_enteric_ch4"] > 0).all())
+
+        extra_farm = create_farm_data_frame([9999])
+        results = self.evaluator.evaluate(self.livestock_data_frame, extra_farm)
+
+        self.assertEqual(results.index[-1], 9999)
+        self.assertEqual(results.loc[9999, "climate_change_enteric_ch4"], 0)
+        self.assertGreater(results.loc[9999, "climate_change_soils_N2O"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
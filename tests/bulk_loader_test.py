@@ -0,0 +1,52 @@
+import unittest
+import pandas as pd
+from sheep_lca.resource_manager.database_manager import DataManager
+
+
+class BulkLoaderTestCase(unittest.TestCase):
+    def setUp(self):
+        self.data_manager = DataManager("ireland")
+
+    def test_matches_single_table_reads(self):
+        dataframes = self.data_manager.bulk_load()
+
+        self.assertEqual(set(dataframes), set(DataManager.tables))
+
+        pd.testing.assert_frame_equal(dataframes["grass"], self.data_manager.grass_data())
+        pd.testing.assert_frame_equal(dataframes["upstream"], self.data_manager.upstream_data())
+        pd.testing.assert_frame_equal(dataframes["concentrates"], self.data_manager.concentrate_data())
+        pd.testing.assert_frame_equal(
+            dataframes["emissions_factors"], self.data_manager.emissions_factor_data()
+        )
+        pd.testing.assert_frame_equal(
+            dataframes["animal_features"], self.data_manager.animal_features_data()
+        )
+
+    def test_country_filter(self):
+        dataframes = self.data_manager.bulk_load()
+
+        self.assertEqual(set(dataframes["emissions_factors"]["ef_country"]), {"ireland"})
+        self.assertEqual(set(dataframes["animal_features"]["ef_country"]), {"ireland"})
+
+    def test_country_is_bound_parameter(self):
+        data_manager = DataManager("ireland' OR '1'='1")
+
+        self.assertTrue(data_manager.emissions_factor_data().empty)
+        self.assertTrue(data_manager.bulk_load()["animal_features"].empty)
+
+    def test_timings(self):
+        self.assertEqual(self.data_manager.timings, {})
+
+        self.data_manager.bulk_load()
+
+        self.assertEqual(set(self.data_manager.timings), set(DataManager.tables))
+        self.assertTrue(all(value >= 0 for value in self.data_manager.timings.values()))
+
+    def test_index(self):
+        dataframe = self.data_manager.grass_data(index="grass_genus")
+
+        self.assertEqual(dataframe.index.name, "grass_genus")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+import unittest
+import numpy as np
+from sheep_lca.resource_manager.models import load_livestock_data
+from sheep_lca.resource_manager.country_store import MultiCountryStore
+from sheep_lca.resource_manager.sheep_lca_data_manager import LCADataManagerRegistry
+from sheep_lca.lca import ClimateChangeTotals
+from sheep_lca.vectorised_lca import VectorisedClimateChangeTotals
+from vectorised_lca_test import create_livestock_data_frame
+
+
+class MultiCountryStoreTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.store = MultiCountryStore()
+
+    def tearDown(self):
+        LCADataManagerRegistry.clear()
+
+    def test_countries(self):
+        self.assertEqual(set(self.store.countries), {"ireland", "costa rica"})
+        self.assertIn("ireland", self.store)
+        self.assertNotIn("atlantis", self.store)
+
+        with self.assertRaises(KeyError):
+            self.store.get_data_manager("atlantis")
+
+        with self.assertRaises(ValueError):
+            MultiCountryStore(["ireland", "atlantis"])
+
+    def test_matches_single_country_data(self):
+        for country in self.store.countries:
+            expected = LCADataManagerRegistry.get_data_manager(country)
+            data_manager = self.store.get_data_manager(country)
+
+            self.assertEqual(
+                repr(data_manager.factor_table.cohort), repr(expected.factor_table.cohort)
+            )
+            self.assertEqual(data_manager.get_ef_urea(), expected.get_ef_urea())
+            self.assertEqual(
+                data_manager.get_upstream_concentrate_co2e("Soybean"),
+                expected.get_upstream_concentrate_co2e("Soybean"),
+            )
+
+    def test_register(self):
+        self.store.register()
+
+        climatechange = ClimateChangeTotals("costa rica")
+
+        self.assertIs(climatechange.data_manager_class, self.store.get_data_manager("costa rica"))
+        self.assertEqual(LCADataManagerRegistry.get_load_count(), 0)
+
+    def test_mixed_country_livestock(self):
+        data_frame = create_livestock_data_frame(n_farms=10, seed=3)
+        data_frame["ef_country"] = np.where(data_frame["farm_id"] % 2 == 0, "ireland", "costa rica")
+
+        results = VectorisedClimateChangeTotals(store=self.store).climate_totals(data_frame)
+        animals = load_livestock_data(data_frame)
+
+        scalar = {country: ClimateChangeTotals(country) for country in self.store.countries}
+
+        for farm_id, collection in animals.items():
+            country = "ireland" if farm_id % 2 == 0 else "costa rica"
+
+            for method in results.columns:
+                self.assertAlmostEqual(
+                    results.loc[farm_id, method],
+                    getattr(scalar[country], method)(collection["animals"]),
+                    places=6,
+                )
+
+    def test_requires_ef_country(self):
+        data_frame = create_livestock_data_frame(n_farms=2).drop(columns="ef_country")
+
+        with self.assertRaises(ValueError):
+            VectorisedClimateChangeTotals(store=self.store).herd_table(data_frame)
+
+        with self.assertRaises(ValueError):
+            VectorisedClimateChangeTotals()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,49 @@
+import unittest
+from sheep_lca.resource_manager.sheep_lca_data_manager import LCADataManagerRegistry
+from sheep_lca.lca import ClimateChangeTotals, EutrophicationTotals, AirQualityTotals
+
+
+class DataManagerRegistryTestCase(unittest.TestCase):
+    def setUp(self):
+        LCADataManagerRegistry.clear()
+
+    def tearDown(self):
+        LCADataManagerRegistry.clear()
+
+    def test_single_load_per_country(self):
+        for _ in range(5):
+            ClimateChangeTotals("ireland")
+            EutrophicationTotals("ireland")
+            AirQualityTotals("ireland")
+
+        self.assertEqual(LCADataManagerRegistry.get_load_count("ireland"), 1)
+        self.assertEqual(LCADataManagerRegistry.get_load_count(), 1)
+
+    def test_shared_instance(self):
+        climatechange = ClimateChangeTotals("ireland")
+
+        self.assertIs(climatechange.data_manager_class, climatechange.grazing_class.data_manager_class)
+        self.assertIs(
+            climatechange.data_manager_class,
+            climatechange.storage_class.housing_class.energy_class.data_manager_class,
+        )
+
+    def test_countries_are_loaded_separately(self):
+        ireland = LCADataManagerRegistry.get_data_manager("ireland")
+        costa_rica = LCADataManagerRegistry.get_data_manager("costa rica")
+
+        self.assertIsNot(ireland, costa_rica)
+        self.assertEqual(LCADataManagerRegistry.get_load_count(), 2)
+
+    def test_lookups_are_read_only(self):
+        data_manager = LCADataManagerRegistry.get_data_manager("ireland")
+
+        with self.assertRaises(TypeError):
+            data_manager.cohorts_data["ewes"]["coefficient"] = None
+
+        with self.assertRaises(TypeError):
+            data_manager.grazing_type["flat_pasture"] = None
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+import unittest
+import numpy as np
+from sheep_lca.emissions_table import EmissionsTable
+from sheep_lca.lca import ClimateChangeTotals, EutrophicationTotals, AirQualityTotals, CLIMATE_CHANGE_CATEGORIES
+from sheep_lca.resource_manager.result_writer import ResultWriter
+
+
+class EmissionsTableTestCase(unittest.TestCase):
+    def setUp(self):
+        self.keys = [2000, 2001, 2002]
+        self.climatechange = ClimateChangeTotals("ireland")
+
+    def test_templates_match_dictionaries(self):
+        totals = [
+            (self.climatechange.create_emissions_dictionary, self.climatechange.create_emissions_table),
+            (
+                self.climatechange.create_expanded_emissions_dictionary,
+                self.climatechange.create_expanded_emissions_table,
+            ),
+        ]
+
+        for instance in (EutrophicationTotals("ireland"), AirQualityTotals("ireland")):
+            totals.append((instance.create_emissions_dictionary, instance.create_emissions_table))
+
+        for create_dictionary, create_table in totals:
+            dictionary = create_dictionary(self.keys)
+            self.assertEqual(create_table(self.keys).to_dict(), dictionary)
+
+            # the inner dictionaries are independent
+            first, second = list(dictionary)[:2]
+            dictionary[first][2000] = 1
+            self.assertEqual(dictionary[second][2000], 0)
+
+    def test_no_duplicate_categories(self):
+        self.assertEqual(len(CLIMATE_CHANGE_CATEGORIES), len(set(CLIMATE_CHANGE_CATEGORIES)))
+        self.assertEqual(list(self.climatechange.create_emissions_dictionary([])), list(CLIMATE_CHANGE_CATEGORIES))
+
+    def test_vector_and_key_assignment(self):
+        table = self.climatechange.create_expanded_emissions_table(self.keys)
+
+        table["enteric_ch4"] = np.array([1.0, 2.0, 3.0])
+        table["soils_CO2"] = 0.5
+        table["N_direct_PRP"][2001] += 4.0
+        table["N_direct_PRP"][2001] += 1.0
+
+        self.assertEqual(table["enteric_ch4"][2002], 3.0)
+        self.assertEqual(list(table["soils_CO2"].values), [0.5, 0.5, 0.5])
+        self.assertEqual(dict(table["N_direct_PRP"].items()), {2000: 0.0, 2001: 5.0, 2002: 0.0})
+        self.assertEqual(table.to_frame().loc[2001, "N_direct_PRP"], 5.0)
+
+        with self.assertRaises(KeyError):
+            table["not_a_category"]
+
+        with self.assertRaises(KeyError):
+            table["enteric_ch4"][9999]
+
+    def test_duplicate_keys(self):
+        table = EmissionsTable(["soils"], ["a", "a"])
+        table["soils"] = [1.0, 2.0]
+
+        with self.assertRaises(ValueError):
+            table["soils"]["a"]
+
+    def test_result_writer(self):
+        climate = self.climatechange.create_expanded_emissions_table(self.keys)
+        climate["enteric_ch4"] = [1.0, 2.0, 3.0]
+
+        eutrophication = EutrophicationTotals("ireland").create_expanded_emissions_dictionary(list(reversed(self.keys)))
+        eutrophication["soils"][2000] = 7.0
+
+        writer = ResultWriter()
+        writer.add_emissions({"climate_change_": climate, "eutrophication_": eutrophication})
+        frame = writer.to_frame()
+
+        self.assertEqual(list(frame.index), self.keys)
+        self.assertEqual(list(frame["climate_change_enteric_ch4"]), [1.0, 2.0, 3.0])
+        self.assertEqual(list(frame["eutrophication_soils"]), [7.0, 0.0, 0.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+import gc
+import unittest
+import weakref
+from sheep_lca.resource_manager.models import load_livestock_data
+from sheep_lca.lca import ClimateChangeTotals, EutrophicationTotals, AirQualityTotals
+from sheep_lca.evaluation_context import EvaluationContext
+from sheep_lca.resource_manager.sheep_lca_data_manager import LCADataManagerRegistry
+from vectorised_lca_test import create_livestock_data_frame
+
+
+class EvaluationContextTestCase(unittest.TestCase):
+    def setUp(self):
+        self.animals = load_livestock_data(create_livestock_data_frame(n_farms=4, seed=7))
+        self.context = EvaluationContext()
+
+    def totals(self, climatechange, eutrophication, air_quality, animals):
+        return [
+            climatechange.CH4_enteric_ch4(animals),
+            climatechange.CH4_manure_management(animals),
+            climatechange.Total_storage_N2O(animals),
+            climatechange.N2O_total_PRP_N2O_direct(animals),
+            eutrophication.total_manure_NH3_EP(animals),
+            eutrophication.total_grazing_soils_NH3_and_LEACH_EP(animals),
+            air_quality.total_manure_NH3_AQ(animals),
+            air_quality.total_grazing_soils_NH3_AQ(animals),
+        ]
+
+    def test_results_match_uncached(self):
+        cached = (
+            ClimateChangeTotals("ireland", self.context),
+            EutrophicationTotals("ireland", self.context),
+            AirQualityTotals("ireland", self.context),
+        )
+        uncached = (
+            ClimateChangeTotals("ireland"),
+            EutrophicationTotals("ireland"),
+            AirQualityTotals("ireland"),
+        )
+
+        for totals in cached:
+            self.assertIs(totals.context, self.context)
+
+        for collection in self.animals.values():
+            self.assertEqual(
+                self.totals(*cached, collection["animals"]),
+                self.totals(*uncached, collection["animals"]),
+            )
+
+        stats = self.context.stats()
+        self.assertGreater(stats["hits"], stats["misses"])
+        self.assertGreater(stats["animals"], 0)
+
+    def test_invalidate(self):
+        climatechange = ClimateChangeTotals("ireland", self.context)
+        animals = next(iter(self.animals.values()))["animals"]
+        animal = animals.ewes
+
+        before = climatechange.CH4_enteric_ch4(animals)
+        animal.weight += 10
+        self.assertEqual(climatechange.CH4_enteric_ch4(animals), before)
+
+        self.context.invalidate(animal)
+        after = climatechange.CH4_enteric_ch4(animals)
+        self.assertNotEqual(after, before)
+        self.assertEqual(after, ClimateChangeTotals("ireland").CH4_enteric_ch4(animals))
+
+    def test_clear(self):
+        climatechange = ClimateChangeTotals("ireland", self.context)
+        climatechange.CH4_enteric_ch4(next(iter(self.animals.values()))["animals"])
+
+        self.context.clear()
+        self.assertEqual(self.context.stats(), {"hits": 0, "misses": 0, "animals": 0})
+
+    def test_replaced_data_manager(self):
+        animals = next(iter(self.animals.values()))["animals"]
+        ClimateChangeTotals("ireland", self.context).CH4_enteric_ch4(animals)
+        first = self.context.stats()
+        cleared = weakref.ref(LCADataManagerRegistry.get_data_manager("ireland"))
+
+        # the cached terms keep the cleared manager alive, so its replacement cannot reuse its id and be given its terms
+        LCADataManagerRegistry.clear()
+        gc.collect()
+        self.assertIsNotNone(cleared())
+
+        climatechange = ClimateChangeTotals("ireland", self.context)
+        climatechange.CH4_enteric_ch4(animals)
+
+        self.assertIsNot(climatechange.data_manager_class, cleared())
+        self.assertEqual(self.context.stats(), {**first, "hits": 2 * first["hits"], "misses": 2 * first["misses"]})
+
+if __name__ == "__main__":
+    unittest.main()
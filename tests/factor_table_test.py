@@ -0,0 +1,59 @@
+import math
+import unittest
+from sheep_lca.resource_manager.sheep_lca_data_manager import LCADataManagerRegistry
+
+
+class FactorTableTestCase(unittest.TestCase):
+    def setUp(self):
+        self.data_manager = LCADataManagerRegistry.get_data_manager("ireland")
+        self.factor_table = self.data_manager.get_factor_table()
+
+    def test_matches_data_manager(self):
+        for cohort in self.data_manager.get_cohort_keys():
+            coefficient = self.data_manager.get_cohort_parameter(cohort, "coefficient")()
+            code = self.factor_table.cohort_codes[cohort]
+
+            self.assertEqual(self.factor_table.cohort[cohort]["coefficient"], coefficient)
+            self.assertEqual(
+                self.factor_table.cohort_factors[code, self.factor_table.parameter_codes["coefficient"]],
+                coefficient,
+            )
+
+        for storage, code in self.factor_table.storage_codes.items():
+            self.assertEqual(self.factor_table.storage_MCF[storage], self.data_manager.get_storage_MCF(storage)())
+            self.assertEqual(self.factor_table.storage_MCF_factors[code], self.data_manager.get_storage_MCF(storage)())
+
+        for grazing in self.factor_table.grazing_codes:
+            self.assertEqual(self.factor_table.grazing[grazing], self.data_manager.get_grazing_type(grazing)())
+
+        for spreading in self.factor_table.spreading_codes:
+            factor = self.data_manager.get_daily_spreading(spreading)()
+
+            code = self.factor_table.spreading_codes[spreading]
+
+            if factor is None:
+                self.assertTrue(math.isnan(self.factor_table.daily_spreading_factors[code]))
+
+                with self.assertRaises(ValueError):
+                    self.factor_table.daily_spreading[spreading]
+            else:
+                self.assertEqual(self.factor_table.daily_spreading[spreading], factor)
+
+    def test_pregnancy_and_lactation(self):
+        self.assertEqual(self.factor_table.cohort["ram"]["pregnancy"], 0)
+        self.assertEqual(self.factor_table.cohort["ewes"]["lactation"], 1)
+        self.assertEqual(self.factor_table.cohort["ram"]["lactation"], 0)
+
+    def test_read_only(self):
+        with self.assertRaises(ValueError):
+            self.factor_table.cohort_factors[0, 0] = 1.0
+
+        with self.assertRaises(ValueError):
+            self.factor_table.grazing_factors[0] = 1.0
+
+        with self.assertRaises(TypeError):
+            self.factor_table.cohort["ewes"]["coefficient"] = 1.0
+
+
+if __name__ == "__main__":
+    unittest.main()
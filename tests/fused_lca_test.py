@@ -0,0 +1,80 @@
+import unittest
+import numpy as np
+import pandas as pd
+from sheep_lca.batch_lca import FarmBatchEvaluator
+from sheep_lca.fused_lca import FusedFarmEvaluator
+from sheep_lca.resource_manager.country_store import MultiCountryStore
+from vectorised_lca_test import create_livestock_data_frame
+from batch_lca_test import create_farm_data_frame
+
+
+class FusedFarmEvaluatorTestCase(unittest.TestCase):
+    def setUp(self):
+        self.livestock_data_frame = create_livestock_data_frame(n_farms=8, seed=23)
+        farm_ids = list(self.livestock_data_frame["farm_id"].unique())
+
+        # one farm without farm data, one farm without livestock and a missing input
+        self.farm_data_frame = create_farm_data_frame(farm_ids[1:] + [9999], seed=4)
+        self.farm_data_frame.loc[0, "diesel_kg"] = np.nan
+
+    def assertFramesClose(self, actual, expected):
+        self.assertEqual(list(actual.columns), list(expected.columns))
+        self.assertEqual(list(actual.index), list(expected.index))
+
+        np.testing.assert_allclose(
+            actual.to_numpy(dtype=float), expected.to_numpy(dtype=float), rtol=1e-9, atol=1e-9
+        )
+
+    def test_matches_batch_evaluator(self):
+        expected = FarmBatchEvaluator("ireland").evaluate(self.livestock_data_frame, self.farm_data_frame)
+        results = FusedFarmEvaluator("ireland").evaluate(self.livestock_data_frame, self.farm_data_frame)
+
+        self.assertFramesClose(results, expected)
+
+    def test_without_farm_data(self):
+        expected = FarmBatchEvaluator("ireland").evaluate(self.livestock_data_frame)
+        results = FusedFarmEvaluator("ireland").evaluate(self.livestock_data_frame)
+
+        self.assertFramesClose(results, expected)
+
+    def test_shared_herd_table(self):
+        evaluator = FusedFarmEvaluator("ireland")
+        herd = evaluator.herd_table(self.livestock_data_frame)
+
+        farm_ids = list(herd.farm_ids)
+
+        results = evaluator.evaluate(herd, self.farm_data_frame)
+
+        self.assertIn(9999, list(results.index))
+        self.assertEqual(list(herd.farm_ids), farm_ids)
+        self.assertEqual(list(evaluator.evaluate(herd).index), farm_ids)
+        self.assertIn("net_excretion_HOUSED", herd.__dict__)
+        self.assertIn("ch4_emissions_factor", herd.__dict__)
+
+        # terms are only shared between tables of the same rows and factors
+        with self.assertRaises(ValueError):
+            herd.share_terms(herd.with_factors({"storage_TAN": herd.factors["storage_TAN"] * 2}))
+
+    def test_mixed_countries(self):
+        countries = np.where(self.livestock_data_frame["farm_id"] % 2 == 0, "ireland", "costa rica")
+        livestock = self.livestock_data_frame.assign(ef_country=countries)
+        farms = self.farm_data_frame.assign(
+            ef_country=np.where(self.farm_data_frame["farm_id"] % 2 == 0, "ireland", "costa rica")
+        )
+
+        results = FusedFarmEvaluator(store=MultiCountryStore()).evaluate(livestock, farms)
+
+        expected = pd.concat(
+            [
+                FarmBatchEvaluator(country).evaluate(
+                    livestock[livestock["ef_country"] == country], farms[farms["ef_country"] == country]
+                )
+                for country in ("ireland", "costa rica")
+            ]
+        ).loc[results.index]
+
+        self.assertFramesClose(results, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
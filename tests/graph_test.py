@@ -0,0 +1,133 @@
+import unittest
+import numpy as np
+from sheep_lca.graph import ComputationGraph, LCA_GRAPH, animal_inputs
+from sheep_lca.lca import Energy, GrassFeed, GrazingStage, HousingStage, StorageStage, DailySpread
+from sheep_lca.resource_manager.models import load_livestock_data
+from sheep_lca.resource_manager.sheep_lca_data_manager import LCADataManagerRegistry
+from sheep_lca.vectorised_lca import HerdTable, VectorisedClimateChangeTotals
+from vectorised_lca_test import create_livestock_data_frame
+
+
+class ComputationGraphTestCase(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+        self.graph = ComputationGraph()
+
+        def counted(name, formula):
+            def node(*args):
+                self.calls.append(name)
+                return formula(*args)
+
+            return node
+
+        self.graph.add("double", ["x"], counted("double", lambda x: 2 * x))
+        self.graph.add("square", ["x"], counted("square", lambda x: x * x))
+        self.graph.add("total", ["double", "square"], counted("total", lambda a, b: a + b))
+        self.graph.add("scaled", ["total", "double", "k"], counted("scaled", lambda t, d, k: (t + d) * k))
+
+    def test_each_node_once(self):
+        results = self.graph.evaluate(["scaled", "total"], {"x": 3, "k": 2})
+
+        self.assertEqual(results, {"scaled": 42, "total": 15})
+        self.assertEqual(sorted(self.calls), ["double", "scaled", "square", "total"])
+
+    def test_selective(self):
+        self.assertEqual(self.graph.plan(["double"]), ["double"])
+        self.assertEqual(self.graph.evaluate(["double"], {"x": np.arange(3)})["double"].tolist(), [0, 2, 4])
+        self.assertEqual(self.calls, ["double"])
+
+    def test_known_nodes_are_not_computed(self):
+        self.assertEqual(self.graph.evaluate(["scaled"], {"total": 1, "double": 1, "k": 3}), {"scaled": 6})
+        self.assertEqual(self.calls, ["scaled"])
+
+    def test_topological_order(self):
+        order = self.graph.plan(["scaled"])
+
+        for name in order:
+            for input_name in self.graph[name].inputs:
+                if input_name in self.graph:
+                    self.assertLess(order.index(input_name), order.index(name))
+
+    def test_errors(self):
+        with self.assertRaises(KeyError):
+            self.graph.evaluate(["scaled"], {"x": 1})
+
+        with self.assertRaises(KeyError):
+            self.graph.plan(["unknown"])
+
+        with self.assertRaises(ValueError):
+            self.graph.add("double", ["x"], abs)
+
+        cyclic = ComputationGraph()
+        cyclic.add("a", ["b"], abs)
+        cyclic.add("b", ["a"], abs)
+
+        with self.assertRaises(ValueError):
+            cyclic.plan(["a"])
+
+    def test_dependents(self):
+        self.assertEqual(self.graph.dependents(["k"]), {"scaled"})
+        self.assertEqual(self.graph.dependents(["square"]), {"total", "scaled"})
+
+
+class LCAGraphTestCase(unittest.TestCase):
+    def setUp(self):
+        self.data_frame = create_livestock_data_frame(n_farms=3, seed=21)
+        self.data_manager = LCADataManagerRegistry.get_data_manager("ireland")
+
+    def test_scalar_evaluation_matches_stage_classes(self):
+        stages = [
+            Energy("ireland"),
+            GrassFeed("ireland"),
+            GrazingStage("ireland"),
+            HousingStage("ireland"),
+            StorageStage("ireland"),
+            DailySpread("ireland"),
+        ]
+
+        # every node has a stage method of the same name
+        expected = {}
+
+        for name in LCA_GRAPH.nodes:
+            methods = [getattr(stage, name) for stage in stages if hasattr(stage, name)]
+            self.assertTrue(methods, msg=name)
+            expected[name] = methods[0]
+
+        for collection in load_livestock_data(self.data_frame).values():
+            for animal in collection["animals"].__dict__.values():
+                results = LCA_GRAPH.evaluate(expected, animal_inputs(animal, self.data_manager))
+
+                for name, method in expected.items():
+                    self.assertAlmostEqual(results[name], method(animal), places=9, msg=name)
+
+    def test_missing_factor_is_read_lazily(self):
+        animal = next(iter(load_livestock_data(self.data_frame.assign(daily_spreading="none")).values()))["animals"]
+        animal = next(iter(animal.__dict__.values()))
+        inputs = animal_inputs(animal, self.data_manager)
+
+        LCA_GRAPH.evaluate(["total_ammonia_nitrogen_nh4_SPREAD"], inputs)
+
+        with self.assertRaises(ValueError):
+            LCA_GRAPH.evaluate(["nh3_emissions_per_year_SPREAD"], inputs)
+
+    def test_array_evaluation_matches_herd_table(self):
+        herd = VectorisedClimateChangeTotals("ireland").herd_table(self.data_frame)
+        values = {name: getattr(herd, name) for name in HerdTable.numeric_columns}
+        values.update(herd.factors)
+
+        results = LCA_GRAPH.evaluate(LCA_GRAPH.nodes, values)
+
+        for name in LCA_GRAPH.nodes:
+            np.testing.assert_allclose(results[name], getattr(herd, name), err_msg=name)
+
+    def test_spread_needs_storage_chain_only(self):
+        plan = LCA_GRAPH.plan(["net_excretion_SPREAD"])
+
+        self.assertIn("net_excretion_HOUSED", plan)
+        self.assertIn("gross_energy_from_grass", plan)
+        self.assertNotIn("net_excretion_GRAZING", plan)
+        self.assertNotIn("CH4_STORAGE", plan)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+import subprocess
+import sys
+import unittest
+
+
+class DeferredImportTestCase(unittest.TestCase):
+    def imported_modules(self, statement):
+        script = (
+            "import sys\n"
+            f"{statement}\n"
+            "print(' '.join(name for name in ('sqlalchemy', 'pandas', 'numpy') if name in sys.modules))\n"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, text=True, check=True
+        )
+
+        return output.stdout.split()
+
+    def test_lca_import(self):
+        self.assertEqual(self.imported_modules("import sheep_lca.lca"), [])
+
+    def test_data_access_import(self):
+        self.assertEqual(
+            self.imported_modules(
+                "import sheep_lca.resource_manager.database_manager\n"
+                "import sheep_lca.resource_manager.models"
+            ),
+            [],
+        )
+
+    def test_database_read_imports(self):
+        self.assertIn(
+            "sqlalchemy",
+            self.imported_modules(
+                "from sheep_lca.resource_manager.database_manager import DataManager\n"
+                "DataManager('ireland').grass_data()"
+            ),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+import json
+import os
+import tempfile
+import unittest
+from sheep_lca.instrumentation import Instrumentation
+from sheep_lca.lca import ClimateChangeTotals, Energy
+from sheep_lca.batch_lca import FarmBatchEvaluator
+from sheep_lca.resource_manager.models import load_livestock_data
+from vectorised_lca_test import create_livestock_data_frame
+
+
+class InstrumentationTestCase(unittest.TestCase):
+    def setUp(self):
+        self.data_frame = create_livestock_data_frame(n_farms=3, seed=41)
+        self.animals = load_livestock_data(self.data_frame)
+        self.climatechange = ClimateChangeTotals("ireland")
+
+    def enteric(self):
+        return [self.climatechange.CH4_enteric_ch4(farm["animals"]) for farm in self.animals.values()]
+
+    def test_counts_and_times(self):
+        with Instrumentation() as profile:
+            results = self.enteric()
+
+        records = profile.to_dict()
+        enteric = records["ClimateChangeTotals.CH4_enteric_ch4"]
+
+        self.assertEqual(results, self.enteric())
+        self.assertEqual(enteric["calls"], len(self.animals))
+        self.assertGreater(records["Energy.gross_energy_from_grass"]["calls"], 0)
+        self.assertNotIn("HousingStage.VS_HOUSED", records)
+
+        for record in records.values():
+            self.assertLessEqual(record["self_time"], record["total_time"] + 1e-9)
+
+        # self times partition the time spent in the instrumented classes
+        self_time = sum(record["self_time"] for record in records.values())
+        self.assertAlmostEqual(self_time, enteric["total_time"], delta=1e-3)
+
+        stages = profile.stage_totals()
+        self.assertEqual(
+            stages["Energy"]["calls"],
+            sum(record["calls"] for key, record in records.items() if key.startswith("Energy.")),
+        )
+
+    def test_disabled_methods_are_original(self):
+        original = vars(Energy)["net_energy_for_maintenance"]
+
+        with Instrumentation():
+            self.assertIsNot(vars(Energy)["net_energy_for_maintenance"], original)
+
+        self.assertIs(vars(Energy)["net_energy_for_maintenance"], original)
+
+    def test_single_active(self):
+        with Instrumentation():
+            with self.assertRaises(RuntimeError):
+                Instrumentation().enable()
+
+    def test_accumulates_and_resets(self):
+        profile = Instrumentation()
+
+        for _ in range(2):
+            with profile:
+                self.enteric()
+
+        self.assertEqual(profile.to_dict()["ClimateChangeTotals.CH4_enteric_ch4"]["calls"], 2 * len(self.animals))
+
+        profile.reset()
+        self.assertEqual(profile.to_dict(), {})
+
+    def test_dataframe(self):
+        with Instrumentation() as profile:
+            FarmBatchEvaluator("ireland").evaluate(self.data_frame)
+
+        frame = profile.to_dataframe(n_farms=len(self.animals))
+
+        self.assertEqual(frame.index.names, ["stage", "method"])
+        self.assertEqual(
+            list(frame.columns), ["calls", "total_time", "self_time", "time_per_call", "calls_per_farm"]
+        )
+        self.assertEqual(frame.loc[("ClimateChangeTotals", "CH4_enteric_ch4"), "calls_per_farm"], 1)
+        self.assertTrue(frame["self_time"].is_monotonic_decreasing)
+
+    def test_chrome_trace(self):
+        with Instrumentation(trace=True) as profile:
+            self.enteric()
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "trace.json")
+            profile.write_chrome_trace(path)
+
+            with open(path) as file:
+                events = json.load(file)["traceEvents"]
+
+        calls = sum(record["calls"] for record in profile.to_dict().values())
+        self.assertEqual(len(events), calls)
+        self.assertEqual({event["ph"] for event in events}, {"X"})
+
+        with self.assertRaises(ValueError):
+            Instrumentation().write_chrome_trace(path)
+
+
+if __name__ == "__main__":
+    unittest.main()
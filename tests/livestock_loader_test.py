@@ -0,0 +1,92 @@
+import pickle
+import unittest
+import pandas as pd
+from sheep_lca.resource_manager.models import (
+    load_livestock_data,
+    load_farm_data,
+    AnimalCategory,
+    LivestockData,
+    FarmData,
+)
+from vectorised_lca_test import create_livestock_data_frame
+from batch_lca_test import create_farm_data_frame
+
+
+class LivestockLoaderTestCase(unittest.TestCase):
+    def setUp(self):
+        data_frame = create_livestock_data_frame(n_farms=6)
+        # interleave the farms and repeat a cohort, the last row should win
+        self.data_frame = pd.concat(
+            [data_frame.sample(frac=1, random_state=3), data_frame.iloc[[4]].assign(pop=11.0)],
+            ignore_index=True,
+        )
+        self.farm_data_frame = create_farm_data_frame(data_frame["farm_id"].unique())
+
+    def assert_same_collections(self, expected, actual):
+        self.assertEqual(list(expected.keys()), list(actual.keys()))
+
+        for farm_id in expected:
+            expected_animals = expected[farm_id]["animals"]
+            actual_animals = actual[farm_id]["animals"]
+
+            self.assertEqual(list(vars(expected_animals)), list(vars(actual_animals)))
+
+            for cohort in vars(expected_animals):
+                self.assertEqual(
+                    getattr(expected_animals, cohort).to_dict(),
+                    getattr(actual_animals, cohort).to_dict(),
+                )
+
+    def test_grouping(self):
+        animals = load_livestock_data(self.data_frame)
+
+        self.assertEqual(list(animals.keys()), list(self.data_frame["farm_id"].unique()))
+        farm_id = self.data_frame["farm_id"].iloc[-1]
+        cohort = self.data_frame["cohort"].iloc[-1]
+        self.assertEqual(getattr(animals[farm_id]["animals"], cohort).pop, 11.0)
+
+    def test_lazy_matches_eager(self):
+        lazy = load_livestock_data(self.data_frame, lazy=True)
+
+        self.assertIsInstance(lazy, LivestockData)
+        self.assertEqual(len(lazy), 6)
+        self.assert_same_collections(load_livestock_data(self.data_frame), lazy)
+
+    def test_lazy_farm_data(self):
+        farms = load_farm_data(self.farm_data_frame)
+        lazy = load_farm_data(self.farm_data_frame, lazy=True)
+
+        self.assertIsInstance(lazy, FarmData)
+        self.assertEqual(list(farms.keys()), list(lazy.keys()))
+
+        for index, farm in farms.items():
+            self.assertEqual(farm.to_dict(), lazy[index].to_dict())
+
+        with self.assertRaises(KeyError):
+            lazy[len(farms)]
+
+    def test_slotted_records(self):
+        category = AnimalCategory({"cohort": "ewes", "pop": 5, "breed": "suffolk"})
+
+        self.assertFalse(hasattr(category, "__dict__"))
+        self.assertEqual(category.forage, "average")
+        self.assertEqual(category.extras, {"breed": "suffolk"})
+        self.assertEqual(category.to_dict()["pop"], 5)
+        self.assertEqual(category.to_dict()["breed"], "suffolk")
+        self.assertEqual(category.breed, "suffolk")
+        self.assertEqual(pickle.loads(pickle.dumps(category)).to_dict(), category.to_dict())
+
+        # columns outside the schema are not set as attributes
+        with self.assertRaises(AttributeError):
+            category.breed = "texel"
+
+        farm = load_farm_data(self.farm_data_frame)[0]
+        self.assertFalse(hasattr(farm, "__dict__"))
+        self.assertEqual(farm.extras, {})
+
+        with self.assertRaises(AttributeError):
+            farm.unknown_column
+
+
+if __name__ == "__main__":
+    unittest.main()
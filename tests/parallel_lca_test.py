@@ -0,0 +1,32 @@
+import unittest
+import pandas as pd
+from sheep_lca.batch_lca import FarmBatchEvaluator
+from sheep_lca.parallel_lca import ParallelFarmEvaluator
+from vectorised_lca_test import create_livestock_data_frame
+from batch_lca_test import create_farm_data_frame
+
+
+class ParallelFarmEvaluatorTestCase(unittest.TestCase):
+    def setUp(self):
+        self.livestock_data_frame = create_livestock_data_frame(n_farms=9)
+        self.farm_data_frame = create_farm_data_frame(
+            self.livestock_data_frame["farm_id"].unique()
+        )
+
+    def test_matches_batch_evaluator(self):
+        expected = FarmBatchEvaluator("ireland").evaluate(
+            self.livestock_data_frame, self.farm_data_frame
+        )
+        results = ParallelFarmEvaluator("ireland", max_workers=2, chunk_size=2).evaluate(
+            self.livestock_data_frame, self.farm_data_frame
+        )
+
+        pd.testing.assert_frame_equal(results, expected)
+
+    def test_invalid_chunk_size(self):
+        with self.assertRaises(ValueError):
+            ParallelFarmEvaluator("ireland", chunk_size=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
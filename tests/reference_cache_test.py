@@ -0,0 +1,72 @@
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from sheep_lca.resource_manager.data_loader import Loader
+from sheep_lca.resource_manager.reference_cache import ReferenceDataCache, CACHE_DIR_VARIABLE
+
+
+class ReferenceDataCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+
+    def test_warm_start(self):
+        cold = Loader("costa rica", cache_dir=self.cache_dir)
+        cache = ReferenceDataCache(self.cache_dir)
+
+        self.assertTrue(os.path.exists(cache.path("costa rica")))
+
+        warm = Loader("costa rica", cache_dir=self.cache_dir)
+
+        self.assertIsNone(warm._dataframes)
+        self.assertTrue(warm.grass.is_loaded())
+        # repr is used so that missing values (NaN) compare equal
+        self.assertEqual(repr(warm.grass.grasses), repr(cold.grass.grasses))
+        self.assertEqual(repr(warm.concentrates.concentrates), repr(cold.concentrates.concentrates))
+        self.assertEqual(repr(warm.upstream.upstream), repr(cold.upstream.upstream))
+        self.assertEqual(repr(warm.emissions_factors.emissions_factors), repr(cold.emissions_factors.emissions_factors))
+        self.assertEqual(repr(warm.animal_features.animal_features), repr(cold.animal_features.animal_features))
+
+    def test_stale_and_corrupt_entries(self):
+        cache = ReferenceDataCache(self.cache_dir)
+        cache.store("ireland", {"grass": {}})
+        self.assertEqual(cache.load("ireland"), {"grass": {}})
+
+        other_database = ReferenceDataCache(self.cache_dir, database_path=__file__)
+        self.assertIsNone(other_database.load("ireland"))
+
+        with open(cache.path("ireland"), "wb") as cache_file:
+            cache_file.write(b"not a pickle")
+
+        self.assertIsNone(cache.load("ireland"))
+
+        Loader("ireland", cache_dir=self.cache_dir)
+        self.assertIsNotNone(cache.load("ireland"))
+
+    def test_warm_start_skips_sqlalchemy_and_pandas(self):
+        Loader("ireland", cache_dir=self.cache_dir)
+
+        script = (
+            "import sys\n"
+            "from sheep_lca.lca import ClimateChangeTotals\n"
+            "ClimateChangeTotals('ireland')\n"
+            "print('sqlalchemy' in sys.modules, 'pandas' in sys.modules)\n"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", script],
+            env=dict(os.environ, **{CACHE_DIR_VARIABLE: self.cache_dir}),
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        self.assertEqual(output.stdout.split(), ["False", "False"])
+
+
+if __name__ == "__main__":
+    unittest.main()
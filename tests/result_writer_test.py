@@ -0,0 +1,137 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+import pandas as pd
+from pandas.testing import assert_frame_equal
+from sheep_lca.fused_lca import FusedFarmEvaluator, result_columns
+from sheep_lca.lca import ClimateChangeTotals
+from sheep_lca.resource_manager.result_writer import ResultWriter
+from vectorised_lca_test import create_livestock_data_frame
+from batch_lca_test import create_farm_data_frame
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+
+class ResultWriterTestCase(unittest.TestCase):
+    def setUp(self):
+        livestock = create_livestock_data_frame(n_farms=9, seed=71)
+        farms = create_farm_data_frame(livestock["farm_id"].unique(), seed=71)
+
+        self.evaluator = FusedFarmEvaluator("ireland")
+        self.livestock = livestock
+        self.results = self.evaluator.evaluate(livestock, farms)
+
+    def test_frame(self):
+        writer = ResultWriter(batch_size=4)
+        writer.add_frame(self.results)
+
+        self.assertEqual(writer.rows_written, 8)
+        assert_frame_equal(writer.to_frame(), self.results, check_index_type=False)
+
+    def test_records(self):
+        writer = ResultWriter(batch_size=5)
+        writer.add_records(self.evaluator.evaluate_stream([self.livestock]))
+
+        assert_frame_equal(writer.to_frame(), self.evaluator.evaluate(self.livestock), check_index_type=False)
+
+    def test_add_defaults_to_zero(self):
+        writer = ResultWriter(columns=["a", "b"], index_name="scenario")
+        writer.add("baseline", {"a": 1.5})
+        writer.add_columns(["x", "y"], {"b": np.array([2.0, 3.0]), "a": 1.0})
+
+        with self.assertRaises(KeyError):
+            writer.add("z", {"a": 4.0, "c": 1.0})
+
+        expected = pd.DataFrame(
+            {"a": [1.5, 1.0, 1.0], "b": [0.0, 2.0, 3.0]}, index=pd.Index(["baseline", "x", "y"], name="scenario")
+        )
+        assert_frame_equal(writer.to_frame(), expected)
+
+    def test_emissions_dictionaries(self):
+        climate = ClimateChangeTotals("ireland").create_expanded_emissions_dictionary([2000, 2001])
+        climate["enteric_ch4"][2001] = 12.5
+        climate["soils_CO2"][2000] = 3.0
+
+        writer = ResultWriter()
+        writer.add_emissions({"climate_change_": climate})
+        frame = writer.to_frame()
+
+        self.assertEqual(list(frame.columns), result_columns())
+        self.assertEqual(frame.loc[2001, "climate_change_enteric_ch4"], 12.5)
+        self.assertEqual(frame.loc[2000, "climate_change_soils_CO2"], 3.0)
+        self.assertEqual(frame.loc[2000, "eutrophication_soils"], 0)
+
+    def test_closed(self):
+        writer = ResultWriter(columns=["a"])
+        writer.close()
+
+        with self.assertRaises(ValueError):
+            writer.add(1, {"a": 1.0})
+
+
+@unittest.skipIf(pyarrow is None, "pyarrow is not installed")
+class ResultFileTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        livestock = create_livestock_data_frame(n_farms=9, seed=72)
+        self.results = FusedFarmEvaluator("ireland").evaluate(livestock)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def path(self, name):
+        return os.path.join(self.directory.name, name)
+
+    def read(self, table):
+        return table.to_pandas().set_index("farm_id")
+
+    def test_parquet_row_groups(self):
+        path = self.path("results.parquet")
+
+        with ResultWriter(path, batch_size=3) as writer:
+            writer.add_frame(self.results)
+
+        self.assertEqual(pyarrow.parquet.ParquetFile(path).num_row_groups, 3)
+        assert_frame_equal(self.read(pyarrow.parquet.read_table(path)), self.results)
+
+    def test_ipc(self):
+        path = self.path("results.arrow")
+
+        with ResultWriter(path, batch_size=4) as writer:
+            writer.add_frame(self.results)
+
+        with pyarrow.ipc.open_file(path) as reader:
+            self.assertEqual(reader.num_record_batches, 3)
+            assert_frame_equal(self.read(reader.read_all()), self.results)
+
+    def test_append(self):
+        path = self.path("results")
+        os.makedirs(path)
+
+        # a file that matches the part pattern without a number is neither counted nor read
+        with open(os.path.join(path, "part-notes.parquet"), "w") as file:
+            file.write("not a part")
+
+        for part in (self.results.iloc[:5], self.results.iloc[5:]):
+            with ResultWriter(path, append=True) as writer:
+                writer.add_frame(part)
+
+        self.assertEqual(
+            sorted(os.listdir(path)), ["part-00000.parquet", "part-00001.parquet", "part-notes.parquet"]
+        )
+        parts = [os.path.join(path, name) for name in ("part-00000.parquet", "part-00001.parquet")]
+        assert_frame_equal(self.read(pyarrow.parquet.read_table(parts)), self.results)
+
+        with self.assertRaises(ValueError):
+            with ResultWriter(path, columns=["a"], append=True) as writer:
+                writer.add(1, {"a": 1.0})
+
+
+if __name__ == "__main__":
+    unittest.main()
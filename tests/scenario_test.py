@@ -0,0 +1,114 @@
+import unittest
+import numpy as np
+from functools import cached_property
+from sheep_lca.scenario import ScenarioSweep
+from sheep_lca.vectorised_lca import HerdTable
+from vectorised_lca_test import create_livestock_data_frame
+
+
+class HerdTableAttributesTestCase(unittest.TestCase):
+    def setUp(self):
+        self.data_frame = create_livestock_data_frame(n_farms=8, seed=11)
+        self.sweep = ScenarioSweep("ireland")
+        self.herd = self.sweep.herd_table(self.data_frame)
+
+        for term in HerdTable.term_inputs:
+            getattr(self.herd, term)
+
+    def assert_matches_rebuild(self, changes, data_frame):
+        changed = self.herd.with_attributes(changes)
+        rebuilt = self.sweep.herd_table(data_frame)
+
+        for name, category in self.sweep.categories.items():
+            np.testing.assert_allclose(category(changed), category(rebuilt), err_msg=name)
+
+    def test_term_inputs_cover_every_cached_term(self):
+        cached = {name for name, attribute in vars(HerdTable).items() if isinstance(attribute, cached_property)}
+
+        self.assertEqual(set(HerdTable.term_inputs), cached)
+
+    def test_numeric_change_matches_rebuild(self):
+        self.assert_matches_rebuild(
+            {"con_amount": lambda current: current * 1.5},
+            self.data_frame.assign(con_amount=self.data_frame["con_amount"] * 1.5),
+        )
+
+    def test_categorical_change_matches_rebuild(self):
+        self.assert_matches_rebuild({"mm_storage": "solid"}, self.data_frame.assign(mm_storage="solid"))
+        self.assert_matches_rebuild({"forage": "average"}, self.data_frame.assign(forage="average"))
+
+    def test_cohort_change_matches_rebuild(self):
+        ewes = self.data_frame["cohort"] == "ewes"
+        data_frame = self.data_frame.copy()
+        data_frame.loc[ewes, "t_outdoors"] = 24
+        data_frame.loc[ewes, "t_indoors"] = 0
+
+        self.assert_matches_rebuild({("t_outdoors", "ewes"): 24, ("t_indoors", "ewes"): 0}, data_frame)
+
+    def test_unchanged_terms_are_shared(self):
+        changed = self.herd.with_attributes({"con_amount": 0.5})
+
+        for term in ("net_energy_for_maintenance", "net_energy_for_activity", "percent_outdoors"):
+            self.assertIs(changed.__dict__[term], self.herd.__dict__[term])
+
+        self.assertNotIn("gross_energy_from_concentrate", changed.__dict__)
+        self.assertNotIn("CH4_STORAGE", changed.__dict__)
+
+    def test_baseline_is_unchanged(self):
+        con_amount, mm_storage = self.herd.con_amount.copy(), self.herd.mm_storage.copy()
+        storage_TAN = self.herd.factors["storage_TAN"]
+        self.herd.with_attributes({"con_amount": 2.0, "mm_storage": "solid"})
+
+        np.testing.assert_array_equal(self.herd.con_amount, con_amount)
+        np.testing.assert_array_equal(self.herd.mm_storage, mm_storage)
+        self.assertIs(self.herd.factors["storage_TAN"], storage_TAN)
+
+    def test_unknown_attribute(self):
+        with self.assertRaises(KeyError):
+            self.herd.with_attributes({"cohort": "ewes"})
+
+
+class ScenarioSweepTestCase(unittest.TestCase):
+    def setUp(self):
+        self.data_frame = create_livestock_data_frame(n_farms=5, seed=12)
+        self.sweep = ScenarioSweep("ireland")
+
+    def test_matrix(self):
+        scenarios = {
+            "more_concentrate": {"con_amount": lambda current: current + 0.2},
+            "housed": {"t_outdoors": 0, "t_indoors": 24},
+        }
+        results = self.sweep.run(self.data_frame, scenarios)
+
+        self.assertEqual(list(results.index), ["baseline", "more_concentrate", "housed"])
+        self.assertEqual(list(results.columns), list(self.sweep.categories))
+
+        herd = self.sweep.herd_table(self.data_frame)
+        expected = self.sweep.categories["CH4_enteric_ch4"](herd).sum()
+        self.assertAlmostEqual(results.loc["baseline", "CH4_enteric_ch4"], expected)
+        self.assertEqual(results.loc["housed", "total_grazing_soils_NH3_AQ"], 0)
+        self.assertGreater(
+            results.loc["more_concentrate", "co2_from_concentrate_production"],
+            results.loc["baseline", "co2_from_concentrate_production"],
+        )
+
+    def test_by_farm(self):
+        results = self.sweep.run(
+            self.data_frame, [{"t_outdoors": 12}], categories=["total_manure_NH3_AQ"], by_farm=True
+        )
+        herd = self.sweep.herd_table(self.data_frame)
+
+        self.assertEqual(results.index.names, ["scenario", "farm_id"])
+        self.assertEqual(len(results), 2 * herd.n_farms)
+        np.testing.assert_allclose(
+            results.loc["baseline", "total_manure_NH3_AQ"].to_numpy(),
+            self.sweep.categories["total_manure_NH3_AQ"](herd),
+        )
+
+    def test_reserved_name(self):
+        with self.assertRaises(ValueError):
+            self.sweep.run(self.data_frame, {"baseline": {}})
+
+
+if __name__ == "__main__":
+    unittest.main()
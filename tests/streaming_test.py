@@ -0,0 +1,72 @@
+import unittest
+import pandas as pd
+from pandas.testing import assert_frame_equal
+from sheep_lca.fused_lca import FusedFarmEvaluator
+from sheep_lca.streaming import complete_farm_chunks
+from vectorised_lca_test import create_livestock_data_frame
+from batch_lca_test import create_farm_data_frame
+
+
+def split(data_frame, size):
+    return [data_frame.iloc[start:start + size] for start in range(0, len(data_frame), size)]
+
+
+class StreamingTestCase(unittest.TestCase):
+    def setUp(self):
+        self.livestock = create_livestock_data_frame(n_farms=12, seed=61)
+        self.farms = create_farm_data_frame(self.livestock["farm_id"].unique(), seed=61)
+        self.evaluator = FusedFarmEvaluator("ireland")
+
+    def test_chunks_hold_whole_farms(self):
+        for size in (1, 3, 7, len(self.livestock) + 1):
+            chunks = list(complete_farm_chunks(split(self.livestock, size)))
+
+            assert_frame_equal(pd.concat(chunks, ignore_index=True), self.livestock.reset_index(drop=True))
+
+            farm_ids = [set(chunk["farm_id"]) for chunk in chunks]
+            for index, first in enumerate(farm_ids):
+                for second in farm_ids[index + 1:]:
+                    self.assertFalse(first & second)
+
+    def test_empty_chunks(self):
+        chunks = [self.livestock.iloc[:0], self.livestock, self.livestock.iloc[:0]]
+
+        self.assertEqual(sum(len(chunk) for chunk in complete_farm_chunks(chunks)), len(self.livestock))
+        self.assertEqual(list(complete_farm_chunks([])), [])
+
+    def test_ungrouped(self):
+        shuffled = self.livestock.sample(frac=1, random_state=61)
+
+        with self.assertRaises(ValueError):
+            list(complete_farm_chunks(split(shuffled, 5)))
+
+        self.assertEqual(
+            sum(len(chunk) for chunk in complete_farm_chunks(split(shuffled, 5), check_grouped=False)), len(shuffled)
+        )
+
+    def test_records_match_evaluate(self):
+        expected = self.evaluator.evaluate(self.livestock, self.farms)
+        records = list(self.evaluator.evaluate_stream(split(self.livestock, 4), self.farms))
+
+        self.assertEqual(len(records), len(expected))
+        assert_frame_equal(pd.DataFrame.from_records(records, index="farm_id"), expected)
+
+    def test_frames(self):
+        expected = self.evaluator.evaluate(self.livestock)
+        frames = list(self.evaluator.evaluate_stream(split(self.livestock, 9), as_frames=True))
+
+        self.assertGreater(len(frames), 1)
+        assert_frame_equal(pd.concat(frames), expected)
+
+    def test_farms_without_livestock(self):
+        farms = pd.concat([self.farms, create_farm_data_frame([9001, 9002], seed=62)], ignore_index=True)
+        records = list(self.evaluator.evaluate_stream(split(self.livestock, 6), farms))
+
+        self.assertEqual([record["farm_id"] for record in records[-2:]], [9001, 9002])
+        assert_frame_equal(
+            pd.DataFrame.from_records(records, index="farm_id"), self.evaluator.evaluate(self.livestock, farms)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
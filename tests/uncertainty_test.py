@@ -0,0 +1,75 @@
+import unittest
+import numpy as np
+from sheep_lca.uncertainty import MonteCarloEngine, Normal, Uniform, Triangular, Lognormal
+from sheep_lca.vectorised_lca import VectorisedClimateChangeTotals, VectorisedAirQualityTotals
+from vectorised_lca_test import create_livestock_data_frame
+
+
+class MonteCarloEngineTestCase(unittest.TestCase):
+    def setUp(self):
+        self.data_frame = create_livestock_data_frame(n_farms=6, seed=31)
+        self.climatechange = VectorisedClimateChangeTotals("ireland")
+        self.herd = self.climatechange.herd_table(self.data_frame)
+
+    def test_degenerate_distribution_matches_point_estimate(self):
+        engine = MonteCarloEngine("ireland", n_samples=20, seed=1, chunk_size=7)
+        results = engine.run(self.herd, {"methane_conversion_factor": Uniform(1, 1)}, percentiles=(5, 95))
+
+        for category in ("CH4_enteric_ch4", "total_manure_NH3_AQ"):
+            expected = engine.categories[category](self.herd)
+            np.testing.assert_allclose(results.xs(category, level="category")[5].to_numpy(), expected)
+            np.testing.assert_allclose(results.xs(category, level="category")[95].to_numpy(), expected)
+
+    def test_shared_draws(self):
+        engine = MonteCarloEngine("ireland", n_samples=50, seed=2)
+        samples = engine.simulate(
+            self.herd, {"methane_conversion_factor": Normal(0.1)}, categories=["CH4_enteric_ch4"]
+        )["CH4_enteric_ch4"]
+
+        # enteric methane is linear in Ym, so every farm is scaled by the same draw
+        ratios = samples / self.climatechange.CH4_enteric_ch4(self.herd)
+
+        self.assertEqual(samples.shape, (50, self.herd.n_farms))
+        np.testing.assert_allclose(ratios, np.repeat(ratios[:, :1], self.herd.n_farms, axis=1))
+        self.assertGreater(ratios.std(), 0)
+
+    def test_cohort_specific_factor(self):
+        engine = MonteCarloEngine("ireland", n_samples=10, seed=3)
+        factors = engine._sample_factors(self.herd, {("direct_n2o", "ewes"): Lognormal(0.5)}, 10)
+
+        ewes = self.herd.cohort == "ewes"
+        self.assertTrue(np.all(factors["direct_n2o"][:, ~ewes] == self.herd.factors["direct_n2o"][~ewes]))
+        self.assertFalse(np.all(factors["direct_n2o"][:, ewes] == self.herd.factors["direct_n2o"][ewes]))
+
+    def test_seeded_runs_repeat(self):
+        distributions = {
+            "total_ammonia_nitrogen": Triangular(0.5, 1.0, 1.5),
+            "storage_TAN": Uniform(0.1, 0.3, relative=False),
+        }
+
+        first = MonteCarloEngine("ireland", n_samples=30, seed=4).run(self.data_frame, distributions)
+        second = MonteCarloEngine("ireland", n_samples=30, seed=4).run(self.data_frame, distributions)
+
+        self.assertTrue(first.equals(second))
+        self.assertEqual(list(first.columns), [2.5, 50, 97.5])
+
+    def test_sampled_herd_is_independent(self):
+        engine = MonteCarloEngine("ireland", n_samples=5, seed=5)
+        before = VectorisedAirQualityTotals("ireland").total_manure_NH3_AQ(self.herd)
+
+        engine.simulate(self.herd, {"storage_TAN": Normal(0.2)})
+
+        np.testing.assert_array_equal(VectorisedAirQualityTotals("ireland").total_manure_NH3_AQ(self.herd), before)
+
+    def test_unknown_factor(self):
+        engine = MonteCarloEngine("ireland", n_samples=5)
+
+        with self.assertRaises(KeyError):
+            engine.simulate(self.herd, {"not_a_factor": Normal(0.1)})
+
+        with self.assertRaises(ValueError):
+            MonteCarloEngine("ireland", n_samples=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
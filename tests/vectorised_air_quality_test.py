@@ -0,0 +1,54 @@
+import unittest
+import numpy as np
+from sheep_lca.resource_manager.models import load_livestock_data
+from sheep_lca.lca import AirQualityTotals
+from sheep_lca.vectorised_lca import VectorisedAirQualityTotals
+from vectorised_lca_test import create_livestock_data_frame
+
+
+class VectorisedAirQualityTestCase(unittest.TestCase):
+    def setUp(self):
+        self.data_frame = create_livestock_data_frame(n_farms=10, seed=17)
+
+        self.air_quality = AirQualityTotals("ireland")
+        self.vectorised = VectorisedAirQualityTotals("ireland")
+
+    def test_matches_scalar_totals(self):
+        rng = np.random.default_rng(2)
+        urea, urea_abated, n_fert = rng.uniform(0, 5000, size=(3, 10))
+
+        animals = load_livestock_data(self.data_frame)
+        results = self.vectorised.air_quality_totals(self.data_frame, urea, urea_abated, n_fert)
+
+        self.assertEqual(list(results.index), list(animals.keys()))
+
+        for farm, (farm_id, collection) in enumerate(animals.items()):
+            expected = {
+                "total_manure_NH3_AQ": self.air_quality.total_manure_NH3_AQ(collection["animals"]),
+                "total_grazing_soils_NH3_AQ": self.air_quality.total_grazing_soils_NH3_AQ(collection["animals"]),
+                "total_fertiliser_soils_NH3_AQ": self.air_quality.total_fertiliser_soils_NH3_AQ(
+                    urea[farm], urea_abated[farm], n_fert[farm]
+                ),
+            }
+
+            for method, value in expected.items():
+                self.assertAlmostEqual(results.loc[farm_id, method], value, delta=abs(value) * 1e-9, msg=method)
+
+    def test_cohort_arrays(self):
+        columns = {column: self.data_frame[column].to_numpy() for column in self.data_frame.columns}
+
+        np.testing.assert_allclose(
+            self.vectorised.total_manure_NH3_AQ(columns),
+            self.vectorised.total_manure_NH3_AQ(self.data_frame),
+        )
+
+    def test_only_nitrogen_terms(self):
+        herd = self.vectorised.herd_table(self.data_frame)
+        self.vectorised.air_quality_totals(herd)
+
+        self.assertNotIn("ch4_emissions_factor", herd.__dict__)
+        self.assertNotIn("CH4_STORAGE", herd.__dict__)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+import numpy as np
+from sheep_lca.resource_manager.models import load_livestock_data
+from sheep_lca.lca import EutrophicationTotals
+from sheep_lca.vectorised_lca import VectorisedEutrophicationTotals
+from vectorised_lca_test import create_livestock_data_frame
+
+
+class VectorisedEutrophicationTestCase(unittest.TestCase):
+    def setUp(self):
+        self.data_frame = create_livestock_data_frame(n_farms=10, seed=11)
+
+        self.eutrophication = EutrophicationTotals("ireland")
+        self.vectorised = VectorisedEutrophicationTotals("ireland")
+
+    def assertClose(self, actual, expected, msg=None):
+        self.assertAlmostEqual(actual, expected, delta=abs(expected) * 1e-9, msg=msg)
+
+    def test_matches_scalar_totals(self):
+        animals = load_livestock_data(self.data_frame)
+        results = self.vectorised.eutrophication_totals(self.data_frame)
+
+        self.assertEqual(list(results.index), list(animals.keys()))
+
+        for farm_id, collection in animals.items():
+            for method in results.columns:
+                self.assertClose(
+                    results.loc[farm_id, method],
+                    getattr(self.eutrophication, method)(collection["animals"]),
+                    msg=method,
+                )
+
+    def test_fertiliser_matches_scalar(self):
+        herd = self.vectorised.herd_table(self.data_frame)
+        rng = np.random.default_rng(5)
+        urea, urea_abated, n_fert, p_fert = rng.uniform(0, 5000, size=(4, herd.n_farms))
+
+        results = self.vectorised.total_fertilser_soils_EP(herd, urea, urea_abated, n_fert, p_fert)
+
+        for farm in range(herd.n_farms):
+            self.assertClose(
+                results[farm],
+                self.eutrophication.total_fertilser_soils_EP(
+                    urea[farm], urea_abated[farm], n_fert[farm], p_fert[farm]
+                ),
+            )
+
+    def test_shared_excretion_terms(self):
+        herd = self.vectorised.herd_table(self.data_frame)
+
+        self.vectorised.total_manure_NH3_EP(herd)
+        self.vectorised.total_grazing_soils_EP(herd)
+
+        self.assertIn("net_excretion_GRAZING", herd.__dict__)
+        self.assertIn("net_excretion_HOUSED", herd.__dict__)
+        net_excretion = herd.net_excretion_GRAZING
+
+        self.vectorised.eutrophication_totals(herd)
+        self.assertIs(herd.net_excretion_GRAZING, net_excretion)
+
+
+if __name__ == "__main__":
+    unittest.main()
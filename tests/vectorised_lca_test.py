@@ -0,0 +1,92 @@
+import unittest
+import numpy as np
+import pandas as pd
+from sheep_lca.resource_manager.models import load_livestock_data
+from sheep_lca.lca import ClimateChangeTotals
+from sheep_lca.vectorised_lca import VectorisedClimateChangeTotals
+
+
+def create_livestock_data_frame(n_farms=12, seed=42):
+    rng = np.random.default_rng(seed)
+    cohorts = ["ewes", "ram", "lamb_more_1_yr", "lamb_less_1_yr", "male_less_1_yr"]
+    rows = []
+
+    for farm_id in range(n_farms):
+        for cohort in cohorts:
+            t_outdoors = rng.uniform(10, 24)
+            rows.append(
+                {
+                    "ef_country": "ireland",
+                    "farm_id": 2000 + farm_id,
+                    "year": 2020,
+                    "cohort": cohort,
+                    "pop": 0.0 if rng.random() < 0.1 else rng.uniform(1, 500),
+                    "weight": rng.uniform(30, 90),
+                    "daily_milk": 0,
+                    "forage": rng.choice(["average", "irish_grass"]),
+                    "grazing": rng.choice(["flat_pasture", "hilly_pasture"]),
+                    "con_type": rng.choice(["concentrate", "Soybean", "Hay"]),
+                    "con_amount": rng.uniform(0, 1),
+                    "t_outdoors": t_outdoors,
+                    "t_indoors": 24 - t_outdoors,
+                    "wool": rng.uniform(0, 6),
+                    "t_stabled": 0,
+                    "mm_storage": rng.choice(["solid", "tank liquid", "biodigester"]),
+                    "daily_spreading": "broadcast",
+                    "n_sold": 0,
+                    "n_bought": 0,
+                }
+            )
+
+    return pd.DataFrame(rows)
+
+
+class VectorisedClimateChangeTestCase(unittest.TestCase):
+    def setUp(self):
+        self.data_frame = create_livestock_data_frame()
+        # repeat a cohort on one farm, the last row should win as in load_livestock_data
+        self.data_frame = pd.concat([self.data_frame, self.data_frame.iloc[[0]].assign(pop=7.0)], ignore_index=True)
+
+        self.climatechange = ClimateChangeTotals("ireland")
+        self.vectorised = VectorisedClimateChangeTotals("ireland")
+
+    def test_matches_scalar_totals(self):
+        animals = load_livestock_data(self.data_frame)
+        results = self.vectorised.climate_totals(self.data_frame)
+
+        self.assertEqual(list(results.index), list(animals.keys()))
+
+        for farm_id, collection in animals.items():
+            for method in results.columns:
+                expected = getattr(self.climatechange, method)(collection["animals"])
+
+                self.assertAlmostEqual(
+                    results.loc[farm_id, method], expected, delta=abs(expected) * 1e-9, msg=method
+                )
+
+    def test_single_herd_table(self):
+        herd = self.vectorised.herd_table(self.data_frame)
+
+        self.assertEqual(herd.n_farms, 12)
+        self.assertTrue(np.all(herd.pop != 0))
+        np.testing.assert_allclose(
+            self.vectorised.CH4_enteric_ch4(herd),
+            self.vectorised.climate_totals(herd)["CH4_enteric_ch4"].to_numpy(),
+        )
+
+    def test_missing_factor(self):
+        # the database has no daily spreading factor for "none", so only the terms that need it fail
+        data_frame = self.data_frame.assign(daily_spreading="none")
+        herd = self.vectorised.herd_table(data_frame)
+
+        self.assertTrue(np.isnan(herd.factors["daily_spreading_factor"]).all())
+        np.testing.assert_allclose(
+            self.vectorised.climate_totals(herd).to_numpy(), self.vectorised.climate_totals(self.data_frame).to_numpy()
+        )
+
+        with self.assertRaisesRegex(ValueError, "daily_spreading_factor"):
+            herd.nh3_emissions_per_year_SPREAD
+
+
+if __name__ == "__main__":
+    unittest.main()